@@ -0,0 +1 @@
+from .engine import BattleEngine, BattleResult, Combatant, resolve, CHALLENGER, OPPONENT, DRAW
@@ -0,0 +1,207 @@
+import math
+import re
+
+import numpy as np
+
+ENERGY_TYPES = (
+    "Colorless", "Darkness", "Dragon", "Fairy", "Fighting", "Fire",
+    "Grass", "Lightning", "Metal", "Psychic", "Water",
+)
+TYPE_BITS = {energy: 1 << bit for bit, energy in enumerate(ENERGY_TYPES)}
+
+DEFAULT_HP = 50
+STRUGGLE_DAMAGE = 10  # ✅ Used by Pokémon whose attacks deal no printed damage
+
+CHALLENGER, OPPONENT, DRAW = 0, 1, -1
+
+_NUMBER = re.compile(r"\d+")
+
+
+def _number(text, default=0):
+    match = _NUMBER.search(text or "")
+    return int(match.group()) if match else default
+
+
+def _type_mask(types):
+    mask = 0
+    for energy in types:
+        mask |= TYPE_BITS.get(energy, 0)
+    return mask
+
+
+class Combatant:
+    """Compact battle stats of one Pokémon card."""
+
+    __slots__ = (
+        "card_id", "name", "image", "hp", "attack", "damage", "types",
+        "weakness_mask", "weakness_multiplier", "weakness_bonus",
+        "resistance_mask", "resistance",
+    )
+
+    def __init__(self, card):
+        self.card_id = card.id
+        self.name = card.name
+        self.image = card.image_large
+        self.hp = card.hp or DEFAULT_HP
+
+        # ✅ Pokémon always use their hardest-hitting printed attack
+        attacks = [(name, _number(damage)) for name, damage, _ in card.attacks]
+        self.attack, self.damage = max(attacks, key=lambda a: a[1], default=("Tackle", 0))
+        if self.damage == 0:
+            self.attack, self.damage = (self.attack or "Tackle"), STRUGGLE_DAMAGE
+
+        self.types = _type_mask(card.types)
+
+        # Modern cards print "×2" weakness, older ones "+20"
+        self.weakness_mask = _type_mask(t for t, _ in card.weaknesses)
+        weakness_value = next((value for _, value in card.weaknesses), "")
+        self.weakness_multiplier = _number(weakness_value, 2) if "×" in weakness_value or not weakness_value else 1
+        self.weakness_bonus = 0 if self.weakness_multiplier > 1 else _number(weakness_value)
+
+        self.resistance_mask = _type_mask(t for t, _ in card.resistances)
+        self.resistance = _number(next((value for _, value in card.resistances), ""))
+
+    def damage_against(self, defender):
+        """Damage one of this Pokémon's attacks deals to `defender`."""
+        damage = self.damage
+        if self.types & defender.weakness_mask:
+            damage = damage * defender.weakness_multiplier + defender.weakness_bonus
+        if self.types & defender.resistance_mask:
+            damage -= defender.resistance
+        return max(damage, 0)
+
+
+class BattleResult:
+    """Outcome of a resolved battle."""
+
+    __slots__ = ("winner", "turns", "challenger_damage", "opponent_damage")
+
+    def __init__(self, winner, turns, challenger_damage, opponent_damage):
+        self.winner = winner  # CHALLENGER, OPPONENT or DRAW
+        self.turns = turns
+        self.challenger_damage = challenger_damage
+        self.opponent_damage = opponent_damage
+
+
+def resolve(challenger: Combatant, opponent: Combatant) -> BattleResult:
+    """Resolves a battle deterministically; the challenger attacks first."""
+    challenger_damage = challenger.damage_against(opponent)
+    opponent_damage = opponent.damage_against(challenger)
+    if challenger_damage == 0 and opponent_damage == 0:
+        return BattleResult(DRAW, 0, 0, 0)
+
+    challenger_turns = math.ceil(opponent.hp / challenger_damage) if challenger_damage else math.inf
+    opponent_turns = math.ceil(challenger.hp / opponent_damage) if opponent_damage else math.inf
+    if challenger_turns <= opponent_turns:
+        return BattleResult(CHALLENGER, challenger_turns, challenger_damage, opponent_damage)
+    return BattleResult(OPPONENT, opponent_turns, challenger_damage, opponent_damage)
+
+
+class BattleEngine:
+    """Builds combatants from the card catalog and simulates battles in bulk.
+
+    Every Pokémon in the catalog gets one row in a set of NumPy arrays, so
+    thousands of matchups are resolved in a single vectorized pass with the
+    same rules as `resolve()`. Nothing here touches the network.
+    """
+
+    def __init__(self, catalog, seed=None):
+        self.catalog = catalog
+        self.rng = np.random.default_rng(seed)
+        self.combatants = ()
+        self.rows = {}  # card_id -> row index
+        self._catalog_version = None
+
+    def rebuild(self):
+        """Precomputes combatant arrays for every Pokémon card in the catalog."""
+        self.combatants = tuple(
+            Combatant(card) for card in self.catalog.where(supertype="Pokémon")
+        )
+        self.rows = {combatant.card_id: row for row, combatant in enumerate(self.combatants)}
+
+        def column(field, dtype=np.int64):
+            return np.array([getattr(c, field) for c in self.combatants], dtype=dtype)
+
+        self.hp = column("hp")
+        self.damage = column("damage")
+        self.types = column("types")
+        self.weakness_mask = column("weakness_mask")
+        self.weakness_multiplier = column("weakness_multiplier")
+        self.weakness_bonus = column("weakness_bonus")
+        self.resistance_mask = column("resistance_mask")
+        self.resistance = column("resistance")
+        self._catalog_version = self.catalog.version
+
+    def ensure_current(self):
+        if self._catalog_version != self.catalog.version:
+            self.rebuild()
+
+    def combatant(self, card_id: str):
+        """Returns the Combatant for a card id, or None if it can't battle."""
+        self.ensure_current()
+        row = self.rows.get(card_id)
+        return self.combatants[row] if row is not None else None
+
+    def pool(self, card_counts: dict):
+        """Turns a {card_id: quantity} collection into (rows, weights) for sampling."""
+        self.ensure_current()
+        owned = [(self.rows[card_id], quantity) for card_id, quantity in card_counts.items() if card_id in self.rows]
+        if not owned:
+            return None
+        rows, quantities = zip(*owned)
+        weights = np.array(quantities, dtype=np.float64)
+        return np.array(rows, dtype=np.int64), weights / weights.sum()
+
+    def pick(self, pool):
+        """Draws one Combatant from a pool, weighted by how many copies are owned."""
+        rows, weights = pool
+        return self.combatants[self.rng.choice(rows, p=weights)]
+
+    def _damage(self, attackers, defenders):
+        damage = self.damage[attackers]
+        weak = (self.types[attackers] & self.weakness_mask[defenders]) != 0
+        damage = np.where(weak, damage * self.weakness_multiplier[defenders] + self.weakness_bonus[defenders], damage)
+        resisted = (self.types[attackers] & self.resistance_mask[defenders]) != 0
+        damage = np.where(resisted, damage - self.resistance[defenders], damage)
+        return np.maximum(damage, 0)
+
+    def resolve_many(self, challengers, opponents):
+        """Vectorized `resolve()` over arrays of combatant rows; returns winner codes."""
+        challenger_damage = self._damage(challengers, opponents)
+        opponent_damage = self._damage(opponents, challengers)
+        with np.errstate(divide="ignore"):
+            challenger_turns = np.where(
+                challenger_damage > 0, np.ceil(self.hp[opponents] / np.maximum(challenger_damage, 1)), np.inf)
+            opponent_turns = np.where(
+                opponent_damage > 0, np.ceil(self.hp[challengers] / np.maximum(opponent_damage, 1)), np.inf)
+        winners = np.where(challenger_turns <= opponent_turns, CHALLENGER, OPPONENT)
+        return np.where((challenger_damage == 0) & (opponent_damage == 0), DRAW, winners)
+
+    def odds(self, challenger_pool, opponent_pool, simulations: int = 10_000):
+        """Monte Carlo odds that each side wins when both draw a random Pokémon.
+
+        Returns (challenger_win, opponent_win, draw) probabilities.
+        """
+        challengers = self.rng.choice(challenger_pool[0], size=simulations, p=challenger_pool[1])
+        opponents = self.rng.choice(opponent_pool[0], size=simulations, p=opponent_pool[1])
+        winners = self.resolve_many(challengers, opponents)
+        return (
+            float(np.mean(winners == CHALLENGER)),
+            float(np.mean(winners == OPPONENT)),
+            float(np.mean(winners == DRAW)),
+        )
+
+    def power_ratings(self, simulations_per_card: int = 1_000):
+        """Win rate of every Pokémon against random catalog opponents, for balancing.
+
+        Returns a {card_id: win_rate} mapping, attacking first and second equally often.
+        """
+        self.ensure_current()
+        count = len(self.combatants)
+        cards = np.repeat(np.arange(count), simulations_per_card)
+        opponents = self.rng.integers(count, size=len(cards))
+        first = self.resolve_many(cards, opponents) == CHALLENGER
+        second = self.resolve_many(opponents, cards) == OPPONENT
+        wins = np.bincount(cards, weights=first.astype(np.float64) + second, minlength=count)
+        rates = wins / (2 * simulations_per_card)
+        return {combatant.card_id: float(rate) for combatant, rate in zip(self.combatants, rates)}
@@ -0,0 +1,279 @@
+import asyncio
+import contextvars
+import inspect
+import itertools
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from collection import SORT_KEYS
+
+# Name of the command a coroutine is running on behalf of (for per-command DB call counts)
+CURRENT_COMMAND = contextvars.ContextVar("current_command", default=None)
+
+_message_ids = itertools.count(10 ** 17)
+
+
+class FakeUser:
+    """Stands in for discord.Member: just the attributes the cogs read."""
+
+    def __init__(self, id: int, name: str = None):
+        self.id = id
+        self.name = name or f"trainer{id}"
+        self.display_name = self.name
+        self.mention = f"<@{id}>"
+        self.avatar = None
+        self.bot = False
+
+
+class FakeGuild:
+    def __init__(self, id: int, members=()):
+        self.id = id
+        self.name = f"guild{id}"
+        self.members = {member.id: member for member in members}
+
+    def get_member(self, user_id: int):
+        return self.members.get(user_id)
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None, **kwargs):
+        self.id = next(_message_ids)
+        self.channel = channel
+        self.content = content
+        self.kwargs = kwargs
+        self.reactions = []
+
+    async def add_reaction(self, emoji):
+        await self.channel.api_call()
+        self.reactions.append(str(emoji))
+
+    async def edit(self, **kwargs):
+        await self.channel.api_call()
+        self.kwargs.update(kwargs)
+        return self
+
+
+class FakeChannel:
+    """A text channel whose API calls take `latency` seconds, like Discord's REST API."""
+
+    def __init__(self, id: int, latency: float = 0.0):
+        self.id = id
+        self.latency = latency
+        self.api_calls = 0
+
+    async def api_call(self):
+        self.api_calls += 1
+        await asyncio.sleep(self.latency)
+
+    async def send(self, content=None, **kwargs):
+        await self.api_call()
+        return FakeMessage(self, content, **kwargs)
+
+
+class FakeContext:
+    """Stands in for commands.Context when a cog command is called directly."""
+
+    def __init__(self, bot, author, guild, channel):
+        self.bot = bot
+        self.author = author
+        self.guild = guild
+        self.channel = channel
+        self.message = FakeMessage(channel)
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+
+class CountingDatabase:
+    """Wraps a Database (real or fake) and counts coroutine calls per CURRENT_COMMAND."""
+
+    def __init__(self, db):
+        self._db = db
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        attribute = getattr(self._db, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        async def counted(*args, **kwargs):
+            self.calls[CURRENT_COMMAND.get()] += 1
+            return await attribute(*args, **kwargs)
+        return counted
+
+
+class FakeDatabase:
+    """In-memory implementation of the Database methods the cogs use.
+
+    Every call that would be a round trip sleeps for `latency` seconds, so
+    the harness shows how commands behave against a remote Postgres without
+    needing one.
+    """
+
+    def __init__(self, latency: float = 0.0, seed: int = None):
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.cards = {}  # user_id -> Counter(card_id)
+        self.battles = {}  # user_id -> [wins, losses]
+        self.packs = {}  # pack_id -> (user_id, [card_id, ...])
+        self.latest_pack = {}  # user_id -> pack_id
+        self.missions = {}  # (user_id, mission_id) -> [progress, claimed]
+        self.leaderboard = {}  # (scope, user_id) -> [battles_won, cards_collected]
+        self.trades = {}  # trade_id -> row dict
+        self.started_at = datetime.now(timezone.utc)  # first_obtained of every card (the fake keeps no history)
+        self._pack_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+
+    async def _round_trip(self):
+        await asyncio.sleep(self.latency)
+
+    async def get_user_card_counts(self, user_id):
+        await self._round_trip()
+        return dict(self.cards.get(user_id, {}))
+
+    async def get_user_collection(self, user_id):
+        await self._round_trip()
+        return list(self.cards.get(user_id, {}))
+
+    async def get_card_totals(self, user_id):
+        await self._round_trip()
+        cards = self.cards.get(user_id, {})
+        return len(cards), sum(cards.values())
+
+    async def browse_cards(self, user_id, order="name", after=None, limit=10):
+        await self._round_trip()
+        key = SORT_KEYS[order]
+        rows = [
+            {"card_id": card_id, "card_name": card_id, "set_id": card_id.split("-")[0],
+             "quantity": quantity, "first_obtained": self.started_at}
+            for card_id, quantity in self.cards.get(user_id, {}).items()
+        ]
+        newest_first = order == "date"
+        rows.sort(key=lambda row: (row[key], row["card_id"]), reverse=newest_first)
+        if after is not None:
+            rows = [row for row in rows if ((row[key], row["card_id"]) < after if newest_first
+                                            else (row[key], row["card_id"]) > after)]
+        return rows[:limit]
+
+    async def get_profile_stats(self, user_id):
+        await self._round_trip()
+        cards = self.cards.get(user_id, {})
+        wins, losses = self.battles.get(user_id, (0, 0))
+        return {"wins": wins, "losses": losses, "total_cards": sum(cards.values()), "unique_cards": len(cards)}
+
+    async def open_packs(self, user_id, packs):
+        await self._round_trip()
+        ids = []
+        for pack in packs:
+            pack_id = next(self._pack_ids)
+            self.packs[pack_id] = (user_id, list(pack))
+            self.latest_pack[user_id] = pack_id
+            self.cards.setdefault(user_id, Counter()).update(pack)
+            ids.append(pack_id)
+        return ids
+
+    async def record_battle(self, winner_id, loser_id):
+        # Buffered by the real Database's counter buffer, so no round trip here
+        self.battles.setdefault(winner_id, [0, 0])[0] += 1
+        self.battles.setdefault(loser_id, [0, 0])[1] += 1
+
+    async def get_recent_packs(self, limit):
+        await self._round_trip()
+        return [(pack_id, user_id) for pack_id, (user_id, cards) in list(self.packs.items())[-limit:] if cards]
+
+    async def claim_card_from_pack(self, gambler_id, pack_id=None, opener_id=None):
+        await self._round_trip()
+        if pack_id is None:
+            pack_id = self.latest_pack.get(opener_id)
+        user_id, cards = self.packs.get(pack_id, (None, []))
+        if not cards or user_id == gambler_id:
+            return None
+        card_id = cards.pop(self.rng.randrange(len(cards)))
+        self.cards.setdefault(gambler_id, Counter())[card_id] += 1
+        return pack_id, user_id, card_id
+
+    async def get_mission_progress(self, user_id):
+        await self._round_trip()
+        return {mission_id: tuple(value) for (user, mission_id), value in self.missions.items() if user == user_id}
+
+    async def increment_mission_progress(self, user_ids, mission_ids, deltas):
+        await self._round_trip()
+        for user_id, mission_id, delta in zip(user_ids, mission_ids, deltas):
+            self.missions.setdefault((user_id, mission_id), [0, False])[0] += delta
+
+    async def claim_mission_reward(self, user_id, mission_id, goal, reward_card):
+        await self._round_trip()
+        progress = self.missions.get((user_id, mission_id))
+        if not progress or progress[1] or progress[0] < goal:
+            return False
+        progress[1] = True
+        self.cards.setdefault(user_id, Counter())[reward_card] += 1
+        return True
+
+    async def get_leaderboard_stats(self):
+        await self._round_trip()
+        return [
+            {"scope": scope, "user_id": user_id, "battles_won": won, "cards_collected": cards}
+            for (scope, user_id), (won, cards) in self.leaderboard.items()
+        ]
+
+    async def increment_leaderboard_stats(self, scopes, user_id, battles_won, cards_collected):
+        await self._round_trip()
+        for scope in scopes:
+            stats = self.leaderboard.setdefault((scope, user_id), [0, 0])
+            stats[0] += battles_won
+            stats[1] += cards_collected
+
+    def _take(self, user_id, card_ids):
+        owned = self.cards.get(user_id, Counter())
+        needed = Counter(card_ids)
+        if any(owned[card_id] < amount for card_id, amount in needed.items()):
+            return False
+        owned.subtract(needed)
+        for card_id in needed:
+            if owned[card_id] <= 0:
+                del owned[card_id]
+        return True
+
+    async def create_trade(self, proposer_id, target_id, offered, requested, ttl, guild_id=None, channel_id=None):
+        await self._round_trip()
+        if not self._take(proposer_id, offered):
+            return None
+        trade = {
+            "id": next(self._trade_ids), "proposer_id": proposer_id, "target_id": target_id,
+            "offered": list(offered), "requested": list(requested), "guild_id": guild_id,
+            "channel_id": channel_id, "message_id": None, "status": "pending",
+            "expires_at": datetime.now(timezone.utc) + timedelta(seconds=ttl),
+        }
+        self.trades[trade["id"]] = trade
+        return trade
+
+    async def set_trade_message(self, trade_id, message_id):
+        await self._round_trip()
+        self.trades[trade_id]["message_id"] = message_id
+
+    async def get_pending_trades(self):
+        await self._round_trip()
+        return [trade for trade in self.trades.values() if trade["status"] == "pending"]
+
+    async def accept_trade(self, trade_id):
+        await self._round_trip()
+        trade = self.trades.get(trade_id)
+        if not trade or trade["status"] != "pending":
+            return None
+        if not self._take(trade["target_id"], trade["requested"]):
+            return "unavailable"
+        self.cards.setdefault(trade["target_id"], Counter()).update(trade["offered"])
+        self.cards.setdefault(trade["proposer_id"], Counter()).update(trade["requested"])
+        trade["status"] = "accepted"
+        return "accepted"
+
+    async def cancel_trade(self, trade_id, status):
+        await self._round_trip()
+        trade = self.trades.get(trade_id)
+        if not trade or trade["status"] != "pending":
+            return False
+        trade["status"] = status
+        self.cards.setdefault(trade["proposer_id"], Counter()).update(trade["offered"])
+        return True
@@ -0,0 +1,119 @@
+import asyncio
+import io
+import random
+
+from aiohttp import web
+
+from catalog import CardCatalog, CatalogCard
+
+RARITIES = (("Common", 0.55), ("Uncommon", 0.25), ("Rare", 0.12), ("Rare Holo", 0.06), ("Rare Ultra", 0.02))
+TYPES = ("Fire", "Water", "Grass", "Lightning", "Psychic", "Fighting", "Colorless")
+
+
+def synthetic_cards(sets: int, cards_per_set: int, image_base: str, seed: int = 0):
+    """Generates a catalog-shaped card list with a realistic rarity mix."""
+    rng = random.Random(seed)
+    rarities, weights = zip(*RARITIES)
+    cards = []
+    for set_index in range(sets):
+        set_id = f"bench{set_index}"
+        for number in range(1, cards_per_set + 1):
+            # ✅ Guarantee every tier exists in each set so all sets can fill a pack
+            rarity = rarities[number - 1] if number <= len(rarities) else rng.choices(rarities, weights)[0]
+            card_type = rng.choice(TYPES)
+            cards.append(CatalogCard(
+                id=f"{set_id}-{number}", name=f"Benchmon {set_index}-{number}", supertype="Pokémon",
+                subtypes=("Basic",), rarity=rarity, set_id=set_id, hp=rng.randrange(30, 250, 10),
+                types=(card_type,), weaknesses=((rng.choice(TYPES), "×2"),), resistances=(),
+                attacks=(("Tackle", str(rng.randrange(10, 120, 10)), rng.randint(1, 3)),),
+                image_small=f"{image_base}/images/{set_id}/{number}.png",
+                image_large=f"{image_base}/images/{set_id}/{number}_hires.png",
+            ))
+    return cards
+
+
+def synthetic_catalog(cards, client=None):
+    """A CardCatalog holding `cards` without touching the disk or the network."""
+    catalog = CardCatalog(path="", client=client)
+    catalog.sets = {card.set_id: {"name": card.set_id, "updatedAt": "bench"} for card in cards}
+    catalog._build_indexes(cards)
+    return catalog
+
+
+def _placeholder_png() -> bytes:
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new("RGB", (245, 342), (200, 60, 60)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class StubAPIServer:
+    """Local stand-in for the Pokémon TCG API, PokéAPI and the card image CDN.
+
+    Each response is delayed by its route's latency so API-bound commands can
+    be measured without network access or rate limits.
+    """
+
+    def __init__(self, cards, tcg_latency: float = 0.05, pokeapi_latency: float = 0.05,
+                 image_latency: float = 0.02, host: str = "127.0.0.1", port: int = 0):
+        self.cards = {card.id: card for card in cards}
+        self.tcg_latency = tcg_latency
+        self.pokeapi_latency = pokeapi_latency
+        self.image_latency = image_latency
+        self.host = host
+        self.port = port
+        self.requests = {"tcg": 0, "pokeapi": 0, "images": 0}
+        self._png = None
+        self._runner = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._png = await asyncio.to_thread(_placeholder_png)
+        app = web.Application()
+        app.router.add_get("/v2/cards/{card_id}", self.tcg_card)
+        app.router.add_get("/api/v2/pokemon/{name}", self.pokemon)
+        app.router.add_get("/images/{set_id}/{file}", self.image)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def tcg_card(self, request):
+        self.requests["tcg"] += 1
+        await asyncio.sleep(self.tcg_latency)
+        card = self.cards.get(request.match_info["card_id"])
+        if card is None:
+            return web.json_response({"error": "not found"}, status=404)
+        return web.json_response({"data": {
+            "id": card.id, "name": card.name, "supertype": card.supertype, "rarity": card.rarity,
+            "set": {"id": card.set_id}, "hp": str(card.hp), "types": list(card.types),
+            "images": {"small": card.image_small, "large": card.image_large},
+        }})
+
+    async def pokemon(self, request):
+        self.requests["pokeapi"] += 1
+        await asyncio.sleep(self.pokeapi_latency)
+        name = request.match_info["name"]
+        if name.startswith("missingno"):
+            return web.json_response({}, status=404)
+        poke_id = int(name) if name.isdigit() else sum(map(ord, name)) % 1000 + 1
+        return web.json_response({
+            "name": name if not name.isdigit() else f"pokemon{name}", "id": poke_id,
+            "height": 7, "weight": 69, "base_experience": 64,
+            "sprites": {"front_default": f"{self.url}/images/sprites/{poke_id}.png"},
+            "types": [{"type": {"name": "grass"}}], "abilities": [{"ability": {"name": "overgrow"}}],
+        })
+
+    async def image(self, request):
+        self.requests["images"] += 1
+        await asyncio.sleep(self.image_latency)
+        return web.Response(body=self._png, content_type="image/png")
+
+    async def close(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
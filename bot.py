@@ -1,9 +1,26 @@
+import time
+STARTED_AT = time.perf_counter()  # ✅ Startup timing includes module imports
+
 import os
+import contextlib
 import discord
 from discord.ext import commands
 import asyncio
 from dotenv import load_dotenv
 from database import Database  # ✅ Import Database class
+from catalog import CardCatalog  # ✅ Local Pokémon TCG card catalog
+from clients import TCGClient, PokeAPIClient  # ✅ Shared async API clients
+from packs import PackGenerator, RecentPacks  # ✅ Rarity-weighted pack generation
+from ranking import RankingService  # ✅ Incrementally maintained leaderboards
+from battles import BattleEngine  # ✅ Stat-driven battle resolution
+from rendering import PackRenderer  # ✅ Composite pack images
+from messaging import OutboundScheduler  # ✅ Rate-limit-aware outbound queue
+from events import EventBus  # ✅ In-process gameplay events
+from missions import MissionEngine  # ✅ Event-driven mission progress
+from trades import TradeEngine  # ✅ Escrowed card trades
+from utils import TimerWheel
+from metrics import REGISTRY, MetricsServer, LoopWatchdog, install_command_hooks  # ✅ Latency histograms and counters
+import config
 
 # ✅ Load environment variables
 load_dotenv()
@@ -21,38 +38,191 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
+class PokemonBot(commands.AutoShardedBot):
+    """The bot, with a startup sequence that runs once per process rather than on every reconnect.
+
+    Cogs are loaded concurrently in `setup_hook`, the catalog and caches warm
+    up in the background while we log in, and every phase is timed.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.timings = {"imports": time.perf_counter() - STARTED_AT}  # phase -> seconds
+        self.warm = asyncio.Event()  # ✅ Set once the catalog and derived tables are loaded
+        self._warmup_task = None
+        self._card_sync_task = None
+        self._login_started = None
+        self._reported = False
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Records how long a startup phase took."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = time.perf_counter() - started
+
+    def start_warmup(self):
+        if self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self.warm_up())
+
+    async def warm_up(self):
+        """Loads the catalog and caches without holding up login."""
+        try:
+            with self.phase("warm-up"):
+                # ✅ Independent loads run concurrently; CPU-heavy rebuilds stay off the event loop
+                await asyncio.gather(self.catalog.load(), self.pokeapi.load())
+                await asyncio.gather(
+                    asyncio.to_thread(self.pack_generator.rebuild),  # ✅ Precompute per-set alias tables
+                    asyncio.to_thread(self.battle_engine.rebuild),  # ✅ Precompute combatant stat arrays
+                )
+        except Exception as e:
+            print(f"❌ Warm-up failed, continuing with cold caches: {e}")
+        finally:
+            self.warm.set()
+
+    def start_card_sync(self):
+        if self._card_sync_task is None:
+            self._card_sync_task = asyncio.create_task(self.sync_card_names())
+
+    async def sync_card_names(self):
+        """Mirrors the loaded catalog's card names and sets into the database for `!mypokemon` sorting."""
+        await self.warm.wait()
+        try:
+            changed = await self.db.sync_cards(self.catalog.where())
+            if changed:
+                print(f"✅ Synced {changed} card name(s) to the database.")
+        except Exception as e:
+            print(f"⚠️ Card name sync failed, collections sort unknown cards by id until the next sync: {e}")
+
+    async def setup_hook(self):
+        """Runs once, after login and before connecting to the gateway."""
+        with self.phase("extensions"):
+            await self.load_extensions()
+
+    async def load_extensions(self):
+        """Loads all command extensions (cogs) concurrently."""
+        command_folder = os.path.join(os.path.dirname(__file__), COMMANDS_FOLDER)
+        extensions = sorted(
+            f"{COMMANDS_FOLDER}.{filename[:-3]}" for filename in os.listdir(command_folder)
+            if filename.endswith(".py") and not filename.startswith("_")
+        )
+        results = await asyncio.gather(*(self.load_extension(name) for name in extensions), return_exceptions=True)
+        for name, result in zip(extensions, results):
+            if isinstance(result, Exception):
+                print(f"❌ Failed to load {name}: {result}")
+        print(f"✅ Loaded {sum(not isinstance(r, Exception) for r in results)}/{len(extensions)} command extensions.")
+
+    async def report_startup(self):
+        """Prints the per-phase startup breakdown once, when both ready and warm."""
+        if self._reported:
+            return
+        self._reported = True
+        await self.warm.wait()
+        breakdown = " · ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.timings.items())
+        print(f"⏱️ Startup: {breakdown}")
+
 # ✅ Initialize bot & database
-bot = commands.Bot(command_prefix="!", intents=intents)
-db = Database()  
+# ✅ AutoShardedBot runs every shard Discord asks for, or just SHARD_IDS when started by launcher.py
+bot = PokemonBot(
+    command_prefix="!", intents=intents,
+    shard_count=config.SHARD_COUNT, shard_ids=config.SHARD_IDS,
+)
+db = Database()  # ✅ The only connection pool in the process, handed to every cog
+bot.db = db
+bot.tcg = TCGClient()  # ✅ One pooled HTTP session for every Pokémon TCG API call
+bot.pokeapi = PokeAPIClient()  # ✅ Cached PokéAPI lookups for !pokedex
+bot.catalog = CardCatalog(config.CATALOG_PATH, client=bot.tcg)  # ✅ Shared by all cogs for card lookups
+bot.pack_generator = PackGenerator(bot.catalog)
+bot.recent_packs = RecentPacks(config.RECENT_PACKS_SIZE)  # ✅ Recently opened packs for global WonderPick
+bot.events = EventBus()
+bot.ranking = RankingService(db)
+bot.ranking.subscribe(bot.events)
+bot.ranking.connect_feed(db.feed)  # ✅ Standings stay identical across worker processes
+db.feed.subscribe("catalog", lambda message: bot.catalog.reload())
+bot.missions = MissionEngine(db)
+bot.missions.subscribe(bot.events)
+bot.battle_engine = BattleEngine(bot.catalog)
+bot.pack_renderer = PackRenderer()
+bot.outbound = OutboundScheduler()
+bot.timers = TimerWheel()  # ✅ One task drives every expiry timer
+bot.trades = TradeEngine(db, bot.events, bot.timers)
+bot.watchdog = LoopWatchdog(config.STALL_THRESHOLD, capacity=config.STALL_BUFFER_SIZE)  # ✅ Catches blocking calls
+bot.metrics_server = (
+    MetricsServer(host=config.METRICS_HOST, port=config.METRICS_PORT + config.WORKER_ID) if config.METRICS_PORT else None
+)
+
+install_command_hooks(bot)
+REGISTRY.gauge("tcgbot_db_pool_size", "Open database connections.", lambda: db.pool_stats()["size"])
+REGISTRY.gauge("tcgbot_db_cache_hit_ratio", "Read-through cache hit ratio.", lambda: db.cache.hit_ratio)
+REGISTRY.gauge("tcgbot_outbound_depth", "Queued outgoing messages and reactions.", lambda: bot.outbound.stats()["depth"])
+REGISTRY.gauge("tcgbot_gateway_latency_seconds", "Average shard heartbeat latency.",
+               lambda: bot.latency if bot.latency == bot.latency else 0.0)  # NaN before the first heartbeat
+
+def owns_guild(guild_id):
+    """True if a guild's events are delivered to this worker process."""
+    if config.SHARD_IDS is None:
+        return True
+    shard_id = (guild_id >> 22) % config.SHARD_COUNT if guild_id else 0  # DMs go to shard 0
+    return shard_id in config.SHARD_IDS
+
+@bot.check
+async def wait_until_warm(ctx):
+    """Holds commands that arrive during startup until the catalog is loaded."""
+    await bot.warm.wait()
+    return True
 
 @bot.event
 async def on_ready():
-    """Triggered when the bot is ready."""
-    print(f"✅ Logged in as {bot.user}")
-    await load_extensions()
-
-async def load_extensions():
-    """Loads all command extensions (cogs)."""
-    command_folder = os.path.join(os.path.dirname(__file__), COMMANDS_FOLDER)
-
-    for filename in os.listdir(command_folder):
-        if filename.endswith(".py") and not filename.startswith("_"):
-            extension = f"{COMMANDS_FOLDER}.{filename[:-3]}"
-            try:
-                await bot.load_extension(extension)  # ✅ Properly awaited
-                print(f"✅ Loaded command: {filename}")
-            except Exception as e:
-                print(f"❌ Failed to load {filename}: {e}")
+    """Triggered when the bot is ready (again after every reconnect, so it only logs)."""
+    print(f"✅ Logged in as {bot.user} (worker {config.WORKER_ID}, shards {sorted(bot.shards)})")
+    if "ready" not in bot.timings:
+        bot.timings["ready"] = time.perf_counter() - bot._login_started
+    await bot.report_startup()
+
+@bot.event
+async def on_shard_ready(shard_id):
+    print(f"✅ Shard {shard_id} ready.")
+
+@bot.event
+async def on_shard_disconnect(shard_id):
+    print(f"⚠️ Shard {shard_id} disconnected.")
+
+@bot.event
+async def on_shard_resumed(shard_id):
+    print(f"🔄 Shard {shard_id} resumed.")
 
 async def main():
     """Main function to start the bot and connect to the database."""
     try:
+        bot.watchdog.start()
+        bot.start_warmup()  # ✅ The catalog doesn't need the database, so it loads alongside it
+        if bot.metrics_server:
+            await bot.metrics_server.start()
+
         print("🔄 Connecting to database...")
-        await db.connect()  # ✅ Connect to the database before starting the bot
+        with bot.phase("database"):
+            await db.connect()  # ✅ Connect to the database before starting the bot
+            await db.apply_migrations()
         print("✅ Database connection successful!")
 
+        with bot.phase("state"):
+            recent_packs, *_ = await asyncio.gather(
+                db.get_recent_packs(config.RECENT_PACKS_SIZE),
+                bot.ranking.load(),
+                bot.trades.load(owns_guild),  # ✅ Open trades (and their escrow) survive restarts
+            )
+        for pack_id, opener_id in recent_packs:
+            bot.recent_packs.add(pack_id, opener_id)
+        bot.missions.start()
+        bot.timers.start()
+        if config.WORKER_ID == 0:
+            bot.start_card_sync()  # ✅ One worker is enough, the others share the same database
+
         async with bot:
             print("🚀 Starting bot...")
+            bot._login_started = time.perf_counter()
             await bot.start(DISCORD_TOKEN)
 
     except discord.LoginFailure:
@@ -60,9 +230,23 @@ async def main():
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
     finally:
+        print("🔄 Flushing pending writes...")
+        await bot.timers.close()
+        await bot.events.drain()
+        try:
+            await bot.missions.close()  # ✅ Write in-memory mission progress before the pool closes
+            await db.counters.close()  # ✅ Write buffered wins/losses before the pool closes
+        except Exception as e:
+            print(f"❌ Failed to flush pending writes: {e}")
         print("🔄 Disconnecting database...")
         await db.disconnect()
         print("✅ Database disconnected.")
+        await bot.tcg.close()
+        await bot.pack_renderer.close()
+        await bot.pokeapi.close()
+        if bot.metrics_server:
+            await bot.metrics_server.close()
+        bot.watchdog.stop()
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,25 @@
+import asyncio
+import sys
+
+from .catalog import CardCatalog
+
+
+async def main(command: str):
+    """Runs a catalog maintenance command (`sync` or `stats`)."""
+    catalog = CardCatalog()
+    try:
+        if command == "sync":
+            await catalog.load()
+            await catalog.sync()
+        elif command == "stats":
+            await catalog.load()
+            for rarity, cards in sorted(catalog.by_rarity.items(), key=lambda item: str(item[0])):
+                print(f"{rarity}: {len(cards)}")
+        else:
+            print("Usage: python -m catalog [sync|stats]")
+    finally:
+        await catalog.client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(sys.argv[1] if len(sys.argv) > 1 else "sync"))
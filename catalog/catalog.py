@@ -0,0 +1,231 @@
+import asyncio
+import gzip
+import json
+import os
+
+import config
+from clients import TCGClient
+
+CATALOG_FORMAT_VERSION = 1
+
+
+class CatalogCard:
+    """Compact, read-only record of a single Pokémon TCG card."""
+
+    __slots__ = (
+        "id", "name", "supertype", "subtypes", "rarity", "set_id", "hp", "types",
+        "weaknesses", "resistances", "attacks", "image_small", "image_large",
+    )
+
+    def __init__(self, id, name, supertype, subtypes, rarity, set_id, hp, types,
+                 weaknesses, resistances, attacks, image_small, image_large):
+        self.id = id
+        self.name = name
+        self.supertype = supertype
+        self.subtypes = subtypes
+        self.rarity = rarity
+        self.set_id = set_id
+        self.hp = hp
+        self.types = types
+        self.weaknesses = weaknesses  # ((type, "×2"), ...)
+        self.resistances = resistances  # ((type, "-30"), ...)
+        self.attacks = attacks  # ((name, damage, energy_cost), ...)
+        self.image_small = image_small
+        self.image_large = image_large
+
+    @classmethod
+    def from_api(cls, data: dict):
+        """Builds a compact record from a Pokémon TCG API card payload."""
+        hp = data.get("hp")
+        images = data.get("images") or {}
+        return cls(
+            id=data["id"],
+            name=data.get("name", "Unknown Card"),
+            supertype=data.get("supertype"),
+            subtypes=tuple(data.get("subtypes") or ()),
+            rarity=data.get("rarity"),
+            set_id=(data.get("set") or {}).get("id"),
+            hp=int(hp) if hp and hp.isdigit() else None,
+            types=tuple(data.get("types") or ()),
+            weaknesses=tuple((w["type"], w.get("value", "")) for w in data.get("weaknesses") or ()),
+            resistances=tuple((r["type"], r.get("value", "")) for r in data.get("resistances") or ()),
+            attacks=tuple(
+                (a.get("name", ""), a.get("damage", ""), len(a.get("cost") or ()))
+                for a in data.get("attacks") or ()
+            ),
+            image_small=images.get("small"),
+            image_large=images.get("large"),
+        )
+
+    def to_row(self):
+        """Positional row used by the on-disk catalog format."""
+        return [getattr(self, field) for field in self.__slots__]
+
+    @classmethod
+    def from_row(cls, row):
+        (card_id, name, supertype, subtypes, rarity, set_id, hp, types,
+         weaknesses, resistances, attacks, image_small, image_large) = row
+        return cls(
+            card_id, name, supertype, tuple(subtypes), rarity, set_id, hp, tuple(types),
+            tuple(tuple(w) for w in weaknesses),
+            tuple(tuple(r) for r in resistances),
+            tuple(tuple(a) for a in attacks),
+            image_small, image_large,
+        )
+
+    def __repr__(self):
+        return f"<CatalogCard {self.id} {self.name!r}>"
+
+
+class CardCatalog:
+    """Local copy of the Pokémon TCG card set, indexed in memory.
+
+    The catalog is synced from the API into a gzipped file once, loaded at
+    startup and then serves every card lookup without a network round trip.
+    """
+
+    def __init__(self, path: str = config.CATALOG_PATH, client: TCGClient = None):
+        self.path = path
+        self.client = client or TCGClient()
+        self.sets = {}  # set_id -> {"name": ..., "updatedAt": ...}
+        self.version = 0  # ✅ Bumped on every (re)load so derived data can tell it's stale
+        self.fetched = {}  # card_id -> card looked up through the API; kept out of the indexes and `version`
+        self._clear_indexes()
+
+    def _clear_indexes(self):
+        self.by_id = {}
+        self.by_set = {}
+        self.by_rarity = {}
+        self.by_supertype = {}
+        self.by_name = {}
+        self._all = ()
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def get(self, card_id: str):
+        """Returns a card by id, or None if it isn't in the catalog."""
+        return self.by_id.get(card_id)
+
+    async def find(self, card_id: str):
+        """Returns a card by id, asking the API only for cards missing from the catalog."""
+        card = self.by_id.get(card_id) or self.fetched.get(card_id)
+        if card is None and card_id:
+            data = await self.client.get_card(card_id)
+            if data:
+                card = self.fetched[card_id] = CatalogCard.from_api(data)
+        return card
+
+    def where(self, set_id: str = None, rarity: str = None, supertype: str = None, name: str = None):
+        """Returns all cards matching every given filter."""
+        filters = [
+            index.get(key, ())
+            for index, key in (
+                (self.by_set, set_id),
+                (self.by_rarity, rarity),
+                (self.by_supertype, supertype),
+                (self.by_name, name.lower() if name else None),
+            )
+            if key is not None
+        ]
+        if not filters:
+            return list(self._all)
+
+        # ✅ Start from the smallest index bucket and narrow it down
+        filters.sort(key=len)
+        matches = filters[0]
+        for bucket in filters[1:]:
+            allowed = {card.id for card in bucket}
+            matches = [card for card in matches if card.id in allowed]
+        return list(matches)
+
+    def _index(self, card):
+        self.by_id[card.id] = card
+        self.by_set.setdefault(card.set_id, []).append(card)
+        self.by_rarity.setdefault(card.rarity, []).append(card)
+        self.by_supertype.setdefault(card.supertype, []).append(card)
+        self.by_name.setdefault(card.name.lower(), []).append(card)
+
+    def _build_indexes(self, cards):
+        self._clear_indexes()
+        for card in cards:
+            self._index(card)
+        self._all = tuple(self.by_id.values())
+        self.version += 1
+
+    def _read_file(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if payload.get("version") != CATALOG_FORMAT_VERSION:
+            return {}, []
+        sets, cards = {}, []
+        for set_id, entry in payload["sets"].items():
+            sets[set_id] = {"name": entry["name"], "updatedAt": entry["updatedAt"]}
+            cards.extend(CatalogCard.from_row(row) for row in entry["cards"])
+        return sets, cards
+
+    def _write_file(self):
+        payload = {"version": CATALOG_FORMAT_VERSION, "sets": {}}
+        for set_id, meta in self.sets.items():
+            payload["sets"][set_id] = {
+                "name": meta["name"],
+                "updatedAt": meta["updatedAt"],
+                "cards": [card.to_row() for card in self.by_set.get(set_id, ())],
+            }
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_path, self.path)  # ✅ Never leave a half-written catalog behind
+
+    async def load(self):
+        """Loads the catalog from disk, syncing from the API if no local copy exists."""
+        if os.path.exists(self.path):
+            self.sets, cards = await asyncio.to_thread(self._read_file)
+            self._build_indexes(cards)
+
+        if not self.by_id:
+            await self.sync()
+        print(f"✅ Card catalog ready: {len(self.by_id)} cards in {len(self.sets)} sets.")
+
+    async def reload(self):
+        """Re-reads the local catalog file (after another process synced it)."""
+        if os.path.exists(self.path):
+            self.sets, cards = await asyncio.to_thread(self._read_file)
+            self._build_indexes(cards)
+            print(f"🔄 Card catalog reloaded: {len(self.by_id)} cards.")
+
+    async def sync(self):
+        """Refreshes the local catalog, refetching only sets whose `updatedAt` changed.
+
+        Returns how many sets were added, changed or removed (0 when already up to date).
+        """
+        remote_sets = await self.client.get_sets()
+        stale = [
+            s for s in remote_sets
+            if self.sets.get(s["id"], {}).get("updatedAt") != s.get("updatedAt")
+        ]
+        removed = set(self.sets) - {s["id"] for s in remote_sets}
+        if not stale and not removed:
+            print("✅ Card catalog is up to date.")
+            return 0
+
+        sets = {set_id: meta for set_id, meta in self.sets.items() if set_id not in removed}
+        cards = {card.id: card for card in self._all if card.set_id not in removed}
+        print(f"🔄 Syncing {len(stale)} set(s)...")
+        # ✅ Stale sets are fetched concurrently; the client caps requests in flight
+        fetched_sets = await asyncio.gather(*(self.client.get_set_cards(s["id"]) for s in stale))
+        for card_set, fetched in zip(stale, fetched_sets):
+            for card in self.by_set.get(card_set["id"], ()):
+                cards.pop(card.id, None)
+            for data in fetched:
+                card = CatalogCard.from_api(data)
+                cards[card.id] = card
+            sets[card_set["id"]] = {"name": card_set.get("name"), "updatedAt": card_set.get("updatedAt")}
+
+        self.sets = sets
+        self._build_indexes(cards.values())
+        await asyncio.to_thread(self._write_file)
+        print(f"✅ Card catalog synced: {len(stale)} set(s) refreshed, {len(removed)} removed.")
+        return len(stale) + len(removed)
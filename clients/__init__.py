@@ -0,0 +1,2 @@
+from .pokeapi import PokeAPIClient, PokemonRecord
+from .tcg import TCGClient, TCGAPIError
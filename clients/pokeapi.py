@@ -0,0 +1,179 @@
+import asyncio
+import contextlib
+import json
+import os
+import time
+
+import aiohttp
+
+import config
+from metrics import http_trace_config
+from utils import SingleFlight, TTLCache
+
+POKEAPI_URL = "https://pokeapi.co/api/v2/pokemon/"
+SAVE_INTERVAL = 60
+
+
+class PokemonRecord:
+    """The handful of PokéAPI fields the `!pokedex` embed actually shows."""
+
+    __slots__ = ("name", "id", "height", "weight", "base_experience", "sprite", "types", "abilities")
+
+    def __init__(self, name, id, height, weight, base_experience, sprite, types, abilities):
+        self.name = name
+        self.id = id
+        self.height = height
+        self.weight = weight
+        self.base_experience = base_experience
+        self.sprite = sprite
+        self.types = types
+        self.abilities = abilities
+
+    @classmethod
+    def from_api(cls, data: dict):
+        return cls(
+            name=data.get("name", "Unknown"),
+            id=data.get("id"),
+            height=data.get("height"),
+            weight=data.get("weight"),
+            base_experience=data.get("base_experience"),
+            sprite=(data.get("sprites") or {}).get("front_default"),
+            types=tuple(t["type"]["name"] for t in data.get("types", [])),
+            abilities=tuple(a["ability"]["name"] for a in data.get("abilities", [])),
+        )
+
+    def to_row(self):
+        return [getattr(self, field) for field in self.__slots__]
+
+    @classmethod
+    def from_row(cls, row):
+        name, poke_id, height, weight, base_experience, sprite, types, abilities = row
+        return cls(name, poke_id, height, weight, base_experience, sprite, tuple(types), tuple(abilities))
+
+
+class PokeAPIClient:
+    """Cached PokéAPI lookups for `!pokedex`.
+
+    Trimmed records live in a bounded LRU with a long TTL, misses (typo'd
+    names) are remembered for a shorter while, concurrent lookups of the same
+    name share one request, and the cache is persisted to disk so a restart
+    starts warm.
+    """
+
+    def __init__(self, path: str = config.POKEAPI_CACHE_PATH, maxsize: int = config.POKEAPI_CACHE_SIZE,
+                 ttl: float = config.POKEAPI_CACHE_TTL, negative_ttl: float = config.POKEAPI_NEGATIVE_TTL,
+                 base_url: str = POKEAPI_URL):
+        self.path = path
+        self.base_url = base_url
+        self.cache = TTLCache(maxsize, ttl)
+        self.misses = TTLCache(maxsize, negative_ttl)
+        self._lookups = SingleFlight()
+        self._session = None
+        self._dirty = False
+        self._save_task = None
+        self._save_lock = asyncio.Lock()  # ✅ One cache writer at a time
+
+    @staticmethod
+    def _key(name_or_id):
+        """Normalizes a lookup so "Pikachu ", "pikachu", "025" and "25" share one cache entry."""
+        key = str(name_or_id).strip().lower()
+        return str(int(key)) if key.isdigit() else key
+
+    async def get_pokemon(self, name_or_id):
+        """Returns a PokemonRecord by name or National Dex id, or None if it doesn't exist."""
+        key = self._key(name_or_id)
+        record = self.cache.get(key)
+        if record is not None:
+            return record
+        if key in self.misses:
+            return None  # ✅ Known typo, don't ask PokéAPI again yet
+        return await self._lookups.do(key, lambda: self._fetch(key))
+
+    async def _fetch(self, key):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15), trace_configs=[http_trace_config("pokeapi")]
+            )
+        try:
+            async with self._session.get(f"{self.base_url}{key}") as response:
+                if response.status == 404:
+                    self.misses.set(key, True)
+                    return None
+                if response.status != 200:
+                    return None  # Transient failure: don't cache it
+                record = PokemonRecord.from_api(await response.json())
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None  # ✅ Fail safely if API is down
+
+        # ✅ Cache under the lookup key, the name and the id so any of them hits next time
+        aliases = {key, self._key(record.name)}
+        if record.id is not None:
+            aliases.add(self._key(record.id))
+        for alias in aliases:
+            self.cache.set(alias, record)
+        self._dirty = True
+        return record
+
+    def _read_file(self):
+        with open(self.path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def _write_file(self, entries):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(entries, handle, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+    async def load(self):
+        """Warms the cache from disk and starts periodic saving."""
+        if os.path.exists(self.path):
+            try:
+                entries = await asyncio.to_thread(self._read_file)
+            except (OSError, ValueError):
+                entries = []
+            now = time.time()
+            for key, row, expires_at in entries:
+                if expires_at > now:
+                    self.cache.set(key, PokemonRecord.from_row(row), ttl=expires_at - now)
+            print(f"✅ PokéAPI cache warmed with {len(self.cache)} entries.")
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._save_loop())
+
+    async def save(self):
+        """Persists the live cache entries if anything changed."""
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            now = time.time()
+            entries = [[key, record.to_row(), now + seconds_left] for key, record, seconds_left in self.cache.items()]
+            try:
+                await asyncio.to_thread(self._write_file, entries)
+            except (OSError, asyncio.CancelledError):
+                self._dirty = True  # ✅ Still unsaved: retried next interval (or by close())
+                raise
+
+    async def _save_loop(self):
+        while True:
+            await asyncio.sleep(SAVE_INTERVAL)
+            try:
+                await self.save()
+            except OSError as e:
+                print(f"⚠️ PokéAPI cache save failed, will retry: {e}")
+
+    async def close(self):
+        """Saves the cache and closes the HTTP session."""
+        if self._save_task:
+            async with self._save_lock:  # ✅ Never cancel a save half-way through its write
+                self._save_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._save_task
+            self._save_task = None
+        try:
+            await self.save()
+        except OSError as e:
+            print(f"⚠️ PokéAPI cache save failed: {e}")
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,126 @@
+import asyncio
+import random
+
+import aiohttp
+
+import config
+from metrics import http_trace_config
+from utils import SingleFlight
+
+POKEMON_TCG_API_URL = "https://api.pokemontcg.io/v2"
+PAGE_SIZE = 250
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TCGAPIError(Exception):
+    """Raised when the Pokémon TCG API rejects a request or keeps failing after all retries."""
+
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status  # HTTP status of the last response, if there was one
+
+
+class TCGClient:
+    """Async Pokémon TCG API client shared by the whole bot.
+
+    Owns one pooled `aiohttp` session, caps the number of in-flight requests so
+    we stay inside the API key's quota, retries transient failures with
+    exponential backoff and merges concurrent lookups of the same card.
+    """
+
+    def __init__(self, api_key: str = config.POKEMON_TCG_API_KEY,
+                 max_concurrency: int = config.TCG_MAX_CONCURRENCY,
+                 max_retries: int = config.TCG_MAX_RETRIES, base_url: str = POKEMON_TCG_API_URL):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._session = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._card_lookups = SingleFlight()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared HTTP session, created on first use."""
+        if self._session is None or self._session.closed:
+            headers = {"X-Api-Key": self.api_key} if self.api_key else {}
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=60, connect=10),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency * 2, ttl_dns_cache=300),
+                trace_configs=[http_trace_config("tcg")],
+            )
+        return self._session
+
+    async def close(self):
+        """Closes the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request(self, path: str, params: dict = None):
+        """GETs an API path, returning the decoded JSON body or None on 404."""
+        url = f"{self.base_url}/{path}"
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    async with self.session.get(url, params=params) as response:
+                        if response.status == 404:
+                            return None
+                        if response.status not in RETRY_STATUSES:
+                            if response.status >= 400:
+                                # ✅ Bad request or rejected API key: retrying won't help
+                                raise TCGAPIError(
+                                    f"❌ Pokémon TCG API rejected {path}: HTTP {response.status}", response.status
+                                )
+                            try:
+                                return await response.json()
+                            except (aiohttp.ContentTypeError, ValueError) as e:
+                                raise TCGAPIError(
+                                    f"❌ Pokémon TCG API sent an unreadable body for {path}", response.status
+                                ) from e
+                        retry_after = response.headers.get("Retry-After")
+                        error = TCGAPIError(f"{path} returned HTTP {response.status}", response.status)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = e
+
+            if attempt == self.max_retries:
+                break
+            # ✅ Exponential backoff with jitter, honouring Retry-After when the API sends it
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else 0.5 * 2 ** attempt
+            await asyncio.sleep(delay + random.uniform(0, 0.25))
+
+        raise TCGAPIError(f"❌ Pokémon TCG API request failed: {path}", getattr(error, "status", None)) from error
+
+    async def _paginate(self, endpoint: str, params: dict = None):
+        """Fetches every page of a list endpoint."""
+        results, page = [], 1
+        while True:
+            body = await self._request(endpoint, {**(params or {}), "page": page, "pageSize": PAGE_SIZE})
+            if not body:
+                return results
+            results.extend(body.get("data", []))
+            if page * PAGE_SIZE >= body.get("totalCount", 0):
+                return results
+            page += 1
+
+    async def get_card(self, card_id: str):
+        """Fetches a single card payload, or None if the card doesn't exist."""
+        async def fetch():
+            body = await self._request(f"cards/{card_id}")
+            return body.get("data") if body else None
+
+        return await self._card_lookups.do(card_id, fetch)
+
+    async def search_cards(self, query: str):
+        """Returns every card matching a Lucene-style `q` query."""
+        return await self._paginate("cards", {"q": query})
+
+    async def get_sets(self):
+        """Returns every set, including its `updatedAt` timestamp."""
+        return await self._paginate("sets")
+
+    async def get_set_cards(self, set_id: str):
+        """Returns every card in a set."""
+        return await self.search_cards(f"set.id:{set_id}")
@@ -0,0 +1 @@
+from .browser import CollectionBrowser, SORT_KEYS
@@ -0,0 +1,64 @@
+import asyncio
+import math
+
+# Browse order -> the user_cards column it is keyed on (ties broken by card_id)
+SORT_KEYS = {"name": "card_name", "set": "set_id", "date": "first_obtained"}
+
+
+class CollectionBrowser:
+    """Keyset-paginated walk through one user's collection.
+
+    Only the cursor in front of each visited page is kept, so every page,
+    forwards or back, is one small indexed query however big the collection
+    is, and no page ever needs an OFFSET or a COUNT(*).
+    """
+
+    def __init__(self, db, user_id: int, order: str = "name", page_size: int = 10):
+        self.db = db
+        self.user_id = user_id
+        self.order = order
+        self.page_size = page_size
+        self.cursors = [None]  # Cursor in front of each page visited so far; the last one is on screen
+        self.rows = []
+        self.has_next = False
+        self.unique_cards = 0
+        self.total_cards = 0
+
+    @property
+    def page(self) -> int:
+        return len(self.cursors)
+
+    @property
+    def pages(self) -> int:
+        return max(1, math.ceil(self.unique_cards / self.page_size))
+
+    @property
+    def has_previous(self) -> bool:
+        return len(self.cursors) > 1
+
+    async def _load(self):
+        # ✅ One extra row tells us whether there is a next page without counting
+        rows = await self.db.browse_cards(self.user_id, self.order, self.cursors[-1], self.page_size + 1)
+        self.has_next = len(rows) > self.page_size
+        self.rows = rows[:self.page_size]
+
+    async def open(self):
+        """Loads the totals and the first page concurrently."""
+        (self.unique_cards, self.total_cards), _ = await asyncio.gather(self.db.get_card_totals(self.user_id), self._load())
+
+    async def next(self):
+        if self.has_next:
+            last = self.rows[-1]
+            self.cursors.append((last[SORT_KEYS[self.order]], last["card_id"]))
+            await self._load()
+
+    async def previous(self):
+        if self.has_previous:
+            self.cursors.pop()
+            await self._load()
+
+    async def sort(self, order: str):
+        """Switches the browse order and goes back to the first page."""
+        self.order = order
+        self.cursors = [None]
+        await self._load()
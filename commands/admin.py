@@ -0,0 +1,112 @@
+import io
+import time
+import discord
+from discord.ext import commands
+import config
+from metrics import COMMAND_SECONDS, COMMAND_ERRORS, DB_SECONDS, DB_ERRORS, HTTP_SECONDS, HTTP_ERRORS
+
+class Admin(commands.Cog):
+    """Owner-only diagnostics for the running bot."""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    async def cog_check(self, ctx):
+        """Every command in this cog is restricted to the bot owner."""
+        return await self.bot.is_owner(ctx.author)
+
+    @commands.command(name="queue")
+    async def queue(self, ctx):
+        """Shows outbound message queue depth and wait times."""
+        stats = self.bot.outbound.stats()
+        embed = discord.Embed(title="📬 Outbound Queue", color=discord.Color.dark_teal())
+        embed.add_field(name="Depth", value=f"{stats['depth']} in {stats['channels']} channel(s)\nDeepest: {stats['max_channel_depth']}", inline=True)
+        embed.add_field(name="Wait", value=f"p50 {stats['wait_p50'] * 1000:.0f} ms\np95 {stats['wait_p95'] * 1000:.0f} ms\nmax {stats['wait_max'] * 1000:.0f} ms", inline=True)
+        embed.add_field(name="Totals", value=f"Sent {stats['sent']}\nMerged {stats['merged']}\nDropped {stats['dropped']}", inline=True)
+        await self.bot.outbound.send(ctx, embed=embed)
+
+    @staticmethod
+    def latency_lines(histogram, errors, limit: int = 8):
+        """One line per label set, busiest first: count, p50/p95 and errors."""
+        busiest = sorted(histogram.series, key=lambda labels: histogram.count(*labels), reverse=True)[:limit]
+        lines = []
+        for labels in busiest:
+            failed = errors.get(*labels)
+            lines.append(
+                f"`{' '.join(labels)}` ×{histogram.count(*labels)} · "
+                f"p50 {histogram.quantile(0.5, *labels) * 1000:.0f} ms · p95 {histogram.quantile(0.95, *labels) * 1000:.0f} ms"
+                + (f" · ❌ {failed:g}" if failed else "")
+            )
+        return "\n".join(lines) or "No data yet."
+
+    @commands.command(name="stats")
+    async def stats(self, ctx):
+        """Shows command, database and HTTP latency since startup."""
+        embed = discord.Embed(title="📊 Latency", color=discord.Color.dark_teal())
+        embed.add_field(name="Commands", value=self.latency_lines(COMMAND_SECONDS, COMMAND_ERRORS), inline=False)
+        embed.add_field(name="Database", value=self.latency_lines(DB_SECONDS, DB_ERRORS), inline=False)
+        embed.add_field(name="HTTP", value=self.latency_lines(HTTP_SECONDS, HTTP_ERRORS), inline=False)
+        await self.bot.outbound.send(ctx, embed=embed)
+
+    @commands.command(name="stalls")
+    async def stalls(self, ctx, count: int = 5):
+        """Lists recent event loop stalls and attaches the blocking stacks."""
+        stalls = self.bot.watchdog.recent(count)
+        if not stalls:
+            return await self.bot.outbound.send(ctx, f"✅ No event loop stalls over {self.bot.watchdog.threshold * 1000:.0f} ms recorded.")
+
+        lines, dump = [], []
+        for stall in stalls:
+            blocked = stall.duration if stall.duration is not None else stall.lag
+            when = time.strftime("%H:%M:%S", time.gmtime(stall.at))
+            lines.append(f"`{when}` {blocked * 1000:.0f} ms · {f'!{stall.command}' if stall.command else stall.task or 'no task'}")
+            dump.append(f"=== {when} UTC, blocked {blocked * 1000:.0f} ms, command={stall.command}, task={stall.task}\n{stall.stack}")
+
+        embed = discord.Embed(title="🐢 Event Loop Stalls", description="\n".join(lines), color=discord.Color.orange())
+        stacks = discord.File(io.BytesIO("\n".join(dump).encode()), filename="stalls.txt")
+        await self.bot.outbound.send(ctx, embed=embed, file=stacks)
+
+    @commands.command(name="dbstats")
+    async def dbstats(self, ctx):
+        """Shows connection pool usage and read-cache hit ratio."""
+        pool = self.bot.db.pool_stats()
+        cache = self.bot.db.cache_stats()
+        embed = discord.Embed(title="🗄️ Database", color=discord.Color.dark_teal())
+        embed.add_field(name="Pool", value=f"{pool['size']}/{pool['max']} open\n{pool['idle']} idle", inline=True)
+        embed.add_field(name="Cache", value=f"{cache['size']}/{cache['maxsize']} entries\nHit ratio {cache['hit_ratio']:.1%}\nHits {cache['hits']} · Misses {cache['misses']}", inline=True)
+        await self.bot.outbound.send(ctx, embed=embed)
+
+    @commands.command(name="shards")
+    async def shards(self, ctx):
+        """Shows latency and status for every shard run by this worker."""
+        guilds = {}
+        for guild in self.bot.guilds:
+            guilds[guild.shard_id] = guilds.get(guild.shard_id, 0) + 1
+
+        embed = discord.Embed(
+            title=f"🧩 Worker {config.WORKER_ID} · {len(self.bot.shards)} of {self.bot.shard_count} shard(s)",
+            color=discord.Color.dark_teal()
+        )
+        for shard_id, shard in sorted(self.bot.shards.items()):
+            status = "🔴 closed" if shard.is_closed() else ("🟡 limited" if shard.is_ws_ratelimited() else "🟢 online")
+            embed.add_field(
+                name=f"Shard {shard_id}",
+                value=f"{status}\n{shard.latency * 1000:.0f} ms\n{guilds.get(shard_id, 0)} guild(s)",
+                inline=True
+            )
+        feed = self.bot.db.feed.stats()
+        embed.set_footer(text=f"Change feed {'connected' if feed['active'] else 'offline'} · sent {feed['sent']} · received {feed['received']}")
+        await self.bot.outbound.send(ctx, embed=embed)
+
+    @commands.command(name="synccatalog")
+    async def synccatalog(self, ctx):
+        """Refreshes the card catalog from the API and tells the other workers to reload it."""
+        changed = await self.bot.catalog.sync()
+        if changed:
+            self.bot.db.feed.publish("catalog")
+            await self.bot.db.sync_cards(self.bot.catalog.where())  # ✅ Keeps collection sorting in step
+        await self.bot.outbound.send(ctx, f"✅ Catalog synced: {changed} set(s) added, refreshed or removed.")
+
+async def setup(bot):
+    """Loads the Admin cog into the bot."""
+    await bot.add_cog(Admin(bot))
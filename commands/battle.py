@@ -1,110 +1,119 @@
-import random
+import asyncio
+
 import discord
 from discord import Embed
 from discord.ext import commands
-from database import Database  # ✅ Correct Import
-from pokemontcgsdk import Card  # ✅ Import Pokémon TCG SDK
+from battles import CHALLENGER, OPPONENT, resolve
+from events import BATTLE_WON
 
-# ✅ Initialize the database instance
-db = Database()
+ODDS_SIMULATIONS = 5_000
 
 class Battle(commands.Cog):
     """Handles Pokémon battles between users."""
 
     def __init__(self, bot):
         self.bot = bot
+        self.db = bot.db  # ✅ Shared connection pool owned by the bot
+        self.engine = bot.battle_engine  # ✅ Resolves battles from catalog stats, no network
+
+    @staticmethod
+    def describe(combatant, damage_dealt):
+        return (
+            f"**{combatant.name}**\n"
+            f"❤️ HP {combatant.hp}\n"
+            f"💥 {combatant.attack}: {damage_dealt} damage"
+        )
 
-    async def cog_load(self):
-        """Connect to the database when the cog loads."""
-        await db.connect()
-
-    async def cog_unload(self):
-        """Disconnect from the database when the cog unloads."""
-        await db.disconnect()
+    async def pools(self, challenger_id: int, opponent_id: int):
+        """Both trainers' battle pools; the two collections are read concurrently."""
+        counts = await asyncio.gather(self.db.get_user_card_counts(challenger_id), self.db.get_user_card_counts(opponent_id))
+        return [self.engine.pool(card_counts) for card_counts in counts]
 
     @commands.command(name="battle")
     async def battle(self, ctx: commands.Context, opponent: discord.Member):
-        """Initiates a battle between two users based on their Pokémon stats."""
+        """Battles a random Pokémon from each trainer's collection."""
         if ctx.author.id == opponent.id:
-            await ctx.send("❌ You cannot battle yourself!")
+            await self.bot.outbound.send(ctx, "❌ You cannot battle yourself!")
             return
 
-        challenger_id = str(ctx.author.id)
-        opponent_id = str(opponent.id)
+        challenger_id = ctx.author.id
+        opponent_id = opponent.id
 
         # Fetch Pokémon for both players
-        challenger_pokemon = await db.get_user_pokemon(challenger_id)
-        opponent_pokemon = await db.get_user_pokemon(opponent_id)
+        challenger_pool, opponent_pool = await self.pools(challenger_id, opponent_id)
 
-        if not challenger_pokemon:
-            await ctx.send(f"⚠️ {ctx.author.mention}, you have no Pokémon to battle with!")
-            return
-        if not opponent_pokemon:
-            await ctx.send(f"⚠️ {opponent.mention} has no Pokémon to battle with!")
+        if not challenger_pool:
+            await self.bot.outbound.send(ctx, f"⚠️ {ctx.author.mention}, you have no Pokémon to battle with!")
             return
-
-        # Select random Pokémon for battle
-        challenger_pokemon_data = random.choice(challenger_pokemon)
-        opponent_pokemon_data = random.choice(opponent_pokemon)
-
-        challenger_pokemon_id = challenger_pokemon_data.get("pokemon_id")
-        opponent_pokemon_id = opponent_pokemon_data.get("pokemon_id")
-
-        # Fetch Pokémon details from API
-        try:
-            challenger_pokemon_api = Card.find(challenger_pokemon_id)
-            opponent_pokemon_api = Card.find(opponent_pokemon_id)
-        except Exception:
-            await ctx.send("❌ Error retrieving Pokémon data from the API.")
+        if not opponent_pool:
+            await self.bot.outbound.send(ctx, f"⚠️ {opponent.mention} has no Pokémon to battle with!")
             return
 
-        if not challenger_pokemon_api or not opponent_pokemon_api:
-            await ctx.send("❌ Could not find Pokémon details. Check Pokémon IDs.")
-            return
+        # ✅ Odds before the battle: both sides draw from their whole collection
+        challenger_odds, opponent_odds, _ = self.engine.odds(challenger_pool, opponent_pool, ODDS_SIMULATIONS)
 
-        # Battle calculations
-        challenger_attack = random.randint(30, 100)  # Using random values for now
-        challenger_defense = random.randint(20, 80)
-        opponent_attack = random.randint(30, 100)
-        opponent_defense = random.randint(20, 80)
-
-        challenger_damage = max(1, challenger_attack - opponent_defense)
-        opponent_damage = max(1, opponent_attack - challenger_defense)
+        # Select random Pokémon for battle (weighted by copies owned)
+        challenger_pokemon = self.engine.pick(challenger_pool)
+        opponent_pokemon = self.engine.pick(opponent_pool)
+        result = resolve(challenger_pokemon, opponent_pokemon)
 
         # Determine winner
-        if challenger_damage > opponent_damage:
-            winner = ctx.author
-            loser = opponent
-            await db.update_user_wins(challenger_id)
-            await db.update_user_losses(opponent_id)
-        elif opponent_damage > challenger_damage:
-            winner = opponent
-            loser = ctx.author
-            await db.update_user_wins(opponent_id)
-            await db.update_user_losses(challenger_id)
+        if result.winner == CHALLENGER:
+            winner, loser = ctx.author, opponent
+        elif result.winner == OPPONENT:
+            winner, loser = opponent, ctx.author
         else:
-            winner = None
+            winner = loser = None
+
+        if winner:
+            await self.db.record_battle(winner.id, loser.id)
+            self.bot.events.emit(BATTLE_WON, winner.id, ctx.guild.id if ctx.guild else None)
 
         # Embed battle result
         embed = Embed(title="🔥 Pokémon Battle! 🔥", color=discord.Color.gold())
-        embed.set_thumbnail(url=challenger_pokemon_api.images.large)  # ✅ Pokémon image
+        embed.description = (
+            f"📊 Odds before the battle: {ctx.author.display_name} **{challenger_odds:.0%}** — "
+            f"{opponent.display_name} **{opponent_odds:.0%}**"
+        )
+        if challenger_pokemon.image:
+            embed.set_thumbnail(url=challenger_pokemon.image)  # ✅ Pokémon image
         embed.add_field(
             name=f"⚔️ {ctx.author.display_name}'s Pokémon",
-            value=f"**{challenger_pokemon_api.name}**\nATK: {challenger_attack}, DEF: {challenger_defense}",
+            value=self.describe(challenger_pokemon, result.challenger_damage),
             inline=True,
         )
         embed.add_field(
             name=f"⚔️ {opponent.display_name}'s Pokémon",
-            value=f"**{opponent_pokemon_api.name}**\nATK: {opponent_attack}, DEF: {opponent_defense}",
+            value=self.describe(opponent_pokemon, result.opponent_damage),
             inline=True,
         )
 
         if winner:
-            embed.add_field(name="🏆 Winner!", value=f"**{winner.mention}** wins!", inline=False)
+            embed.add_field(
+                name="🏆 Winner!",
+                value=f"**{winner.mention}** wins in {result.turns} turn{'s' if result.turns != 1 else ''}!",
+                inline=False,
+            )
         else:
             embed.add_field(name="⚔️ Result", value="It's a **draw**!", inline=False)
 
-        await ctx.send(embed=embed)
+        await self.bot.outbound.send(ctx, embed=embed)
+
+    @commands.command(name="odds")
+    async def odds(self, ctx: commands.Context, opponent: discord.Member):
+        """Shows the win odds of a battle against another trainer without fighting it."""
+        challenger_pool, opponent_pool = await self.pools(ctx.author.id, opponent.id)
+        if not challenger_pool or not opponent_pool:
+            await self.bot.outbound.send(ctx, "⚠️ Both trainers need Pokémon to calculate battle odds!")
+            return
+
+        challenger_odds, opponent_odds, draw_odds = self.engine.odds(challenger_pool, opponent_pool, ODDS_SIMULATIONS)
+        embed = Embed(title="📊 Battle Odds", color=discord.Color.blurple())
+        embed.add_field(name=ctx.author.display_name, value=f"**{challenger_odds:.1%}**", inline=True)
+        embed.add_field(name=opponent.display_name, value=f"**{opponent_odds:.1%}**", inline=True)
+        embed.add_field(name="Draw", value=f"**{draw_odds:.1%}**", inline=True)
+        embed.set_footer(text=f"Based on {ODDS_SIMULATIONS:,} simulated battles.")
+        await self.bot.outbound.send(ctx, embed=embed)
 
 async def setup(bot):
     """Loads the Battle cog into the bot."""
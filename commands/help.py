@@ -17,18 +17,22 @@ class HelpCommand(commands.Cog):
             color=0xFFD700
         )
 
-        embed.add_field(name="📦 `!openpack`", value="Opens a Pokémon card pack.", inline=False)
+        embed.add_field(name="📦 `!openpack [count]`", value="Opens one or more Pokémon card packs.", inline=False)
         embed.add_field(name="⚔ `!battle @user`", value="Battle another trainer using your Pokémon.", inline=False)
+        embed.add_field(name="📊 `!odds @user`", value="See your chances before a battle.", inline=False)
         embed.add_field(name="📜 `!missions`", value="Check your available missions.", inline=False)
-        embed.add_field(name="🏆 `!leaderboard`", value="View the top trainers.", inline=False)
+        embed.add_field(name="🎁 `!claim <mission id>`", value="Claim the reward for a completed mission.", inline=False)
+        embed.add_field(name="🏆 `!leaderboard [page]`", value="View this server's top trainers (`!globalleaderboard` for everyone).", inline=False)
+        embed.add_field(name="📈 `!rank [@user]`", value="See your server and global rank.", inline=False)
         embed.add_field(name="👤 `!profile`", value="Check your trainer profile and stats.", inline=False)
-        embed.add_field(name="🎲 `!wonderpick`", value="Pick a random Pokémon with some luck involved!", inline=False)
-        embed.add_field(name="🔄 `!trade @user [pokemon_name]`", value="Trade Pokémon with another trainer.", inline=False)
-        embed.add_field(name="📖 `!pokemon [name]`", value="View details of a specific Pokémon.", inline=False)
+        embed.add_field(name="🎲 `!wonderpick [@user]`", value="Win a random card from someone's latest pack (or any recent pack)!", inline=False)
+        embed.add_field(name="🔄 `!trade @user [my_cards] [their_cards]`", value="Trade cards with another trainer (comma-separated card ids).", inline=False)
+        embed.add_field(name="📖 `!pokedex <name or id>`", value="View details of a specific Pokémon.", inline=False)
+        embed.add_field(name="🗂️ `!mypokemon [name|set|date]`", value="Browse your card collection page by page.", inline=False)
 
         embed.set_footer(text="Use these commands to become the ultimate Pokémon trainer!")
 
-        await ctx.send(embed=embed)
+        await self.bot.outbound.send(ctx, embed=embed)
 
 # Add this cog to the bot
 async def setup(bot):
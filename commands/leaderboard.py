@@ -1,80 +1,93 @@
 import discord
 from discord.ext import commands
-from database import Database  # ✅ Import the Database class
-from pokemontcgsdk import Card  # ✅ Import Pokémon TCG SDK
+from ranking import GLOBAL_SCOPE
 
-# ✅ Initialize the database instance
-db = Database()
+PAGE_SIZE = 10
 
 class Leaderboard(commands.Cog):
     """Leaderboard command to display the top Pokémon trainers."""
 
     def __init__(self, bot):
         self.bot = bot
+        self.ranking = bot.ranking  # ✅ Standings maintained in memory as events happen
 
-    async def cog_load(self):
-        """Connect to the database when the cog loads."""
-        await db.connect()
+    def trainer_name(self, ctx, user_id: int):
+        """Resolves a user id to a display name without any API calls."""
+        member = ctx.guild.get_member(user_id) if ctx.guild else None
+        user = member or self.bot.get_user(user_id)
+        return user.display_name if user else "Unknown Trainer"  # ✅ Unknown if not cached
 
-    async def cog_unload(self):
-        """Disconnect from the database when the cog unloads."""
-        await db.disconnect()
-
-    @commands.command(name="leaderboard")
-    async def leaderboard(self, ctx):
-        """Displays the top trainers based on Pokémon collection count and battles won."""
-
-        # ✅ Fetch leaderboard data safely
-        query = """
-            SELECT u.id, u.username, 
-                   COUNT(up.pokemon_id) AS pokemon_count,
-                   COALESCE(u.battles_won, 0) AS battles_won
-            FROM users u
-            LEFT JOIN user_pokemon up ON u.id = up.user_id
-            GROUP BY u.id, u.username, u.battles_won
-            ORDER BY battles_won DESC, pokemon_count DESC
-            LIMIT 10
-        """
-        rows = await db.fetch_all(query)
+    async def send_page(self, ctx, scope: str, title: str, page: int):
+        """Sends one page of a leaderboard."""
+        total = self.ranking.size(scope)
+        pages = max(1, -(-total // PAGE_SIZE))
+        page = min(max(page, 1), pages)
 
         embed = discord.Embed(
-            title="🏆 Pokémon Leaderboard",
+            title=title,
             description="Top trainers ranked by battles won and Pokémon collected!",
             color=discord.Color.gold()
         )
 
-        if rows:
-            for index, row in enumerate(rows, start=1):
-                username = row["username"] or "Unknown Trainer"  # ✅ NULL-safe username
-                pokemon_count = row["pokemon_count"] or 0
-                battles_won = row["battles_won"] or 0
-
+        standings = self.ranking.page(scope, page, PAGE_SIZE)
+        if standings:
+            for standing in standings:
                 embed.add_field(
-                    name=f"#{index} {username}",
+                    name=f"#{standing.rank} {self.trainer_name(ctx, standing.user_id)}",
                     value=(
-                        f"🏅 Battles Won: **{battles_won}**\n"
-                        f"📦 Pokémon Collected: **{pokemon_count}**"
+                        f"🏅 Battles Won: **{standing.battles_won}**\n"
+                        f"📦 Pokémon Collected: **{standing.cards_collected}**"
                     ),
                     inline=False
                 )
 
-                # ✅ Add Pokémon Image for the top trainer (if available)
-                if index == 1:
-                    first_user_id = row["id"]
-                    user_pokemon = await db.get_user_pokemon(first_user_id)
+            # ✅ Show the top trainer's avatar on the first page
+            if page == 1:
+                top_user = self.bot.get_user(standings[0].user_id)
+                if top_user:
+                    embed.set_thumbnail(url=top_user.display_avatar.url)
+        else:
+            embed.add_field(name="No data yet!", value="Be the first to battle and collect Pokémon!", inline=False)
+
+        mine = self.ranking.standing(scope, ctx.author.id)
+        footer = f"Page {page}/{pages}"
+        if mine:
+            footer += f" • Your rank: #{mine.rank} of {total}"
+        embed.set_footer(text=footer)
 
-                    if user_pokemon:
-                        top_pokemon_id = user_pokemon[0]["pokemon_id"]
-                        try:
-                            pokemon_card = Card.find(top_pokemon_id)
-                            embed.set_thumbnail(url=pokemon_card.images.large)
-                        except Exception:
-                            pass  # Fallback if Pokémon API fails
+        await self.bot.outbound.send(ctx, embed=embed)
 
+    @commands.command(name="leaderboard")
+    async def leaderboard(self, ctx, page: int = 1):
+        """Displays this server's top trainers (or the global board in DMs)."""
+        if ctx.guild:
+            await self.send_page(ctx, str(ctx.guild.id), f"🏆 {ctx.guild.name} Leaderboard", page)
         else:
-            embed.add_field(name="No data yet!", value="Be the first to battle and collect Pokémon!", inline=False)
+            await self.send_page(ctx, GLOBAL_SCOPE, "🌍 Global Pokémon Leaderboard", page)
+
+    @commands.command(name="globalleaderboard")
+    async def global_leaderboard(self, ctx, page: int = 1):
+        """Displays the top trainers across every server."""
+        await self.send_page(ctx, GLOBAL_SCOPE, "🌍 Global Pokémon Leaderboard", page)
+
+    @commands.command(name="rank")
+    async def rank(self, ctx, member: discord.Member = None):
+        """Shows a trainer's server and global rank."""
+        member = member or ctx.author
+        embed = discord.Embed(title=f"📈 {member.display_name}'s Rank", color=discord.Color.gold())
+
+        scopes = [(str(ctx.guild.id), "🏠 Server")] if ctx.guild else []
+        scopes.append((GLOBAL_SCOPE, "🌍 Global"))
+        for scope, label in scopes:
+            standing = self.ranking.standing(scope, member.id)
+            value = (
+                f"#{standing.rank} of {self.ranking.size(scope)}\n"
+                f"🏅 {standing.battles_won} wins • 📦 {standing.cards_collected} cards"
+                if standing else "Unranked"
+            )
+            embed.add_field(name=label, value=value, inline=True)
 
-        await ctx.send(embed=embed)
+        await self.bot.outbound.send(ctx, embed=embed)
 
 # ✅ Load the Leaderboard Cog
 async def setup(bot):
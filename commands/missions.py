@@ -1,87 +1,82 @@
 import discord
 from discord.ext import commands
-from database import Database  # ✅ Correct Import
-from pokemontcgsdk import Card  # ✅ Pokémon TCG SDK for reward Pokémon
-
-# ✅ Initialize the database instance
-db = Database()
+from clients import TCGAPIError
+from events import CARD_OBTAINED
 
 class Missions(commands.Cog):
     """Handles player missions and rewards."""
 
     def __init__(self, bot):
         self.bot = bot
-
-    async def cog_load(self):
-        """Connect to the database when the cog loads."""
-        await db.connect()
-
-    async def cog_unload(self):
-        """Disconnect from the database when the cog unloads."""
-        await db.disconnect()
+        self.engine = bot.missions  # ✅ Progress advanced by gameplay events
 
     @commands.command(name="missions")
     async def missions(self, ctx):
         """Displays the user's available missions and progress."""
-        user_id = str(ctx.author.id)  # Ensure IDs are strings
-        missions = await db.get_user_missions(user_id)  # ✅ Fetch missions safely
+        user_id = ctx.author.id
+        statuses = await self.engine.statuses(user_id)
 
         embed = discord.Embed(title="📜 Missions", color=discord.Color.blue())
 
-        if not missions:
+        if not statuses:
             embed.description = "You have no active missions! 🎯"
             embed.color = discord.Color.red()
         else:
             embed.description = "Here are your current missions:"
-            for mission in missions:
-                status = "✅ **Completed**" if mission.get("completed") else f"🔄 **Progress:** {mission.get('progress', 0)}/{mission.get('goal', 1)}"
+            for status in statuses:
+                mission = status.mission
+                if status.claimed:
+                    state = "🎁 **Claimed**"
+                elif status.completed:
+                    state = f"✅ **Completed** — use `!claim {mission.id}`"
+                else:
+                    state = f"🔄 **Progress:** {status.progress}/{mission.goal}"
                 embed.add_field(
-                    name=f"🏆 {mission.get('name', 'Unknown Mission')}",
-                    value=f"📖 {mission.get('description', 'No description')}\n**Status:** {status}",
+                    name=f"🏆 #{mission.id} {mission.name}",
+                    value=f"📖 {mission.description}\n**Status:** {state}",
                     inline=False
                 )
 
-        await ctx.send(embed=embed)
+        await self.bot.outbound.send(ctx, embed=embed)
 
     @commands.command(name="claim")
     async def claim(self, ctx, mission_id: int):
         """Allows the user to claim rewards for completed missions."""
-        user_id = str(ctx.author.id)  # Ensure IDs are strings
+        user_id = ctx.author.id
 
-        # ✅ Fetch mission to check if it exists
-        missions = await db.get_user_missions(user_id)
-        mission = next((m for m in missions if m.get("id") == mission_id), None)
-
-        if not mission:
+        # ✅ Check the mission exists
+        if mission_id not in self.engine.missions:
             embed = discord.Embed(title="🎁 Mission Reward", description="❌ Invalid mission ID!", color=discord.Color.red())
-            await ctx.send(embed=embed)
+            await self.bot.outbound.send(ctx, embed=embed)
             return
 
-        if not mission.get("completed"):
-            embed = discord.Embed(title="🎁 Mission Reward", description="⚠️ You must complete the mission first!", color=discord.Color.orange())
-            await ctx.send(embed=embed)
+        # ✅ Atomic and idempotent: the reward is granted at most once
+        reward = await self.engine.claim(user_id, mission_id)
+        if not reward:
+            status = next(s for s in await self.engine.statuses(user_id) if s.mission.id == mission_id)
+            message = "⚠️ You already claimed this reward!" if status.claimed else "⚠️ You must complete the mission first!"
+            embed = discord.Embed(title="🎁 Mission Reward", description=message, color=discord.Color.orange())
+            await self.bot.outbound.send(ctx, embed=embed)
             return
 
-        # ✅ Claim reward and fetch Pokémon reward
-        reward = await db.claim_mission_reward(user_id, mission_id)  # ✅ Safe DB call
-        pokemon_reward = None
+        self.bot.events.emit(CARD_OBTAINED, user_id, ctx.guild.id if ctx.guild else None)
 
-        if reward:
-            try:
-                pokemon_reward = Card.find(reward)  # ✅ Fetch Pokémon TCG card
-            except Exception:
-                pass  # Fail gracefully if Pokémon API is unavailable
+        pokemon_reward = None
+        try:
+            pokemon_reward = await self.bot.catalog.find(reward)  # ✅ Non-blocking card lookup
+        except TCGAPIError:
+            pass  # Fail gracefully if Pokémon API is unavailable
 
         embed = discord.Embed(title="🎁 Mission Reward", color=discord.Color.green())
         
         if pokemon_reward:
             embed.description = f"✅ You claimed **{pokemon_reward.name}**!"
-            embed.set_thumbnail(url=pokemon_reward.images.large)
+            embed.set_thumbnail(url=pokemon_reward.image_large)
         else:
             embed.description = f"✅ You claimed **{reward}**!"
 
-        await ctx.send(embed=embed)
-        await ctx.message.add_reaction("🎉")  # ✅ Add celebration reaction
+        await self.bot.outbound.send(ctx, embed=embed)
+        self.bot.outbound.react(ctx.message, "🎉")
 
 async def setup(bot):
     """Loads the Missions cog into the bot."""
@@ -1,79 +1,77 @@
+import io
 import discord
-import random
-import aiohttp
+from collections import Counter
 from discord.ext import commands
-from database import Database  # ✅ Correct Import
-from pokemontcgsdk import Card  # ✅ Pokémon TCG SDK
-
-# ✅ Initialize the database instance
-db = Database()
+from packs import PackOpener, MAX_PACKS_PER_OPEN
+from events import PACK_OPENED, CARD_OBTAINED
 
 class OpenPack(commands.Cog):
     """Handles Pokémon pack openings."""
 
     def __init__(self, bot):
         self.bot = bot
-
-    async def cog_load(self):
-        """Connect to the database when the cog loads."""
-        await db.connect()
-
-    async def cog_unload(self):
-        """Disconnect from the database when the cog unloads."""
-        await db.disconnect()
-
-    async def fetch_cards(self):
-        """Fetch a random set of Pokémon cards using the Pokémon TCG SDK."""
-        try:
-            cards = Card.where(pageSize=250)  # ✅ Fetch 250 random cards
-            return cards
-        except Exception:
-            return None  # ✅ Fail safely if API is down
+        self.db = bot.db  # ✅ Shared connection pool owned by the bot
+        self.opener = PackOpener(bot.pack_generator, bot.db, bot.recent_packs)
 
     @commands.command(name="openpack")
-    async def open_pack(self, ctx):
-        """Opens a random Pokémon pack and gives the user 5 cards."""
-        user_id = str(ctx.author.id)  # ✅ Ensure user ID is a string
-        user = await db.get_user_collection(user_id)
-
-        if user is None:
-            await ctx.send("❌ You need to register first using `/start`.")
+    async def open_pack(self, ctx, count: int = 1):
+        """Opens one or more random Pokémon packs, 5 cards each."""
+        if not 1 <= count <= MAX_PACKS_PER_OPEN:
+            await self.bot.outbound.send(ctx, f"⚠️ You can open between 1 and {MAX_PACKS_PER_OPEN} packs at once.")
             return
 
-        cards = await self.fetch_cards()
-        if not cards or len(cards) < 5:
-            await ctx.send("⚠️ Failed to retrieve enough cards. Please try again later.")
+        user_id = ctx.author.id
+        packs = await self.opener.open(user_id, count)  # ✅ One round trip for every pack
+        if not packs:
+            await self.bot.outbound.send(ctx, "⚠️ The card catalog isn't loaded yet. Please try again later.")
             return
 
-        selected_cards = random.sample(cards, 5)  # ✅ Select 5 random cards
+        guild_id = ctx.guild.id if ctx.guild else None
+        self.bot.events.emit(PACK_OPENED, user_id, guild_id, count=len(packs))
+        self.bot.events.emit(CARD_OBTAINED, user_id, guild_id, count=sum(len(pack.cards) for pack in packs))
+
+        if count == 1:
+            await self.send_single_pack(ctx, packs[0])
+        else:
+            await self.send_pack_summary(ctx, packs)
 
+        self.bot.outbound.react(ctx.message, "🎉")  # ✅ Celebration Reaction
+
+    async def send_single_pack(self, ctx, pack):
+        """Shows every card of a single opened pack."""
         main_embed = discord.Embed(
             title=f"🎉 {ctx.author.name} opened a Pokémon Pack!",
             description="Here are your new Pokémon cards:",
             color=discord.Color.blue()
         )
 
-        image_urls = []  # ✅ Store image URLs
-        for card in selected_cards:
-            await db.add_card_to_collection(user_id, card.id)  # ✅ Store in DB
+        for card in pack.cards:
             main_embed.add_field(
                 name=f"✨ {card.name}",
                 value=f"🆔 `{card.id}`",
                 inline=True
             )
-            if card.images and "small" in card.images:
-                image_urls.append(card.images["small"])
-
-        await ctx.send(embed=main_embed)
-
-        # ✅ Send images in groups to avoid spam
-        if image_urls:
-            image_embed = discord.Embed(color=discord.Color.blue())
-            for img_url in image_urls:
-                image_embed.set_image(url=img_url)
-                await ctx.send(embed=image_embed)
 
-        await ctx.message.add_reaction("🎉")  # ✅ Celebration Reaction
+        # ✅ All card images in one composite attachment, one message per pack
+        image = await self.bot.pack_renderer.render(pack.cards)
+        if image:
+            main_embed.set_image(url="attachment://pack.png")
+            await self.bot.outbound.send(ctx, embed=main_embed, file=discord.File(io.BytesIO(image), filename="pack.png"))
+        else:
+            await self.bot.outbound.send(ctx, embed=main_embed)
+
+    async def send_pack_summary(self, ctx, packs):
+        """Summarizes a bulk opening in a single embed."""
+        pulls = Counter(card.name for pack in packs for card in pack.cards)
+        lines = [f"✨ **{name}** ×{amount}" if amount > 1 else f"✨ **{name}**" for name, amount in pulls.most_common()]
+
+        embed = discord.Embed(
+            title=f"🎉 {ctx.author.name} opened {len(packs)} Pokémon Packs!",
+            description="\n".join(lines)[:4000],
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text=f"{sum(pulls.values())} cards added to your collection.")
+        await self.bot.outbound.send(ctx, embed=embed)
 
 async def setup(bot):
     """Loads the OpenPack cog into the bot."""
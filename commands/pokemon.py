@@ -1,37 +1,19 @@
 import discord
-import aiohttp
 from discord.ext import commands
-from database import Database  # ✅ Import the Database class
-
-# ✅ Initialize Database
-db = Database()
-
-POKEAPI_URL = "https://pokeapi.co/api/v2/pokemon/"
+import config
+from collection import CollectionBrowser, SORT_KEYS
 
 class Pokemon(commands.Cog):
     """Handles Pokémon lookups and user collections."""
 
     def __init__(self, bot):
         self.bot = bot
-
-    async def cog_load(self):
-        """Connect to the database when the cog loads."""
-        await db.connect()
-
-    async def cog_unload(self):
-        """Disconnect from the database when the cog unloads."""
-        await db.disconnect()
+        self.db = bot.db  # ✅ Shared connection pool owned by the bot
+        self.sessions = {}  # user_id -> live CollectionView
 
     async def get_pokemon_data(self, name_or_id: str):
-        """Fetch Pokémon details from the PokéAPI."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{POKEAPI_URL}{name_or_id.lower()}") as response:
-                    if response.status == 200:
-                        return await response.json()
-        except aiohttp.ClientError:
-            return None
-        return None  # ✅ Fail safely if API is down
+        """Fetch Pokémon details, served from the PokéAPI cache whenever possible."""
+        return await self.bot.pokeapi.get_pokemon(name_or_id)
 
     @commands.command(name="pokedex")
     async def pokedex(self, ctx, name_or_id: str):
@@ -43,18 +25,18 @@ class Pokemon(commands.Cog):
                 description=f"❌ Couldn't find a Pokémon named `{name_or_id}`.",
                 color=discord.Color.red()
             )
-            return await ctx.send(embed=embed)
+            return await self.bot.outbound.send(ctx, embed=embed)
 
         # ✅ Extract Pokémon details safely
-        name = pokemon.get("name", "Unknown").capitalize()
-        poke_id = pokemon.get("id", "N/A")
-        height = pokemon.get("height", "N/A")
-        weight = pokemon.get("weight", "N/A")
-        base_experience = pokemon.get("base_experience", "N/A")
-        sprite_url = pokemon.get("sprites", {}).get("front_default")
+        name = pokemon.name.capitalize()
+        poke_id = pokemon.id or "N/A"
+        height = pokemon.height if pokemon.height is not None else "N/A"
+        weight = pokemon.weight if pokemon.weight is not None else "N/A"
+        base_experience = pokemon.base_experience if pokemon.base_experience is not None else "N/A"
+        sprite_url = pokemon.sprite
 
-        types = ", ".join(t["type"]["name"].capitalize() for t in pokemon.get("types", [])) or "Unknown"
-        abilities = ", ".join(a["ability"]["name"].capitalize() for a in pokemon.get("abilities", [])) or "Unknown"
+        types = ", ".join(t.capitalize() for t in pokemon.types) or "Unknown"
+        abilities = ", ".join(a.capitalize() for a in pokemon.abilities) or "Unknown"
 
         # ✅ Create the embed
         embed = discord.Embed(title=name, description=f"🆔 **{poke_id}**", color=discord.Color.blue())
@@ -66,33 +48,123 @@ class Pokemon(commands.Cog):
         embed.add_field(name="🔥 Type", value=types, inline=True)
         embed.add_field(name="🎭 Abilities", value=abilities, inline=False)
 
-        await ctx.send(embed=embed)
+        await self.bot.outbound.send(ctx, embed=embed)
 
     @commands.command(name="mypokemon")
-    async def mypokemon(self, ctx):
-        """Show user's collected Pokémon from the database."""
-        user_id = str(ctx.author.id)  # ✅ Ensure IDs are stored as strings
-
-        # ✅ Fetch Pokémon safely using Supabase DB class
-        rows = await db.fetch("SELECT pokemon_name FROM user_pokemon WHERE user_id = %s", user_id)
-
-        if not rows:
+    async def mypokemon(self, ctx, order: str = "name"):
+        """Browse your card collection page by page: `!mypokemon [name|set|date]`."""
+        order = order.lower()
+        if order not in SORT_KEYS:
+            return await self.bot.outbound.send(ctx, "❌ Sort by `name`, `set` or `date`.")
+
+        browser = CollectionBrowser(self.db, ctx.author.id, order, config.BROWSE_PAGE_SIZE)
+        await browser.open()
+        if not browser.rows:
             embed = discord.Embed(
-                title="Your Pokémon Collection",
-                description="⚠️ You don't own any Pokémon yet! Open a pack to get some!",
+                title="Your Card Collection",
+                description="⚠️ You don't own any cards yet! Open a pack to get some!",
                 color=discord.Color.orange()
             )
-            return await ctx.send(embed=embed)
-
-        # ✅ Format Pokémon list safely
-        pokemon_list = "\n".join(f"- {row['pokemon_name'].capitalize()}" for row in rows)
-
+            return await self.bot.outbound.send(ctx, embed=embed)
+
+        # ✅ One live browser per trainer: a new !mypokemon retires the old one
+        previous = self.sessions.get(ctx.author.id)
+        view = CollectionView(self, ctx.author, browser)
+        self.sessions[ctx.author.id] = view
+        view.message = await self.bot.outbound.send(ctx, embed=view.embed(), view=view)
+        if previous:
+            await previous.expire()
+
+
+class CollectionView(discord.ui.View):
+    """Page and sort buttons for one `!mypokemon` session.
+
+    The cursor state lives in the CollectionBrowser; the session expires (and its
+    buttons are disabled) after BROWSE_SESSION_TIMEOUT seconds without a click.
+    """
+
+    def __init__(self, cog, owner, browser):
+        super().__init__(timeout=config.BROWSE_SESSION_TIMEOUT)
+        self.cog = cog
+        self.owner = owner
+        self.browser = browser
+        self.message = None
+        self._refresh_buttons()
+
+    def embed(self):
+        browser = self.browser
+        lines = []
+        for row in browser.rows:
+            detail = row["first_obtained"].strftime("%Y-%m-%d") if browser.order == "date" else row["set_id"]
+            lines.append(f"**{row['card_name']}** ×{row['quantity']} · `{row['card_id']}` · {detail}")
         embed = discord.Embed(
-            title=f"📜 {ctx.author.name}'s Pokémon Collection",
-            description=pokemon_list,
+            title=f"📜 {self.owner.name}'s Card Collection",
+            description="\n".join(lines),
             color=discord.Color.green()
         )
-        await ctx.send(embed=embed)
+        embed.set_footer(text=(
+            f"Page {browser.page}/{browser.pages} • {browser.unique_cards} unique, "
+            f"{browser.total_cards} total • sorted by {browser.order}"
+        ))
+        return embed
+
+    def _refresh_buttons(self):
+        self.previous_page.disabled = not self.browser.has_previous
+        self.next_page.disabled = not self.browser.has_next
+        for button, order in ((self.by_name, "name"), (self.by_set, "set"), (self.by_date, "date")):
+            button.style = discord.ButtonStyle.primary if self.browser.order == order else discord.ButtonStyle.secondary
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner.id:
+            await interaction.response.send_message("🚫 This isn't your collection.", ephemeral=True)
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction):
+        self._refresh_buttons()
+        # ✅ Answered directly: Discord wants a response within 3 seconds, so this skips the outbound queue
+        await interaction.response.edit_message(embed=self.embed(), view=self)
+
+    @discord.ui.button(emoji="◀️", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.browser.previous()
+        await self._show(interaction)
+
+    @discord.ui.button(emoji="▶️", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.browser.next()
+        await self._show(interaction)
+
+    @discord.ui.button(label="Name", style=discord.ButtonStyle.secondary)
+    async def by_name(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.browser.sort("name")
+        await self._show(interaction)
+
+    @discord.ui.button(label="Set", style=discord.ButtonStyle.secondary)
+    async def by_set(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.browser.sort("set")
+        await self._show(interaction)
+
+    @discord.ui.button(label="Newest", style=discord.ButtonStyle.secondary)
+    async def by_date(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.browser.sort("date")
+        await self._show(interaction)
+
+    async def on_timeout(self):
+        await self.expire()
+
+    async def expire(self):
+        """Ends the session and greys out its buttons so they don't look clickable."""
+        self.stop()
+        if self.cog.sessions.get(self.owner.id) is self:
+            del self.cog.sessions[self.owner.id]
+        for item in self.children:
+            item.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass  # ✅ The message may be gone already
 
 # ✅ Load the Pokémon Cog
 async def setup(bot):
@@ -1,89 +1,113 @@
 import discord
-import asyncio
+from collections import Counter
 from discord.ext import commands
-from database import Database  # ✅ Use Supabase Database class
-
-# ✅ Initialize Database
-db = Database()
+import config
+from messaging import FOLLOWUP
+from trades import ACCEPTED, UNAVAILABLE
 
 class Trade(commands.Cog):
-    """Handles Pokémon trading between users."""
+    """Handles card trading between users."""
 
     def __init__(self, bot):
         self.bot = bot
+        self.db = bot.db  # ✅ Shared connection pool owned by the bot
+        self.trades = bot.trades
+        self.trades.on_expired = self.on_trade_expired
+
+    def describe(self, card_ids):
+        """Formats a list of card ids as 'Name ×n' using the catalog."""
+        parts = []
+        for card_id, amount in Counter(card_ids).items():
+            card = self.bot.catalog.get(card_id)
+            name = f"**{card.name}** (`{card_id}`)" if card else f"`{card_id}`"
+            parts.append(f"{name} ×{amount}" if amount > 1 else name)
+        return ", ".join(parts)
+
+    @staticmethod
+    def parse_cards(text: str):
+        return [card_id.strip() for card_id in text.split(",") if card_id.strip()]
 
     @commands.command(name="trade")
-    async def trade(self, ctx, member: discord.Member, my_pokemon: str, their_pokemon: str):
-        """Propose a trade to another user."""
+    async def trade(self, ctx, member: discord.Member, my_cards: str, their_cards: str):
+        """Propose a trade: `!trade @user base1-4,base1-58 base1-2` (comma-separated card ids)."""
         if ctx.author == member:
-            return await ctx.send("🚫 You can't trade with yourself!")
-
-        if not my_pokemon.strip() or not their_pokemon.strip():
-            return await ctx.send("⚠️ Invalid Pokémon names. Please specify valid Pokémon to trade.")
-
-        user_id = str(ctx.author.id)  # ✅ Convert user IDs to strings for Supabase
-        target_id = str(member.id)
-
-        # ✅ Check if both users own the Pokémon
-        my_pokemon_exists = await db.fetchval(
-            "SELECT COUNT(*) FROM user_pokemon WHERE user_id = %s AND pokemon_name = %s",
-            user_id, my_pokemon
-        )
-        their_pokemon_exists = await db.fetchval(
-            "SELECT COUNT(*) FROM user_pokemon WHERE user_id = %s AND pokemon_name = %s",
-            target_id, their_pokemon
+            return await self.bot.outbound.send(ctx, "🚫 You can't trade with yourself!")
+        if member.bot:
+            return await self.bot.outbound.send(ctx, "🚫 You can't trade with a bot!")
+
+        offered, requested = self.parse_cards(my_cards), self.parse_cards(their_cards)
+        if not offered or not requested:
+            return await self.bot.outbound.send(ctx, "⚠️ Specify the card ids to trade, e.g. `!trade @user base1-4,base1-58 base1-2`.")
+        if len(offered) > config.TRADE_MAX_CARDS or len(requested) > config.TRADE_MAX_CARDS:
+            return await self.bot.outbound.send(ctx, f"⚠️ You can trade at most {config.TRADE_MAX_CARDS} cards per side.")
+
+        user_id = ctx.author.id
+        target_id = member.id
+
+        # ✅ Early, friendly check; the swap itself re-checks under row locks
+        their_counts = await self.db.get_user_card_counts(target_id)
+        if any(their_counts.get(card_id, 0) < amount for card_id, amount in Counter(requested).items()):
+            return await self.bot.outbound.send(ctx, f"❌ {member.name} doesn't own {self.describe(requested)}!")
+
+        trade = await self.trades.propose(
+            user_id, target_id, offered, requested,
+            guild_id=ctx.guild.id if ctx.guild else None, channel_id=ctx.channel.id,
         )
-
-        if not my_pokemon_exists:
-            return await ctx.send(f"❌ You don't own a **{my_pokemon}**!")
-        if not their_pokemon_exists:
-            return await ctx.send(f"❌ {member.name} doesn't own a **{their_pokemon}**!")
+        if trade is None:
+            return await self.bot.outbound.send(ctx, f"❌ You don't own {self.describe(offered)}!")
 
         # ✅ Create trade request embed
         embed = discord.Embed(
-            title="🔄 Trade Request",
-            description=f"{ctx.author.mention} wants to trade **{my_pokemon}** for {member.mention}'s **{their_pokemon}**.\n\n"
-                        "React with ✅ to accept or ❌ to decline.",
+            title=f"🔄 Trade Request #{trade.id}",
+            description=f"{ctx.author.mention} offers {self.describe(offered)}\n"
+                        f"for {member.mention}'s {self.describe(requested)}.\n\n"
+                        f"{member.mention}: react with ✅ to accept or ❌ to decline. "
+                        f"Offer expires in {int(self.trades.ttl // 60)} min.",
             color=discord.Color.blue()
         )
-        
-        trade_message = await ctx.send(embed=embed)
-        await trade_message.add_reaction("✅")
-        await trade_message.add_reaction("❌")
+        embed.set_footer(text="The offered cards are held until the trade is answered.")
 
-        def check(reaction, user):
-            return user == member and str(reaction.emoji) in ["✅", "❌"]
+        trade_message = await self.bot.outbound.send(ctx, embed=embed)
+        await self.trades.attach(trade, trade_message.id)
+        self.bot.outbound.react(trade_message, "✅", priority=FOLLOWUP)  # ✅ Needed to answer, never dropped
+        self.bot.outbound.react(trade_message, "❌", priority=FOLLOWUP)
 
-        try:
-            reaction, _ = await self.bot.wait_for("reaction_add", timeout=60.0, check=check)
-
-            if str(reaction.emoji) == "✅":
-                # ✅ Perform the trade in Supabase
-                async with db.transaction():  # ✅ Ensure atomic transaction
-                    await db.execute(
-                        """
-                        UPDATE user_pokemon 
-                        SET user_id = CASE 
-                            WHEN user_id = %s AND pokemon_name = %s THEN %s
-                            WHEN user_id = %s AND pokemon_name = %s THEN %s
-                        END
-                        WHERE (user_id = %s AND pokemon_name = %s) 
-                           OR (user_id = %s AND pokemon_name = %s)
-                        """,
-                        user_id, my_pokemon, target_id,  # Move my Pokémon to the other user
-                        target_id, their_pokemon, user_id,  # Move their Pokémon to me
-                        user_id, my_pokemon, target_id, their_pokemon  # Conditions for selection
-                    )
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload):
+        """Answers trades from reactions: one dict lookup per reaction, however many trades are open."""
+        trade = self.trades.for_message(payload.message_id)
+        if trade is None:
+            return
 
-                await ctx.send(f"✅ Trade successful! {ctx.author.mention} traded **{my_pokemon}** for {member.mention}'s **{their_pokemon}**!")
+        emoji, user_id = str(payload.emoji), payload.user_id
+        channel = self.bot.get_channel(payload.channel_id)
+        if channel is None:
+            return
 
-            else:
-                await ctx.send(f"❌ {member.mention} declined the trade.")
+        try:
+            if emoji == "✅" and user_id == trade.target_id:
+                result = await self.trades.accept(trade)
+                if result == ACCEPTED:
+                    await self.bot.outbound.send(
+                        channel,
+                        f"✅ Trade successful! <@{trade.proposer_id}> traded {self.describe(trade.offered)} "
+                        f"for <@{trade.target_id}>'s {self.describe(trade.requested)}!"
+                    )
+                elif result == UNAVAILABLE:
+                    await self.bot.outbound.send(channel, f"❌ <@{trade.target_id}>, you no longer own {self.describe(trade.requested)}.")
 
-        except asyncio.TimeoutError:  # ✅ Fixed TimeoutError
-            await ctx.send("⏳ Trade request timed out.")
+            elif emoji == "❌" and user_id in (trade.target_id, trade.proposer_id):
+                if await self.trades.decline(trade):
+                    who = "withdrew" if user_id == trade.proposer_id else "declined"
+                    await self.bot.outbound.send(channel, f"❌ <@{user_id}> {who} trade #{trade.id}. Cards returned to <@{trade.proposer_id}>.")
         except Exception as e:
-            await ctx.send(f"⚠️ An unexpected error occurred: {str(e)}")
+            await self.bot.outbound.send(channel, f"⚠️ An unexpected error occurred: {str(e)}")
+
+    async def on_trade_expired(self, trade):
+        """Tells the channel a trade timed out (the cards are already refunded)."""
+        channel = self.bot.get_channel(trade.channel_id) if trade.channel_id else None
+        if channel is not None:
+            await self.bot.outbound.send(channel, f"⏳ Trade #{trade.id} timed out. Cards returned to <@{trade.proposer_id}>.", priority=FOLLOWUP)
 
 # ✅ Load the Trade Cog
 async def setup(bot):
@@ -1,104 +1,72 @@
-import random
 import discord
-import aiohttp  # ✅ For async HTTP requests
-import os
 from discord.ext import commands
-from supabase import create_client, Client
-
-# ✅ Load environment variables securely
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-
-# ✅ Check if credentials exist
-if not SUPABASE_URL or not SUPABASE_KEY:
-    raise ValueError("⚠️ Supabase credentials are missing! Please check your environment variables.")
-
-# ✅ Initialize Supabase client
-supabase_client: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-POKEMON_TCG_API_URL = "https://api.pokemontcg.io/v2/cards"
+from clients import TCGAPIError
+from events import CARD_OBTAINED
 
 class WonderPick(commands.Cog):
     """Handles the WonderPick gambling feature in the bot."""
 
     def __init__(self, bot):
         self.bot = bot
-        self.supabase = supabase_client
+        self.db = bot.db  # ✅ Shared connection pool owned by the bot
+        self.recent_packs = bot.recent_packs
 
     async def fetch_card_info(self, card_id):
         """
-        Fetches Pokémon card details from the Pokémon TCG API asynchronously.
-        """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{POKEMON_TCG_API_URL}/{card_id}") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("data", {})
-        return None
-
-    async def get_user_collection(self, user_id):
-        """
-        Retrieves a user's card collection from Supabase.
+        Looks up Pokémon card details, falling back to the shared TCG API client.
         """
-        response = self.supabase.table("user_collections").select("cards").eq("user_id", user_id).execute()
-        if response.data and len(response.data) > 0:
-            return response.data[0].get("cards", [])
-        return []
+        try:
+            return await self.bot.catalog.find(card_id)
+        except TCGAPIError:
+            return None
 
-    async def update_user_collection(self, user_id, new_card):
+    async def claim_from_recent_packs(self, gambler_id):
         """
-        Adds a new card to the user's collection in Supabase.
+        Claims a card from a random recently opened pack, skipping packs that were emptied meanwhile.
         """
-        existing_collection = await self.get_user_collection(user_id)
-        if new_card not in existing_collection:
-            updated_collection = existing_collection + [new_card]
-            self.supabase.table("user_collections").update({"cards": updated_collection}).eq("user_id", user_id).execute()
+        for pack_id, _ in self.recent_packs.candidates(exclude_user=gambler_id):
+            claim = await self.db.claim_card_from_pack(gambler_id, pack_id=pack_id)
+            if claim:
+                return claim
+            self.recent_packs.discard(pack_id)
+        return None
 
     @commands.command(name="wonderpick")
-    async def wonderpick(self, ctx, pack_opener: discord.Member):
+    async def wonderpick(self, ctx, pack_opener: discord.Member = None):
         """
-        Allows a user to gamble and randomly get a card from another user's opened pack.
+        Gamble for a random card from another user's latest pack, or from any recent pack.
         """
-        gambler_id = str(ctx.author.id)
-        pack_opener_id = str(pack_opener.id)
-
-        # ✅ Fetch the last opened pack from Supabase
-        response = self.supabase.table("opened_packs").select("cards").eq("user_id", pack_opener_id).order("opened_at", desc=True).limit(1).execute()
-        
-        if not response.data or len(response.data) == 0:
-            return await ctx.send(f"🚫 {pack_opener.mention} has not opened any packs recently.")
-
-        pack = response.data[0].get("cards", [])
-        if not pack:
-            return await ctx.send(f"🚫 No cards available from {pack_opener.mention}'s pack!")
+        gambler_id = ctx.author.id
+
+        if pack_opener is not None:
+            if pack_opener.id == ctx.author.id:
+                return await self.bot.outbound.send(ctx, "🚫 You can't WonderPick your own pack!")
+            # ✅ One atomic round trip: lock the pack row, take a card, add it to the collection
+            claim = await self.db.claim_card_from_pack(gambler_id, opener_id=pack_opener.id)
+            if not claim:
+                return await self.bot.outbound.send(ctx, f"🚫 No cards available from {pack_opener.mention}'s latest pack!")
+        else:
+            claim = await self.claim_from_recent_packs(gambler_id)
+            if not claim:
+                return await self.bot.outbound.send(ctx, "🚫 Nobody has opened a pack recently. Try again later!")
+
+        _, opener_id, chosen_card = claim
+        self.bot.events.emit(CARD_OBTAINED, gambler_id, ctx.guild.id if ctx.guild else None)
 
-        # ✅ Select a random card
-        chosen_card = random.choice(pack)
         card_info = await self.fetch_card_info(chosen_card)
-        
-        if not card_info:
-            return await ctx.send("⚠️ Failed to retrieve card details. Please try again later.")
-
-        card_name = card_info.get("name", "Unknown Card")
-
-        # ✅ Ensure the pack opener doesn't lose the card permanently
-        if chosen_card in pack:
-            pack.remove(chosen_card)
-            self.supabase.table("opened_packs").update({"cards": pack}).eq("user_id", pack_opener_id).execute()
-
-        # ✅ Update gambler's collection
-        await self.update_user_collection(gambler_id, chosen_card)
+        card_name = card_info.name if card_info else chosen_card
+        opener_mention = pack_opener.mention if pack_opener else f"<@{opener_id}>"
 
         # ✅ Send success message
         embed = discord.Embed(
             title="🎰 WonderPick!",
-            description=f"{ctx.author.mention} used WonderPick and won **{card_name}** from {pack_opener.mention}! 🎉",
+            description=f"{ctx.author.mention} used WonderPick and won **{card_name}** from {opener_mention}! 🎉",
             color=discord.Color.gold()
         )
-        if "images" in card_info and "large" in card_info["images"]:
-            embed.set_thumbnail(url=card_info["images"]["large"])
+        if card_info and card_info.image_large:
+            embed.set_thumbnail(url=card_info.image_large)
 
-        await ctx.send(embed=embed)
+        await self.bot.outbound.send(ctx, embed=embed)
 
 # ✅ Load the WonderPick Cog
 async def setup(bot):
@@ -7,11 +7,51 @@ load_dotenv()
 # Discord Bot
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
 
-# Supabase Credentials
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-
 # Pokémon TCG API
 POKEMON_TCG_API_KEY = os.getenv("POKEMON_TCG_API_KEY")
 
 # Other Configuration Variables (if needed)
+
+# Local card catalog (synced with `python -m catalog sync`)
+CATALOG_PATH = os.getenv("CATALOG_PATH", "data/catalog.json.gz")
+TCG_MAX_CONCURRENCY = int(os.getenv("TCG_MAX_CONCURRENCY", "8"))  # In-flight API requests per process
+TCG_MAX_RETRIES = int(os.getenv("TCG_MAX_RETRIES", "3"))
+
+# Card image cache and pack rendering
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", "data/images")
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "2"))
+
+# PokéAPI cache for !pokedex
+POKEAPI_CACHE_PATH = os.getenv("POKEAPI_CACHE_PATH", "data/pokeapi_cache.json")
+POKEAPI_CACHE_SIZE = int(os.getenv("POKEAPI_CACHE_SIZE", "2000"))
+POKEAPI_CACHE_TTL = float(os.getenv("POKEAPI_CACHE_TTL", str(7 * 24 * 3600)))
+POKEAPI_NEGATIVE_TTL = float(os.getenv("POKEAPI_NEGATIVE_TTL", "600"))  # How long typo'd names stay "not found"
+
+# Global WonderPick: how many recently opened packs are kept in memory
+RECENT_PACKS_SIZE = int(os.getenv("RECENT_PACKS_SIZE", "500"))
+
+# Mission progress write-behind
+MISSION_FLUSH_INTERVAL = float(os.getenv("MISSION_FLUSH_INTERVAL", "10"))
+MISSION_FLUSH_THRESHOLD = int(os.getenv("MISSION_FLUSH_THRESHOLD", "500"))  # Pending rows that trigger an early flush
+
+# Trades: how long an offer stays open, and how many cards each side may put in
+TRADE_TIMEOUT = float(os.getenv("TRADE_TIMEOUT", "300"))
+TRADE_MAX_CARDS = int(os.getenv("TRADE_MAX_CARDS", "10"))
+
+# Sharding: set by launcher.py for each worker process (unset = one process, shards chosen by Discord)
+SHARD_COUNT = int(os.getenv("SHARD_COUNT")) if os.getenv("SHARD_COUNT") else None
+SHARD_IDS = [int(shard_id) for shard_id in os.getenv("SHARD_IDS").split(",")] if os.getenv("SHARD_IDS") else None
+WORKER_ID = int(os.getenv("WORKER_ID", "0"))
+
+# Prometheus metrics endpoint (each worker listens on METRICS_PORT + WORKER_ID; 0 disables it)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
+
+# Event loop stall watchdog
+STALL_THRESHOLD = float(os.getenv("STALL_THRESHOLD", "0.25"))  # Seconds the loop may block before a stack is captured
+STALL_BUFFER_SIZE = int(os.getenv("STALL_BUFFER_SIZE", "50"))
+
+# !mypokemon collection browser
+BROWSE_PAGE_SIZE = int(os.getenv("BROWSE_PAGE_SIZE", "10"))
+BROWSE_SESSION_TIMEOUT = float(os.getenv("BROWSE_SESSION_TIMEOUT", "180"))  # Idle seconds before a browser's buttons expire
@@ -1 +1,4 @@
 from .database import Database
+from .counters import CounterBuffer
+from .notify import ChangeFeed
+from .queries import STATEMENTS, Session
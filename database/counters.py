@@ -0,0 +1,100 @@
+import asyncio
+import contextlib
+import os
+
+COUNTER_FLUSH_INTERVAL = float(os.getenv("COUNTER_FLUSH_INTERVAL", "5"))
+COUNTER_FLUSH_THRESHOLD = int(os.getenv("COUNTER_FLUSH_THRESHOLD", "1000"))
+
+
+class CounterBuffer:
+    """Write-behind buffer for hot per-user counters on the `users` row.
+
+    Increments are summed in memory per (user, stat) and written as one
+    multi-row upsert every `flush_interval` seconds or once `flush_threshold`
+    users are pending, so a popular player's row is touched once per flush
+    instead of once per battle. Readers add `pending()` to what's stored.
+    """
+
+    def __init__(self, db, stats=("wins", "losses"), flush_interval: float = COUNTER_FLUSH_INTERVAL,
+                 flush_threshold: int = COUNTER_FLUSH_THRESHOLD):
+        self.db = db
+        self.stats = tuple(stats)
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._pending = {}  # user_id -> [delta per stat]
+        self._lock = asyncio.Lock()
+        self._task = None
+        self.flushes = 0
+        self.increments = 0
+
+        columns = ", ".join(self.stats)
+        arrays = ", ".join(f"${i + 2}::int[]" for i in range(len(self.stats)))
+        updates = ", ".join(f"{stat} = users.{stat} + EXCLUDED.{stat}" for stat in self.stats)
+        self._sql = f"""
+            INSERT INTO users (user_id, {columns})
+            SELECT * FROM unnest($1::bigint[], {arrays})
+            ON CONFLICT (user_id) DO UPDATE SET {updates}
+        """
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, user_id, stat: str, amount: int = 1):
+        """Buffers an increment; returns a flush coroutine if the threshold was reached."""
+        deltas = self._pending.get(int(user_id))
+        if deltas is None:
+            deltas = self._pending[int(user_id)] = [0] * len(self.stats)
+        deltas[self.stats.index(stat)] += amount
+        self.increments += 1
+        if len(self._pending) >= self.flush_threshold:
+            return self.flush()
+        return None
+
+    def pending(self, user_id):
+        """Unflushed increments for a user as {stat: delta}."""
+        deltas = self._pending.get(int(user_id))
+        return dict(zip(self.stats, deltas)) if deltas else {stat: 0 for stat in self.stats}
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"⚠️ Counter flush failed, will retry: {e}")
+
+    async def flush(self):
+        """Writes every pending increment in a single statement."""
+        async with self._lock:
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return
+
+            # ✅ Sorted so concurrent flushes from several workers lock rows in the same order
+            user_ids = sorted(batch)
+            columns = [[batch[user_id][i] for user_id in user_ids] for i in range(len(self.stats))]
+            try:
+                await self.db.execute(self._sql, user_ids, *columns)
+            except BaseException:
+                # ✅ Failed or cancelled: merge the batch back so no increment is lost
+                for user_id, deltas in batch.items():
+                    merged = self._pending.setdefault(user_id, [0] * len(self.stats))
+                    for i, delta in enumerate(deltas):
+                        merged[i] += delta
+                raise
+            self.flushes += 1
+            self.db.invalidate(user_ids, ("user", "profile"))
+
+    async def close(self):
+        """Stops the timer and flushes everything still pending."""
+        if self._task:
+            async with self._lock:  # ✅ Never cancel a flush half-way through its write
+                self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
@@ -1,6 +1,17 @@
 import asyncpg
+import asyncio
+import contextlib
 import os
 import json
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+
+from metrics import instrument_methods
+from utils import TTLCache
+from .counters import CounterBuffer
+from .notify import ChangeFeed, RESYNC
+from .queries import STATEMENTS, Session
 
 # ✅ Load PostgreSQL connection URL securely
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -8,107 +19,484 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("❌ DATABASE_URL is not set! Check your environment variables.")
 
+# ✅ Pool sizing and timeouts (one pool per bot process, shared by every cog)
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+DB_IDLE_CONNECTION_LIFETIME = float(os.getenv("DB_IDLE_CONNECTION_LIFETIME", "300"))
+DB_HEALTH_CHECK_INTERVAL = float(os.getenv("DB_HEALTH_CHECK_INTERVAL", "30"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))  # Prepared statements kept per connection
+DB_MIGRATION_TIMEOUT = float(os.getenv("DB_MIGRATION_TIMEOUT", "3600"))
+MIGRATION_LOCK_ID = 7_301_120_417  # pg_advisory_lock key held while migrating (any constant shared by all workers)
+
+# ✅ Read-through cache for per-user reads (entries, not bytes; TTL bounds staleness from other writers)
+DB_CACHE_SIZE = int(os.getenv("DB_CACHE_SIZE", "5000"))
+DB_CACHE_TTL = float(os.getenv("DB_CACHE_TTL", "60"))
+
+# Cache entry kinds, keyed as (kind, user_id)
+USER, CARDS, PROFILE, POKEMON, MISSIONS = "user", "cards", "profile", "pokemon", "missions"
+# Collection browse orders: (named statement, keyset cursor that sorts before every row)
+BROWSE_ORDERS = {
+    "name": ("browse_cards_by_name", ("", "")),
+    "set": ("browse_cards_by_set", ("", "")),
+    "date": ("browse_cards_by_date", (datetime.max.replace(tzinfo=timezone.utc), "")),  # Newest first
+}
+INVALIDATION_CHUNK = 200  # User ids per change notification (keeps payloads under the NOTIFY limit)
+_MISSING = object()
+
 class Database:
     """Handles all database interactions for the Discord bot."""
 
-    def __init__(self):
-        """Initializes the database connection pool."""
+    def __init__(self, dsn: str = DATABASE_URL, min_size: int = DB_POOL_MIN_SIZE,
+                 max_size: int = DB_POOL_MAX_SIZE, statement_timeout_ms: int = DB_STATEMENT_TIMEOUT_MS,
+                 health_check_interval: float = DB_HEALTH_CHECK_INTERVAL,
+                 cache_size: int = DB_CACHE_SIZE, cache_ttl: float = DB_CACHE_TTL, init=None):
+        """Initializes the database connection pool settings.
+
+        `init` is an optional coroutine run on every new pooled connection (e.g. to add a query logger),
+        after the JSON codecs are registered.
+        """
+        self.dsn = dsn
+        self.init = init
+        self.min_size = min_size
+        self.max_size = max_size
+        self.statement_timeout_ms = statement_timeout_ms
+        self.health_check_interval = health_check_interval
         self.pool = None
+        self._health_task = None
+        self.counters = CounterBuffer(self)  # ✅ Write-behind wins/losses
+        self.cache = TTLCache(cache_size, cache_ttl)
+        self._cache_epoch = 0  # ✅ Bumped on every invalidation so in-flight reads don't cache stale rows
+        self.feed = ChangeFeed(self)  # ✅ Keeps the caches of other worker processes consistent
+        self.feed.subscribe("cache", lambda message: self.invalidate(message["user_ids"], message["kinds"], broadcast=False))
+        self.feed.subscribe(RESYNC, lambda message: self.cache.clear())
 
     async def connect(self):
-        """Creates a database connection pool."""
+        """Creates the shared database connection pool and starts health checks."""
+        if self.pool:
+            return
+
         try:
-            if not self.pool:
-                self.pool = await asyncpg.create_pool(DATABASE_URL)
-                print("✅ Database connected successfully!")
+            self.pool = await asyncpg.create_pool(
+                self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_inactive_connection_lifetime=DB_IDLE_CONNECTION_LIFETIME,
+                command_timeout=self.statement_timeout_ms / 1000 * 2,
+                server_settings={"statement_timeout": str(self.statement_timeout_ms)},
+                # ✅ Every named statement stays prepared on each connection, with room for ad-hoc SQL
+                statement_cache_size=max(DB_STATEMENT_CACHE_SIZE, 2 * len(STATEMENTS)),
+                init=self._init_connection,
+            )
         except Exception as e:
             print(f"❌ Database connection failed: {e}")
+            raise
+
+        if self.health_check_interval > 0:
+            self._health_task = asyncio.create_task(self._health_check_loop())
+        self.counters.start()
+        try:
+            await self.feed.start()
+        except (OSError, asyncpg.PostgresError) as e:
+            print(f"⚠️ Change feed unavailable, caches won't be shared across workers: {e}")
+        print(f"✅ Database connected successfully! (pool size {self.min_size}-{self.max_size})")
 
     async def disconnect(self):
-        """Closes the database connection pool."""
+        """Stops health checks and closes the database connection pool."""
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        await self.feed.close()
         if self.pool:
             await self.pool.close()
             self.pool = None
             print("✅ Database connection closed.")
 
-    async def get_user(self, user_id: int):
-        """Fetches user data, inserting them into the database if necessary."""
+    async def _init_connection(self, conn):
+        """Decodes json/jsonb columns to Python objects (and encodes them back) on every pooled connection."""
+        for type_name in ("json", "jsonb"):
+            await conn.set_type_codec(type_name, encoder=json.dumps, decoder=json.loads, schema="pg_catalog")
+        if self.init:
+            await self.init(conn)
+
+    async def apply_migrations(self):
+        """Applies the SQL files in database/migrations that haven't run yet, in order.
+
+        Each file runs once, in its own transaction, and is recorded in
+        `schema_migrations`. Workers starting together wait on an advisory
+        lock, so only the first one migrates.
+        """
         if not self.pool:
             raise RuntimeError("❌ Database connection not established.")
 
+        migrations_dir = os.path.join(os.path.dirname(__file__), "migrations")
         async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT * FROM users WHERE user_id = $1", user_id)
-            if not row:
-                await conn.execute("INSERT INTO users (user_id) VALUES ($1)", user_id)
-                return {"user_id": user_id}
-            return dict(row)
+            await conn.execute("SET statement_timeout = 0")  # ✅ Reset when the connection returns to the pool
+            await conn.execute("SELECT pg_advisory_lock($1)", MIGRATION_LOCK_ID, timeout=DB_MIGRATION_TIMEOUT)
+            try:
+                await conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS schema_migrations (
+                        version    TEXT        PRIMARY KEY,
+                        applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+                    )
+                    """
+                )
+                applied = {row["version"] for row in await conn.fetch("SELECT version FROM schema_migrations")}
+                for filename in sorted(os.listdir(migrations_dir)):
+                    version = filename[:-len(".sql")]
+                    if not filename.endswith(".sql") or version in applied:
+                        continue
+                    with open(os.path.join(migrations_dir, filename), encoding="utf-8") as handle:
+                        sql = handle.read()
+                    async with conn.transaction():
+                        await conn.execute(sql, timeout=DB_MIGRATION_TIMEOUT)
+                        await conn.execute("INSERT INTO schema_migrations (version) VALUES ($1)", version)
+                    print(f"✅ Applied migration: {filename}")
+            finally:
+                await conn.execute("SELECT pg_advisory_unlock($1)", MIGRATION_LOCK_ID)
 
-    async def get_user_missions(self, user_id: int):
-        """Fetches a user's missions, returning an empty list if none exist."""
+    async def ping(self) -> bool:
+        """Returns True if the database answers a trivial query in time."""
         if not self.pool:
-            raise RuntimeError("❌ Database connection not established.")
+            return False
+        try:
+            async with self.pool.acquire(timeout=self.statement_timeout_ms / 1000) as conn:
+                return await conn.fetchval("SELECT 1") == 1
+        except (asyncpg.PostgresError, OSError, asyncio.TimeoutError):
+            return False
 
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT missions FROM user_missions WHERE user_id = $1", user_id)
-            return json.loads(row["missions"]) if row else []
+    def pool_stats(self) -> dict:
+        """Current pool size and idle connection count."""
+        if not self.pool:
+            return {"size": 0, "idle": 0, "max": self.max_size}
+        return {"size": self.pool.get_size(), "idle": self.pool.get_idle_size(), "max": self.max_size}
 
-    async def get_user_pokemon(self, user_id: int):
-        """Fetches a user's Pokémon collection, returning an empty list if none exist."""
+    async def _health_check_loop(self):
+        """Periodically pings the database and recycles connections after a failure."""
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            if not await self.ping():
+                print("⚠️ Database health check failed, recycling pooled connections.")
+                self.pool.expire_connections()
+
+    async def _cached(self, kind: str, user_id, load):
+        """Returns the cached entry for (kind, user_id), loading and caching it on a miss."""
+        key = (kind, int(user_id))
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        epoch = self._cache_epoch
+        value = await load()
+        if epoch == self._cache_epoch:  # Nothing was invalidated while we were reading
+            self.cache.set(key, value)
+        return value
+
+    def invalidate(self, user_ids, kinds=(USER, CARDS, PROFILE, POKEMON, MISSIONS), broadcast: bool = True):
+        """Drops cached entries for users whose rows were just written, here and in other workers."""
+        self._cache_epoch += 1
+        user_ids = sorted(set(map(int, user_ids)))
+        for user_id in user_ids:
+            for kind in kinds:
+                self.cache.pop((kind, user_id))
+        if broadcast:
+            for start in range(0, len(user_ids), INVALIDATION_CHUNK):
+                self.feed.publish("cache", user_ids=user_ids[start:start + INVALIDATION_CHUNK], kinds=list(kinds))
+
+    def cache_stats(self) -> dict:
+        """Hit/miss counters of the read-through cache."""
+        return self.cache.stats()
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        """A Session on one pooled connection, for several statements in a row."""
         if not self.pool:
             raise RuntimeError("❌ Database connection not established.")
-
         async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT pokemon FROM user_pokemon WHERE user_id = $1", user_id)
-            return json.loads(row["pokemon"]) if row else []
+            yield Session(conn)
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """A Session whose statements commit together, or roll back if the block raises."""
+        async with self.session() as session:
+            async with session.conn.transaction():
+                yield session
+
+    async def fetch(self, query: str, *args):
+        """Runs a named statement (or $n-style SQL) and returns every row."""
+        async with self.session() as session:
+            return await session.fetch(query, *args)
+
+    async def fetchrow(self, query: str, *args):
+        """Runs a named statement (or $n-style SQL) and returns the first row, or None."""
+        async with self.session() as session:
+            return await session.fetchrow(query, *args)
+
+    async def fetchval(self, query: str, *args):
+        """Runs a named statement (or $n-style SQL) and returns the first column of the first row."""
+        async with self.session() as session:
+            return await session.fetchval(query, *args)
+
+    async def execute(self, query: str, *args):
+        """Runs a named statement (or $n-style SQL) and returns its status string."""
+        async with self.session() as session:
+            return await session.execute(query, *args)
+
+    async def get_user(self, user_id: int):
+        """Fetches user data, inserting them into the database if necessary."""
+        async def load():
+            async with self.session() as session:
+                row = await session.fetchrow("get_user", user_id) or await session.fetchrow("create_user", user_id)
+            return tuple(row.items())  # ✅ Pairs instead of a dict per cached user
+
+        return dict(await self._cached(USER, user_id, load))
+
+    async def get_user_missions(self, user_id: int):
+        """Fetches a user's missions, returning an empty list if none exist."""
+        async def load():
+            return tuple(await self.fetchval("get_user_missions", user_id) or ())  # ✅ Cached immutable
+
+        return list(await self._cached(MISSIONS, user_id, load))
+
+    async def get_user_pokemon(self, user_id: int):
+        """Fetches the names of a user's Pokémon, returning an empty list if none exist."""
+        async def load():
+            return tuple(row["pokemon_name"] for row in await self.fetch("get_user_pokemon", user_id))
+
+        return list(await self._cached(POKEMON, user_id, load))
+
+    async def _get_cards(self, user_id: int):
+        """A user's collection as a cached (card_ids, quantities) pair of compact sequences."""
+        async def load():
+            rows = await self.fetch("get_cards", user_id)
+            return tuple(row["card_id"] for row in rows), array("i", (row["quantity"] for row in rows))
+
+        return await self._cached(CARDS, user_id, load)
 
     async def get_user_collection(self, user_id: int):
-        """Retrieves a user's card collection, initializing an entry if necessary."""
-        if not self.pool:
-            raise RuntimeError("❌ Database connection not established.")
+        """Retrieves the ids of every card a user owns, or an empty list if none exist."""
+        card_ids, _ = await self._get_cards(user_id)
+        return list(card_ids)
 
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow("SELECT cards FROM user_collections WHERE user_id = $1", user_id)
-            if not row:
-                await conn.execute(
-                    "INSERT INTO user_collections (user_id, cards) VALUES ($1, $2)",
-                    user_id, json.dumps([])
-                )
-                return []
-            return json.loads(row["cards"])
+    async def get_user_card_counts(self, user_id: int):
+        """Retrieves a user's collection as a {card_id: quantity} mapping."""
+        card_ids, quantities = await self._get_cards(user_id)
+        return dict(zip(card_ids, quantities))
+
+    async def browse_cards(self, user_id: int, order: str = "name", after: tuple = None, limit: int = 10):
+        """One page of a user's collection in `order` ("name", "set" or "date").
+
+        `after` is the (sort key, card_id) of the last row on the previous page, or None for the
+        first page; each page is a single index range scan however large the collection is.
+        """
+        statement, first = BROWSE_ORDERS[order]
+        sort_key, card_id = after or first
+        return await self.fetch(statement, user_id, sort_key, card_id, limit)
+
+    async def get_card_totals(self, user_id: int):
+        """A user's (unique_cards, total_cards), read from the trigger-maintained totals table."""
+        row = await self.fetchrow("get_card_totals", user_id)
+        return (row["unique_cards"], row["total_cards"]) if row else (0, 0)
+
+    async def sync_cards(self, cards):
+        """Mirrors catalog card names and sets into the database for sorted collection browsing.
+
+        Returns how many cards were new or changed; only their collection rows are rewritten.
+        """
+        cards = list(cards)
+        async with self.transaction() as session:
+            await session.execute("SET LOCAL statement_timeout = 0")  # ✅ A renamed set can touch many collections
+            return await session.fetchval(
+                "sync_cards",
+                [card.id for card in cards], [card.name for card in cards], [card.set_id for card in cards],
+                timeout=DB_MIGRATION_TIMEOUT,
+            )
 
     async def add_card_to_collection(self, user_id: int, card_id: str):
-        """Adds a card to the user's collection if it's not already present."""
-        if not self.pool:
-            raise RuntimeError("❌ Database connection not established.")
+        """Adds a single card to the user's collection."""
+        await self.add_cards_to_collection(user_id, [card_id])
 
-        async with self.pool.acquire() as conn:
-            collection = await self.get_user_collection(user_id)
-            if card_id not in collection:
-                collection.append(card_id)
-                await conn.execute(
-                    "UPDATE user_collections SET cards = $1 WHERE user_id = $2",
-                    json.dumps(collection), user_id
-                )
+    async def add_cards_to_collection(self, user_id: int, card_ids: list):
+        """Adds any number of cards to one user's collection in a single statement."""
+        await self.add_cards_bulk([user_id] * len(card_ids), card_ids)
+
+    async def add_cards_bulk(self, user_ids: list, card_ids: list):
+        """Upserts (user_ids[i], card_ids[i]) pairs in one set-based statement.
+
+        Duplicate pairs are counted, so opening the same card twice increases its quantity.
+        """
+        if not card_ids:
+            return
+        await self.execute("give_cards", user_ids, card_ids)
+        self.invalidate(user_ids, (CARDS, PROFILE))
+
+    @staticmethod
+    async def _take_cards(session, user_id: int, card_ids: list) -> bool:
+        """Removes cards from a collection inside the caller's transaction.
+
+        The rows are locked with FOR UPDATE first, so a concurrent trade can't
+        spend the same copies. Returns False (changing nothing) if any are missing.
+        """
+        needed = Counter(card_ids)
+        rows = await session.fetch("lock_cards", user_id, list(needed))
+        owned = {row["card_id"]: row["quantity"] for row in rows}
+        if any(owned.get(card_id, 0) < amount for card_id, amount in needed.items()):
+            return False
+        await session.execute("take_cards", user_id, list(needed), list(needed.values()))
+        return True
 
     async def log_opened_pack(self, user_id: int, pack: list):
         """Logs an opened pack with a timestamp."""
-        if not self.pool:
-            raise RuntimeError("❌ Database connection not established.")
+        await self.execute("log_opened_pack", user_id, pack)
 
-        async with self.pool.acquire() as conn:
-            await conn.execute(
-                "INSERT INTO opened_packs (user_id, cards, opened_at) VALUES ($1, $2, NOW())",
-                user_id, json.dumps(pack)
+    async def open_packs(self, user_id: int, packs: list):
+        """Logs opened packs and adds all their cards to the user's collection.
+
+        Everything is written by one statement (one round trip, one implicit
+        transaction). Returns the new `opened_packs` ids in the order of `packs`.
+        """
+        if not packs:
+            return []
+        rows = await self.fetch(
+            "open_packs",
+            user_id,
+            [json.dumps(pack) for pack in packs],
+            [card_id for pack in packs for card_id in pack],
+        )
+        self.invalidate([user_id], (CARDS, PROFILE))
+        return [row["id"] for row in rows]
+
+    async def record_battle(self, winner_id: int, loser_id: int):
+        """Buffers a win and a loss for the two players (written by the counter buffer)."""
+        for flush in (self.counters.add(winner_id, "wins"), self.counters.add(loser_id, "losses")):
+            if flush is not None:
+                await flush
+
+    async def get_profile_stats(self, user_id: int):
+        """Fetches a trainer's profile numbers in one query, including unflushed battle results."""
+        async def load():
+            return tuple((await self.fetchrow("get_profile_stats", user_id)).values())
+
+        wins, losses, total_cards, unique_cards = await self._cached(PROFILE, user_id, load)
+        stats = {"wins": wins, "losses": losses, "total_cards": total_cards, "unique_cards": unique_cards}
+        pending = self.counters.pending(user_id)
+        stats["wins"] += pending["wins"]
+        stats["losses"] += pending["losses"]
+        return stats
+
+    async def get_mission_progress(self, user_id: int):
+        """Fetches a user's stored mission progress as {mission_id: (progress, claimed)}."""
+        rows = await self.fetch("get_mission_progress", user_id)
+        return {row["mission_id"]: (row["progress"], row["claimed"]) for row in rows}
+
+    async def increment_mission_progress(self, user_ids: list, mission_ids: list, deltas: list):
+        """Adds a batch of (user_ids[i], mission_ids[i], deltas[i]) progress increments in one statement."""
+        await self.execute("increment_mission_progress", user_ids, mission_ids, deltas)
+
+    async def claim_mission_reward(self, user_id: int, mission_id: int, goal: int, reward_card: str):
+        """Marks a completed mission as claimed and grants its reward card, atomically and only once.
+
+        Returns True if the reward was granted by this call.
+        """
+        granted = await self.fetchval("claim_mission_reward", user_id, mission_id, goal, reward_card)
+        if granted:
+            self.invalidate([user_id], (CARDS, PROFILE))
+        return granted
+
+    async def get_leaderboard_stats(self):
+        """Fetches every leaderboard summary row (used to build standings at startup)."""
+        return await self.fetch("get_leaderboard_stats")
+
+    async def increment_leaderboard_stats(self, scopes: list, user_id: int, battles_won: int, cards_collected: int):
+        """Adds to a user's leaderboard summary rows for several scopes in one statement."""
+        await self.execute("increment_leaderboard_stats", scopes, user_id, battles_won, cards_collected)
+
+    async def get_recent_packs(self, limit: int):
+        """Fetches (id, user_id) of the most recently opened packs that still have cards."""
+        rows = await self.fetch("get_recent_packs", limit)
+        return [(row["id"], row["user_id"]) for row in reversed(rows)]
+
+    async def claim_card_from_pack(self, gambler_id: int, pack_id: int = None, opener_id: int = None):
+        """Atomically moves one random card out of a pack into the gambler's collection.
+
+        Targets a specific pack row by `pack_id`, or the latest pack of `opener_id`.
+        The pack row is locked with FOR UPDATE, so two gamblers can never take the
+        same card. Returns (pack_id, opener_id, card_id), or None if nothing was left.
+        """
+        if pack_id is not None:
+            row = await self.fetchrow("claim_card_from_pack", gambler_id, pack_id)
+        else:
+            row = await self.fetchrow("claim_card_from_opener", gambler_id, opener_id)
+        if not row:
+            return None
+        self.invalidate([gambler_id], (CARDS, PROFILE))
+        return row["id"], row["opener_id"], row["card_id"]
+
+    async def create_trade(self, proposer_id: int, target_id: int, offered: list, requested: list,
+                           ttl: float, guild_id: int = None, channel_id: int = None):
+        """Opens a trade and moves the proposer's offered cards into escrow, atomically.
+
+        Returns the new pending_trades row, or None if the proposer doesn't own every offered card.
+        """
+        async with self.transaction() as session:
+            if not await self._take_cards(session, proposer_id, offered):
+                return None
+            trade = await session.fetchrow(
+                "create_trade", proposer_id, target_id, offered, requested, guild_id, channel_id, ttl
             )
+        self.invalidate([proposer_id], (CARDS, PROFILE))
+        return trade
+
+    async def set_trade_message(self, trade_id: int, message_id: int):
+        """Records which Discord message carries a trade's accept/decline reactions."""
+        await self.execute("set_trade_message", trade_id, message_id)
+
+    async def get_pending_trades(self):
+        """Fetches every open trade (used to restore trades at startup)."""
+        return await self.fetch("get_pending_trades")
+
+    async def accept_trade(self, trade_id: int):
+        """Swaps the cards of a pending trade in one transaction.
+
+        The trade row and the target's cards are locked with FOR UPDATE, so a
+        trade completes at most once and the target can't spend a card twice.
+        Returns "accepted", "unavailable" if the target no longer owns the
+        requested cards (the trade stays open), or None if it's no longer pending.
+        """
+        async with self.transaction() as session:
+            trade = await session.fetchrow("lock_trade", trade_id)
+            if not trade:
+                return None
+            if not await self._take_cards(session, trade["target_id"], trade["requested"]):
+                return "unavailable"
+            offered, requested = trade["offered"], trade["requested"]
+            await session.execute(
+                "give_cards",
+                [trade["target_id"]] * len(offered) + [trade["proposer_id"]] * len(requested),
+                offered + requested,
+            )
+            await session.execute("complete_trade", trade_id)
+        self.invalidate([trade["proposer_id"], trade["target_id"]], (CARDS, PROFILE))
+        return "accepted"
+
+    async def cancel_trade(self, trade_id: int, status: str):
+        """Closes a pending trade as "declined" or "expired" and refunds the escrowed cards.
+
+        Returns True if this call closed the trade.
+        """
+        async with self.transaction() as session:
+            trade = await session.fetchrow("close_trade", trade_id, status)
+            if not trade:
+                return False
+            await session.execute("give_cards", [trade["proposer_id"]] * len(trade["offered"]), trade["offered"])
+        self.invalidate([trade["proposer_id"]], (CARDS, PROFILE))
+        return True
 
     async def get_last_opened_pack(self, user_id: int):
         """Retrieves the most recent opened pack, or an empty list if none exist."""
-        if not self.pool:
-            raise RuntimeError("❌ Database connection not established.")
+        cards = await self.fetchval("get_last_opened_pack", user_id)
+        return cards if cards is not None else []
 
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT cards FROM opened_packs WHERE user_id = $1 ORDER BY opened_at DESC LIMIT 1",
-                user_id
-            )
-            return json.loads(row["cards"]) if row else []
+
+# ✅ Every public query method reports its latency and failures (the generic runners are timed by their callers)
+instrument_methods(Database, exclude=("fetch", "fetchrow", "fetchval", "execute"))
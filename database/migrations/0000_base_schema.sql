@@ -0,0 +1,24 @@
+-- Tables the bot used before migrations existed. Older databases already have them;
+-- fresh ones get them here so every later migration starts from the same schema.
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS opened_packs (
+    user_id   TEXT        NOT NULL,
+    cards     JSONB       NOT NULL DEFAULT '[]',
+    opened_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- One row per Pokémon a trainer owns (read by !mypokemon).
+CREATE TABLE IF NOT EXISTS user_pokemon (
+    user_id      TEXT        NOT NULL,
+    pokemon_name TEXT        NOT NULL,
+    obtained_at  TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Legacy per-user mission blobs (progress now lives in mission_progress).
+CREATE TABLE IF NOT EXISTS user_missions (
+    user_id  TEXT  PRIMARY KEY,
+    missions JSONB NOT NULL DEFAULT '[]'
+);
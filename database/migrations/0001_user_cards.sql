@@ -0,0 +1,22 @@
+-- Row-per-card collection storage, replacing the user_collections.cards JSON blobs.
+CREATE TABLE IF NOT EXISTS user_cards (
+    user_id        TEXT        NOT NULL,
+    card_id        TEXT        NOT NULL,
+    quantity       INTEGER     NOT NULL DEFAULT 1 CHECK (quantity > 0),
+    first_obtained TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (user_id, card_id)
+);
+
+-- One-off copy of the legacy JSON collections (duplicates are counted).
+DO $$
+BEGIN
+    IF to_regclass('user_collections') IS NOT NULL
+       AND NOT EXISTS (SELECT 1 FROM user_cards) THEN
+        INSERT INTO user_cards (user_id, card_id, quantity)
+        SELECT uc.user_id::text, card.card_id, COUNT(*)
+        FROM user_collections uc
+        CROSS JOIN LATERAL jsonb_array_elements_text(uc.cards::jsonb) AS card(card_id)
+        GROUP BY uc.user_id, card.card_id
+        ON CONFLICT (user_id, card_id) DO NOTHING;
+    END IF;
+END $$;
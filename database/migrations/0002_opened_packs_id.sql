@@ -0,0 +1,9 @@
+-- Opened packs need a stable id so a single pack row can be targeted (WonderPick).
+CREATE TABLE IF NOT EXISTS opened_packs (
+    user_id   TEXT        NOT NULL,
+    cards     JSONB       NOT NULL DEFAULT '[]',
+    opened_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE opened_packs ADD COLUMN IF NOT EXISTS id BIGSERIAL;
+CREATE UNIQUE INDEX IF NOT EXISTS opened_packs_id_key ON opened_packs (id);
@@ -0,0 +1,16 @@
+-- Maintained leaderboard summary: one row per (scope, user), where scope is a guild id or 'global'.
+CREATE TABLE IF NOT EXISTS leaderboard_stats (
+    scope           TEXT    NOT NULL,
+    user_id         TEXT    NOT NULL,
+    battles_won     INTEGER NOT NULL DEFAULT 0,
+    cards_collected INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, user_id)
+);
+
+-- One-off backfill of global standings from existing collections.
+INSERT INTO leaderboard_stats (scope, user_id, cards_collected)
+SELECT 'global', user_id, SUM(quantity)
+FROM user_cards
+WHERE NOT EXISTS (SELECT 1 FROM leaderboard_stats)
+GROUP BY user_id
+ON CONFLICT (scope, user_id) DO NOTHING;
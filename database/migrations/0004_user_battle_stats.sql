@@ -0,0 +1,7 @@
+-- Battle records live on the users row (read by !profile).
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY
+);
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS wins   INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS losses INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,9 @@
+-- Normalized mission progress, flushed in batches by the mission engine.
+CREATE TABLE IF NOT EXISTS mission_progress (
+    user_id    TEXT        NOT NULL,
+    mission_id INTEGER     NOT NULL,
+    progress   INTEGER     NOT NULL DEFAULT 0,
+    claimed_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (user_id, mission_id)
+);
@@ -0,0 +1,20 @@
+-- Trades waiting for an answer. The proposer's offered cards are held here (escrow)
+-- until the trade is accepted, declined or expires.
+CREATE TABLE IF NOT EXISTS pending_trades (
+    id          BIGSERIAL   PRIMARY KEY,
+    proposer_id TEXT        NOT NULL,
+    target_id   TEXT        NOT NULL,
+    offered     TEXT[]      NOT NULL,  -- card ids, repeated once per copy
+    requested   TEXT[]      NOT NULL,
+    guild_id    BIGINT,
+    channel_id  BIGINT,
+    message_id  BIGINT,
+    status      TEXT        NOT NULL DEFAULT 'pending'
+                CHECK (status IN ('pending', 'accepted', 'declined', 'expired')),
+    created_at  TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at  TIMESTAMPTZ NOT NULL,
+    resolved_at TIMESTAMPTZ
+);
+
+-- Startup only reloads open trades
+CREATE INDEX IF NOT EXISTS pending_trades_open_idx ON pending_trades (expires_at) WHERE status = 'pending';
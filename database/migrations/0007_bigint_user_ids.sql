@@ -0,0 +1,32 @@
+-- Discord ids are 64-bit integers: store them as BIGINT instead of TEXT, and
+-- keep JSON documents as JSONB. Indexes and primary keys are rebuilt by ALTER TYPE.
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name, data_type FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND (table_name, column_name) IN (
+              ('users', 'user_id'), ('user_cards', 'user_id'), ('opened_packs', 'user_id'),
+              ('leaderboard_stats', 'user_id'), ('mission_progress', 'user_id'),
+              ('pending_trades', 'proposer_id'), ('pending_trades', 'target_id'),
+              ('user_pokemon', 'user_id'), ('user_missions', 'user_id'))
+          AND data_type <> 'bigint'
+    LOOP
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE BIGINT USING %I::bigint',
+                       col.table_name, col.column_name, col.column_name);
+    END LOOP;
+
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND (table_name, column_name) IN (('opened_packs', 'cards'), ('user_missions', 'missions'))
+          AND data_type <> 'jsonb'
+    LOOP
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I DROP DEFAULT', col.table_name, col.column_name);
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE JSONB USING %I::jsonb',
+                       col.table_name, col.column_name, col.column_name);
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I SET DEFAULT ''[]''', col.table_name, col.column_name);
+    END LOOP;
+END $$;
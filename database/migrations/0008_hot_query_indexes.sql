@@ -0,0 +1,11 @@
+-- Indexes for the hot per-user queries.
+
+-- get_last_opened_pack and WonderPick on a given opener: newest pack of one user
+CREATE INDEX IF NOT EXISTS opened_packs_user_recent_idx ON opened_packs (user_id, opened_at DESC);
+
+-- get_recent_packs (startup and global WonderPick): newest packs that still have cards
+CREATE INDEX IF NOT EXISTS opened_packs_recent_idx ON opened_packs (opened_at DESC)
+    WHERE jsonb_array_length(cards) > 0;
+
+-- !mypokemon and ownership checks by name
+CREATE INDEX IF NOT EXISTS user_pokemon_user_name_idx ON user_pokemon (user_id, pokemon_name);
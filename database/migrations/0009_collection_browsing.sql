@@ -0,0 +1,84 @@
+-- Collection browsing: each user_cards row carries its card's name and set, so a
+-- collection can be paged in name, set or date order straight from an index, and
+-- per-user totals are maintained in user_card_totals instead of counted on every read.
+
+-- Card names and sets mirrored from the local catalog (Database.sync_cards)
+CREATE TABLE IF NOT EXISTS cards (
+    card_id TEXT PRIMARY KEY,
+    name    TEXT NOT NULL,
+    set_id  TEXT
+);
+
+-- No collection writes may slip in between the backfills below and the triggers
+LOCK TABLE user_cards IN SHARE ROW EXCLUSIVE MODE;
+
+ALTER TABLE user_cards ADD COLUMN IF NOT EXISTS card_name TEXT;
+ALTER TABLE user_cards ADD COLUMN IF NOT EXISTS set_id    TEXT;
+-- Real names arrive with the first Database.sync_cards after the catalog loads
+UPDATE user_cards SET card_name = card_id, set_id = split_part(card_id, '-', 1) WHERE card_name IS NULL;
+ALTER TABLE user_cards ALTER COLUMN card_name SET NOT NULL;
+ALTER TABLE user_cards ALTER COLUMN set_id    SET NOT NULL;
+
+-- Unknown cards (not in the catalog yet) sort by their id until the next sync_cards
+CREATE OR REPLACE FUNCTION user_cards_fill_card() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    SELECT c.name, c.set_id INTO NEW.card_name, NEW.set_id FROM cards c WHERE c.card_id = NEW.card_id;
+    NEW.card_name := COALESCE(NEW.card_name, NEW.card_id);
+    NEW.set_id := COALESCE(NEW.set_id, split_part(NEW.card_id, '-', 1));
+    RETURN NEW;
+END $$;
+
+DROP TRIGGER IF EXISTS user_cards_fill_card ON user_cards;
+CREATE TRIGGER user_cards_fill_card BEFORE INSERT ON user_cards
+    FOR EACH ROW EXECUTE FUNCTION user_cards_fill_card();
+
+-- Maintained per-user totals (read by !profile and the collection browser)
+CREATE TABLE IF NOT EXISTS user_card_totals (
+    user_id      BIGINT PRIMARY KEY,
+    unique_cards INTEGER NOT NULL DEFAULT 0,
+    total_cards  BIGINT  NOT NULL DEFAULT 0
+);
+
+INSERT INTO user_card_totals (user_id, unique_cards, total_cards)
+SELECT user_id, COUNT(*), SUM(quantity) FROM user_cards GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE
+SET unique_cards = EXCLUDED.unique_cards, total_cards = EXCLUDED.total_cards;
+
+-- Statement-level, so a bulk upsert of thousands of cards is one aggregated totals write per user
+CREATE OR REPLACE FUNCTION user_card_totals_sync() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO user_card_totals AS t (user_id, unique_cards, total_cards)
+        SELECT user_id, COUNT(*), SUM(quantity) FROM new_rows GROUP BY user_id
+        ON CONFLICT (user_id) DO UPDATE
+        SET unique_cards = t.unique_cards + EXCLUDED.unique_cards, total_cards = t.total_cards + EXCLUDED.total_cards;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO user_card_totals AS t (user_id, unique_cards, total_cards)
+        SELECT n.user_id, 0, SUM(n.quantity - o.quantity)
+        FROM new_rows n JOIN old_rows o USING (user_id, card_id)
+        WHERE n.quantity <> o.quantity
+        GROUP BY n.user_id
+        ON CONFLICT (user_id) DO UPDATE SET total_cards = t.total_cards + EXCLUDED.total_cards;
+    ELSE
+        UPDATE user_card_totals t
+        SET unique_cards = t.unique_cards - gone.unique_cards, total_cards = t.total_cards - gone.total_cards
+        FROM (SELECT user_id, COUNT(*) AS unique_cards, SUM(quantity) AS total_cards FROM old_rows GROUP BY user_id) AS gone
+        WHERE t.user_id = gone.user_id;
+    END IF;
+    RETURN NULL;
+END $$;
+
+DROP TRIGGER IF EXISTS user_card_totals_insert ON user_cards;
+DROP TRIGGER IF EXISTS user_card_totals_update ON user_cards;
+DROP TRIGGER IF EXISTS user_card_totals_delete ON user_cards;
+CREATE TRIGGER user_card_totals_insert AFTER INSERT ON user_cards
+    REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION user_card_totals_sync();
+CREATE TRIGGER user_card_totals_update AFTER UPDATE ON user_cards
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION user_card_totals_sync();
+CREATE TRIGGER user_card_totals_delete AFTER DELETE ON user_cards
+    REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION user_card_totals_sync();
+
+-- Keyset pagination: one index per browse order (dates are read backwards, newest first)
+CREATE INDEX IF NOT EXISTS user_cards_by_name_idx ON user_cards (user_id, card_name, card_id);
+CREATE INDEX IF NOT EXISTS user_cards_by_set_idx  ON user_cards (user_id, set_id, card_id);
+CREATE INDEX IF NOT EXISTS user_cards_by_date_idx ON user_cards (user_id, first_obtained, card_id);
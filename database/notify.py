@@ -0,0 +1,133 @@
+import asyncio
+import inspect
+import json
+import uuid
+
+import asyncpg
+
+NOTIFY_CHANNEL = "tcg_bot_changes"
+MAX_PAYLOAD_BYTES = 7900  # Postgres rejects NOTIFY payloads of 8000 bytes or more
+RESYNC = "resync"  # Dispatched locally after the listener reconnects (messages may have been missed)
+
+
+class ChangeFeed:
+    """Cross-process cache invalidation over Postgres LISTEN/NOTIFY.
+
+    Every worker process keeps a dedicated listening connection. `publish()`
+    queues a message and everything published in the same loop iteration
+    goes out in one round trip; each worker ignores its own messages and
+    dispatches the rest to the handlers subscribed for that message kind.
+    """
+
+    def __init__(self, db, channel: str = NOTIFY_CHANNEL):
+        self.db = db
+        self.channel = channel
+        self.origin = uuid.uuid4().hex[:12]  # ✅ Tells our own notifications apart from other workers'
+        self._handlers = {}
+        self._conn = None
+        self._outbox = []
+        self._flush_task = None
+        self._reconnect_task = None
+        self._tasks = set()
+        self._closing = False
+        self.sent = 0
+        self.received = 0
+
+    @property
+    def active(self):
+        return self._conn is not None and not self._conn.is_closed()
+
+    def subscribe(self, kind: str, handler):
+        """Calls `handler(message)` for every `kind` message from another worker."""
+        self._handlers.setdefault(kind, []).append(handler)
+
+    async def start(self):
+        """Opens the listening connection."""
+        self._closing = False
+        self._conn = await asyncpg.connect(self.db.dsn)
+        await self._conn.add_listener(self.channel, self._on_notify)
+        self._conn.add_termination_listener(self._on_terminated)
+
+    def publish(self, kind: str, **data):
+        """Queues a message for every other worker (sent at the end of this loop iteration)."""
+        if not self.active:
+            return
+        self._outbox.append({"kind": kind, **data})
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    def _payloads(self, messages):
+        """Packs messages into as few NOTIFY payloads as fit the size limit."""
+        payloads, batch = [], []
+        for message in messages:
+            candidate = json.dumps({"origin": self.origin, "messages": batch + [message]}, separators=(",", ":"))
+            if batch and len(candidate.encode()) > MAX_PAYLOAD_BYTES:
+                payloads.append(json.dumps({"origin": self.origin, "messages": batch}, separators=(",", ":")))
+                batch = [message]
+            else:
+                batch.append(message)
+        if batch:
+            payloads.append(json.dumps({"origin": self.origin, "messages": batch}, separators=(",", ":")))
+        return payloads
+
+    async def _flush(self):
+        await asyncio.sleep(0)  # ✅ Let the rest of this iteration's publishes join the batch
+        messages, self._outbox, self._flush_task = self._outbox, [], None
+        try:
+            await self.db.execute("notify", self.channel, self._payloads(messages))
+            self.sent += len(messages)
+        except Exception as e:
+            print(f"⚠️ Failed to publish {len(messages)} change notification(s): {e}")
+
+    def _on_notify(self, conn, pid, channel, payload):
+        envelope = json.loads(payload)
+        if envelope["origin"] == self.origin:
+            return
+        for message in envelope["messages"]:
+            self.received += 1
+            self._dispatch(message)
+
+    def _dispatch(self, message):
+        for handler in self._handlers.get(message["kind"], ()):
+            try:
+                result = handler(message)
+            except Exception as e:
+                print(f"❌ Change handler for {message['kind']} failed: {e}")
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    def _on_terminated(self, conn):
+        if not self._closing and self._reconnect_task is None:
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self):
+        delay = 1
+        try:
+            while not self._closing:
+                try:
+                    await self.start()
+                    print("✅ Change feed reconnected.")
+                    self._dispatch({"kind": RESYNC})  # ✅ Anything could have changed while we weren't listening
+                    return
+                except (OSError, asyncpg.PostgresError) as e:
+                    print(f"⚠️ Change feed reconnect failed, retrying in {delay}s: {e}")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 60)
+        finally:
+            self._reconnect_task = None
+
+    async def close(self):
+        self._closing = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+        if self._flush_task:
+            await self._flush_task
+        if self._conn and not self._conn.is_closed():
+            await self._conn.close()
+        self._conn = None
+
+    def stats(self) -> dict:
+        return {"origin": self.origin, "active": self.active, "sent": self.sent, "received": self.received}
@@ -0,0 +1,224 @@
+"""Named SQL statements and the helpers that run them.
+
+Every query the bot sends lives in STATEMENTS under a name. Database methods
+and Sessions accept either a name or plain asyncpg-style SQL ($1, $2, ...).
+asyncpg prepares each statement once per connection on first use and reuses
+it from the connection's statement cache after that, so hot commands skip
+parsing and planning setup on the server.
+"""
+
+STATEMENTS = {
+    # Users
+    "get_user": "SELECT * FROM users WHERE user_id = $1",
+    "create_user": """
+        INSERT INTO users (user_id) VALUES ($1)
+        ON CONFLICT (user_id) DO UPDATE SET user_id = EXCLUDED.user_id
+        RETURNING *
+    """,
+    "get_user_missions": "SELECT missions FROM user_missions WHERE user_id = $1",
+    "get_user_pokemon": "SELECT pokemon_name FROM user_pokemon WHERE user_id = $1 ORDER BY pokemon_name",
+    "get_profile_stats": """
+        SELECT COALESCE(u.wins, 0) AS wins,
+               COALESCE(u.losses, 0) AS losses,
+               COALESCE(t.total_cards, 0) AS total_cards,
+               COALESCE(t.unique_cards, 0) AS unique_cards
+        FROM (SELECT $1::bigint AS user_id) AS me
+        LEFT JOIN users u ON u.user_id = me.user_id
+        LEFT JOIN user_card_totals t ON t.user_id = me.user_id
+    """,
+
+    # Collections
+    "get_cards": "SELECT card_id, quantity FROM user_cards WHERE user_id = $1",
+    "give_cards": """
+        INSERT INTO user_cards (user_id, card_id, quantity)
+        SELECT user_id, card_id, COUNT(*)
+        FROM unnest($1::bigint[], $2::text[]) AS new_cards(user_id, card_id)
+        GROUP BY user_id, card_id
+        ON CONFLICT (user_id, card_id)
+        DO UPDATE SET quantity = user_cards.quantity + EXCLUDED.quantity
+    """,
+    "lock_cards": """
+        SELECT card_id, quantity FROM user_cards
+        WHERE user_id = $1 AND card_id = ANY($2::text[])
+        ORDER BY card_id
+        FOR UPDATE
+    """,
+    # Rows that would drop to zero are deleted (quantity must stay positive)
+    "take_cards": """
+        WITH taken AS (
+            SELECT * FROM unnest($2::text[], $3::int[]) AS taken(card_id, amount)
+        ), emptied AS (
+            DELETE FROM user_cards u USING taken
+            WHERE u.user_id = $1 AND u.card_id = taken.card_id AND u.quantity = taken.amount
+        )
+        UPDATE user_cards u SET quantity = u.quantity - taken.amount
+        FROM taken
+        WHERE u.user_id = $1 AND u.card_id = taken.card_id AND u.quantity > taken.amount
+    """,
+    # Totals are kept up to date by triggers on user_cards (migration 0009)
+    "get_card_totals": "SELECT unique_cards, total_cards FROM user_card_totals WHERE user_id = $1",
+    # Mirrors catalog names and sets; only cards that actually changed rewrite their collection rows
+    "sync_cards": """
+        WITH changed AS (
+            INSERT INTO cards (card_id, name, set_id)
+            SELECT * FROM unnest($1::text[], $2::text[], $3::text[])
+            ON CONFLICT (card_id) DO UPDATE SET name = EXCLUDED.name, set_id = EXCLUDED.set_id
+            WHERE (cards.name, cards.set_id) IS DISTINCT FROM (EXCLUDED.name, EXCLUDED.set_id)
+            RETURNING card_id, name, set_id
+        ), renamed AS (
+            UPDATE user_cards u
+            SET card_name = changed.name, set_id = COALESCE(changed.set_id, split_part(u.card_id, '-', 1))
+            FROM changed WHERE u.card_id = changed.card_id
+        )
+        SELECT COUNT(*) FROM changed
+    """,
+
+    # Packs
+    "log_opened_pack": "INSERT INTO opened_packs (user_id, cards, opened_at) VALUES ($1, $2, NOW())",
+    "open_packs": """
+        WITH new_packs AS (
+            INSERT INTO opened_packs (user_id, cards, opened_at)
+            SELECT $1, pack.cards::jsonb, NOW()
+            FROM unnest($2::text[]) WITH ORDINALITY AS pack(cards, position)
+            ORDER BY pack.position
+            RETURNING id
+        ), new_cards AS (
+            INSERT INTO user_cards (user_id, card_id, quantity)
+            SELECT $1, card_id, COUNT(*)
+            FROM unnest($3::text[]) AS card_id
+            GROUP BY card_id
+            ON CONFLICT (user_id, card_id)
+            DO UPDATE SET quantity = user_cards.quantity + EXCLUDED.quantity
+        )
+        SELECT id FROM new_packs ORDER BY id
+    """,
+    "get_last_opened_pack": "SELECT cards FROM opened_packs WHERE user_id = $1 ORDER BY opened_at DESC LIMIT 1",
+    "get_recent_packs": """
+        SELECT id, user_id FROM opened_packs
+        WHERE jsonb_array_length(cards) > 0
+        ORDER BY opened_at DESC
+        LIMIT $1
+    """,
+
+    # Missions
+    "get_mission_progress": """
+        SELECT mission_id, progress, claimed_at IS NOT NULL AS claimed FROM mission_progress WHERE user_id = $1
+    """,
+    "increment_mission_progress": """
+        INSERT INTO mission_progress (user_id, mission_id, progress)
+        SELECT user_id, mission_id, delta
+        FROM unnest($1::bigint[], $2::int[], $3::int[]) AS batch(user_id, mission_id, delta)
+        ON CONFLICT (user_id, mission_id) DO UPDATE
+        SET progress = mission_progress.progress + EXCLUDED.progress, updated_at = NOW()
+    """,
+    "claim_mission_reward": """
+        WITH claimed AS (
+            UPDATE mission_progress SET claimed_at = NOW()
+            WHERE user_id = $1 AND mission_id = $2 AND progress >= $3 AND claimed_at IS NULL
+            RETURNING user_id
+        ), granted AS (
+            INSERT INTO user_cards (user_id, card_id, quantity)
+            SELECT user_id, $4, 1 FROM claimed
+            ON CONFLICT (user_id, card_id)
+            DO UPDATE SET quantity = user_cards.quantity + 1
+        )
+        SELECT EXISTS (SELECT 1 FROM claimed)
+    """,
+
+    # Leaderboards
+    "get_leaderboard_stats": "SELECT scope, user_id, battles_won, cards_collected FROM leaderboard_stats",
+    "increment_leaderboard_stats": """
+        INSERT INTO leaderboard_stats (scope, user_id, battles_won, cards_collected)
+        SELECT scope, $2, $3, $4 FROM unnest($1::text[]) AS scope
+        ON CONFLICT (scope, user_id) DO UPDATE
+        SET battles_won = leaderboard_stats.battles_won + EXCLUDED.battles_won,
+            cards_collected = leaderboard_stats.cards_collected + EXCLUDED.cards_collected
+    """,
+
+    # Trades
+    "create_trade": """
+        INSERT INTO pending_trades (proposer_id, target_id, offered, requested, guild_id, channel_id, expires_at)
+        VALUES ($1, $2, $3, $4, $5, $6, NOW() + make_interval(secs => $7))
+        RETURNING *
+    """,
+    "set_trade_message": "UPDATE pending_trades SET message_id = $2 WHERE id = $1",
+    "get_pending_trades": "SELECT * FROM pending_trades WHERE status = 'pending'",
+    "lock_trade": "SELECT * FROM pending_trades WHERE id = $1 AND status = 'pending' FOR UPDATE",
+    "complete_trade": "UPDATE pending_trades SET status = 'accepted', resolved_at = NOW() WHERE id = $1",
+    "close_trade": """
+        UPDATE pending_trades SET status = $2, resolved_at = NOW()
+        WHERE id = $1 AND status = 'pending'
+        RETURNING proposer_id, offered
+    """,
+
+    # Cross-worker change feed
+    "notify": "SELECT pg_notify($1, payload) FROM unnest($2::text[]) AS payload",
+}
+
+# WonderPick: one random card out of a pack, targeted by pack id or by the opener's latest pack
+_CLAIM_CARD_FROM_PACK = """
+    WITH target AS (
+        SELECT id, user_id, cards FROM opened_packs
+        WHERE {target} AND user_id <> $1 AND jsonb_array_length(cards) > 0
+        ORDER BY opened_at DESC
+        LIMIT 1
+        FOR UPDATE
+    ), pick AS (
+        SELECT id, user_id, cards, floor(random() * jsonb_array_length(cards))::int AS position
+        FROM target
+    ), claimed AS (
+        UPDATE opened_packs p SET cards = pick.cards - pick.position
+        FROM pick WHERE p.id = pick.id
+        RETURNING p.id, pick.user_id AS opener_id, pick.cards ->> pick.position AS card_id
+    ), granted AS (
+        INSERT INTO user_cards (user_id, card_id, quantity)
+        SELECT $1, card_id, 1 FROM claimed
+        ON CONFLICT (user_id, card_id)
+        DO UPDATE SET quantity = user_cards.quantity + 1
+    )
+    SELECT id, opener_id, card_id FROM claimed
+"""
+STATEMENTS["claim_card_from_pack"] = _CLAIM_CARD_FROM_PACK.format(target="id = $2")
+STATEMENTS["claim_card_from_opener"] = _CLAIM_CARD_FROM_PACK.format(target="user_id = $2")
+
+# Collection browsing: keyset pages over (sort key, card_id) after the cursor $2, $3, one index per order
+_BROWSE_CARDS = """
+    SELECT card_id, card_name, set_id, quantity, first_obtained FROM user_cards
+    WHERE user_id = $1 AND ({key}, card_id) {op} ($2, $3)
+    ORDER BY {key} {direction}, card_id {direction}
+    LIMIT $4
+"""
+STATEMENTS["browse_cards_by_name"] = _BROWSE_CARDS.format(key="card_name", op=">", direction="ASC")
+STATEMENTS["browse_cards_by_set"] = _BROWSE_CARDS.format(key="set_id", op=">", direction="ASC")
+STATEMENTS["browse_cards_by_date"] = _BROWSE_CARDS.format(key="first_obtained", op="<", direction="DESC")
+
+
+def resolve(query: str) -> str:
+    """Returns the SQL of a named statement, or `query` itself if it is already SQL."""
+    sql = STATEMENTS.get(query)
+    if sql is not None:
+        return sql
+    if "%s" in query:
+        raise ValueError("❌ asyncpg uses $1, $2, ... placeholders, not %s.")
+    return query
+
+
+class Session:
+    """One pooled connection, optionally inside a transaction (see `Database.transaction`)."""
+
+    __slots__ = ("conn",)
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def fetch(self, query: str, *args, timeout: float = None):
+        return await self.conn.fetch(resolve(query), *args, timeout=timeout)
+
+    async def fetchrow(self, query: str, *args, timeout: float = None):
+        return await self.conn.fetchrow(resolve(query), *args, timeout=timeout)
+
+    async def fetchval(self, query: str, *args, timeout: float = None):
+        return await self.conn.fetchval(resolve(query), *args, timeout=timeout)
+
+    async def execute(self, query: str, *args, timeout: float = None):
+        return await self.conn.execute(resolve(query), *args, timeout=timeout)
@@ -0,0 +1 @@
+from .bus import EventBus, Event, PACK_OPENED, CARD_OBTAINED, BATTLE_WON, TRADE_COMPLETED
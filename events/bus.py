@@ -0,0 +1,61 @@
+import asyncio
+import inspect
+
+# Event types emitted by the cogs
+PACK_OPENED = "pack_opened"
+CARD_OBTAINED = "card_obtained"
+BATTLE_WON = "battle_won"
+TRADE_COMPLETED = "trade_completed"
+
+
+class Event:
+    """Something a user did, as seen by the rest of the bot."""
+
+    __slots__ = ("type", "user_id", "guild_id", "count", "data")
+
+    def __init__(self, type, user_id, guild_id=None, count=1, data=None):
+        self.type = type
+        self.user_id = int(user_id)
+        self.guild_id = guild_id
+        self.count = count
+        self.data = data or {}
+
+
+class EventBus:
+    """In-process publish/subscribe for gameplay events.
+
+    Handlers are looked up by event type. Plain functions run inline during
+    `emit()`; coroutine handlers are scheduled as tasks so the emitting command
+    never waits on a subscriber.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._tasks = set()
+
+    def subscribe(self, event_type: str, handler):
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def emit(self, event_type: str, user_id, guild_id=None, count: int = 1, **data):
+        event = Event(event_type, user_id, guild_id, count, data)
+        for handler in self._handlers.get(event_type, ()):
+            try:
+                result = handler(event)
+            except Exception as e:
+                print(f"❌ Event handler {handler.__qualname__} failed for {event_type}: {e}")
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._task_done)
+        return event
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"❌ Event handler failed: {task.exception()}")
+
+    async def drain(self):
+        """Waits for every scheduled coroutine handler to finish (used at shutdown)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
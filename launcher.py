@@ -0,0 +1,125 @@
+import argparse
+import asyncio
+import os
+import signal
+import sys
+import time
+
+import aiohttp
+from dotenv import load_dotenv
+
+# ✅ Load environment variables
+load_dotenv()
+
+DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
+GATEWAY_URL = "https://discord.com/api/v10/gateway/bot"
+IDENTIFY_INTERVAL = 5  # Discord allows max_concurrency IDENTIFYs per 5 seconds
+MAX_RESTART_DELAY = 60
+STABLE_RUNTIME = 60  # A worker that ran this long has its restart backoff reset
+
+
+async def gateway_info(token: str):
+    """Asks Discord for the recommended shard count and IDENTIFY concurrency."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(GATEWAY_URL, headers={"Authorization": f"Bot {token}"}) as response:
+            response.raise_for_status()
+            body = await response.json()
+    return body["shards"], body["session_start_limit"]["max_concurrency"]
+
+
+def plan_shards(shard_count: int, workers: int):
+    """Splits shard ids 0..shard_count-1 into `workers` contiguous, near-equal ranges."""
+    workers = max(1, min(workers, shard_count))
+    base, extra = divmod(shard_count, workers)
+    ranges, start = [], 0
+    for worker_id in range(workers):
+        size = base + (1 if worker_id < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+
+class Launcher:
+    """Runs one `bot.py` process per shard range and restarts workers that exit."""
+
+    def __init__(self, shard_count: int, ranges, max_concurrency: int = 1):
+        self.shard_count = shard_count
+        self.ranges = ranges
+        self.max_concurrency = max_concurrency
+        self.processes = {}
+        self.stopping = False
+
+    def worker_env(self, worker_id: int, shard_ids):
+        env = dict(os.environ)
+        env.update({
+            "WORKER_ID": str(worker_id),
+            "SHARD_COUNT": str(self.shard_count),
+            "SHARD_IDS": ",".join(map(str, shard_ids)),
+        })
+        return env
+
+    async def run_worker(self, worker_id: int, shard_ids, start_delay: float):
+        await asyncio.sleep(start_delay)  # ✅ Stagger workers so their IDENTIFYs don't collide
+        restart_delay = 1
+        while not self.stopping:
+            started = time.monotonic()
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "bot.py"),
+                env=self.worker_env(worker_id, shard_ids),
+            )
+            self.processes[worker_id] = process
+            print(f"🚀 Worker {worker_id} started (pid {process.pid}, shards {shard_ids[0]}-{shard_ids[-1]}).")
+            code = await process.wait()
+            if self.stopping:
+                return
+            if time.monotonic() - started > STABLE_RUNTIME:
+                restart_delay = 1
+            print(f"⚠️ Worker {worker_id} exited with code {code}, restarting in {restart_delay}s.")
+            await asyncio.sleep(restart_delay)
+            restart_delay = min(restart_delay * 2, MAX_RESTART_DELAY)
+
+    def stop(self):
+        """Asks every worker to shut down cleanly (they flush pending writes on exit)."""
+        self.stopping = True
+        for process in self.processes.values():
+            if process.returncode is None:
+                process.send_signal(signal.SIGINT)
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stop)
+
+        tasks, shards_before = [], 0
+        for worker_id, shard_ids in enumerate(self.ranges):
+            delay = shards_before // self.max_concurrency * IDENTIFY_INTERVAL
+            tasks.append(self.run_worker(worker_id, shard_ids, delay))
+            shards_before += len(shard_ids)
+        await asyncio.gather(*tasks)
+        print("✅ All workers stopped.")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Run the bot as several sharded worker processes.")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WORKERS", os.cpu_count() or 1)))
+    parser.add_argument("--shards", type=int, default=int(os.getenv("SHARD_COUNT", "0")),
+                        help="Total shard count (default: Discord's recommendation)")
+    parser.add_argument("--dry-run", action="store_true", help="Print the shard plan and exit")
+    args = parser.parse_args()
+
+    max_concurrency = 1
+    shard_count = args.shards
+    if not shard_count:
+        if not DISCORD_TOKEN:
+            raise ValueError("❌ DISCORD_TOKEN is missing! Check your .env file.")
+        shard_count, max_concurrency = await gateway_info(DISCORD_TOKEN)
+
+    ranges = plan_shards(shard_count, args.workers)
+    print(f"🧩 {shard_count} shard(s) across {len(ranges)} worker(s): {[(r[0], r[-1]) for r in ranges]}")
+    if args.dry_run:
+        return
+    await Launcher(shard_count, ranges, max_concurrency).run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1 @@
+from .outbound import OutboundScheduler, REPLY, FOLLOWUP, COSMETIC
@@ -0,0 +1,173 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+
+# Priorities: lower values are sent first
+REPLY = 0  # Direct answers to a command
+FOLLOWUP = 1  # Extra messages/reactions a command needs to work (e.g. trade reactions)
+COSMETIC = 2  # Celebrations and other output that may be dropped under load
+
+MAX_EMBEDS_PER_MESSAGE = 10
+
+
+class _Outgoing:
+    __slots__ = ("kind", "target", "kwargs", "future", "enqueued_at", "priority")
+
+    def __init__(self, kind, target, kwargs, future, priority):
+        self.kind = kind  # "send" or "react"
+        self.target = target
+        self.kwargs = kwargs
+        self.future = future
+        self.priority = priority
+        self.enqueued_at = time.monotonic()
+
+    @property
+    def mergeable(self):
+        """Embed-only follow-ups can share a message (Discord allows up to 10 embeds)."""
+        return (
+            self.kind == "send" and self.priority != REPLY
+            and set(self.kwargs) <= {"embed", "embeds"}
+        )
+
+    def embeds(self):
+        return self.kwargs.get("embeds") or [self.kwargs["embed"]]
+
+
+class _ChannelQueue:
+    __slots__ = ("heap", "worker", "pending_reactions")
+
+    def __init__(self):
+        self.heap = []
+        self.worker = None
+        self.pending_reactions = set()  # (message_id, emoji) already queued
+
+
+class OutboundScheduler:
+    """Central per-channel queue for outgoing messages and reactions.
+
+    Each channel gets its own priority queue drained by one worker, so a
+    burst of commands no longer has every cog racing for the same Discord
+    rate-limit bucket. Command replies jump ahead of cosmetic output, duplicate
+    reactions are merged, celebration reactions are dropped once a channel is
+    backed up, and embed-only follow-ups are batched into one message.
+    """
+
+    def __init__(self, cosmetic_drop_depth: int = 5, max_inflight: int = 40, wait_samples: int = 1000):
+        self.cosmetic_drop_depth = cosmetic_drop_depth
+        self._channels = {}
+        self._sequence = itertools.count()
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._waits = deque(maxlen=wait_samples)
+        self.sent = 0
+        self.merged = 0
+        self.dropped = 0
+
+    @staticmethod
+    def _channel_id(target):
+        channel = getattr(target, "channel", target)
+        return getattr(channel, "id", id(channel))
+
+    def _enqueue(self, channel_id, item):
+        queue = self._channels.setdefault(channel_id, _ChannelQueue())
+        heapq.heappush(queue.heap, (item.priority, next(self._sequence), item))
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(self._drain(channel_id, queue))
+
+    async def send(self, destination, content=None, *, priority: int = REPLY, **kwargs):
+        """Queues a message for `destination` (a Context, channel or user) and returns the sent Message."""
+        if content is not None:
+            kwargs["content"] = content
+        future = asyncio.get_running_loop().create_future()
+        self._enqueue(self._channel_id(destination), _Outgoing("send", destination, kwargs, future, priority))
+        return await future
+
+    def react(self, message, emoji, priority: int = COSMETIC):
+        """Queues a reaction without waiting for it; duplicates and overflow are dropped."""
+        channel_id = self._channel_id(message)
+        queue = self._channels.get(channel_id)
+        key = (message.id, str(emoji))
+        if queue is not None:
+            if key in queue.pending_reactions:
+                self.merged += 1
+                return
+            if priority == COSMETIC and len(queue.heap) >= self.cosmetic_drop_depth:
+                self.dropped += 1  # ✅ The channel is backed up, skip the decoration
+                return
+        self._enqueue(channel_id, _Outgoing("react", message, {"emoji": emoji}, None, priority))
+        self._channels[channel_id].pending_reactions.add(key)
+
+    async def _drain(self, channel_id, queue):
+        while queue.heap:
+            _, _, item = heapq.heappop(queue.heap)
+            batch = [item]
+            if item.mergeable:
+                batch = self._collect_batch(queue, item)
+
+            now = time.monotonic()
+            for queued in batch:
+                self._waits.append(now - queued.enqueued_at)
+
+            async with self._inflight:
+                await self._deliver(queue, batch)
+
+        if self._channels.get(channel_id) is queue and not queue.heap:
+            del self._channels[channel_id]
+
+    def _collect_batch(self, queue, first):
+        """Pulls further embed-only follow-ups for the same destination into one message."""
+        batch, embeds = [first], len(first.embeds())
+        while queue.heap:
+            _, _, candidate = queue.heap[0]
+            if (not candidate.mergeable or candidate.target is not first.target
+                    or embeds + len(candidate.embeds()) > MAX_EMBEDS_PER_MESSAGE):
+                break
+            heapq.heappop(queue.heap)
+            batch.append(candidate)
+            embeds += len(candidate.embeds())
+        self.merged += len(batch) - 1
+        return batch
+
+    async def _deliver(self, queue, batch):
+        item = batch[0]
+        try:
+            if item.kind == "react":
+                queue.pending_reactions.discard((item.target.id, str(item.kwargs["emoji"])))
+                await item.target.add_reaction(item.kwargs["emoji"])
+                result = None
+            elif len(batch) > 1:
+                result = await item.target.send(embeds=[e for queued in batch for e in queued.embeds()])
+            else:
+                result = await item.target.send(**item.kwargs)
+            self.sent += 1
+        except Exception as e:
+            if item.kind == "react":
+                return  # Cosmetic: a failed reaction isn't worth surfacing
+            for queued in batch:
+                if not queued.future.done():
+                    queued.future.set_exception(e)
+            return
+
+        for queued in batch:
+            if queued.future is not None and not queued.future.done():
+                queued.future.set_result(result)
+
+    def stats(self):
+        """Queue depth and wait-time figures for monitoring reply latency."""
+        waits = sorted(self._waits)
+
+        def percentile(p):
+            return waits[min(len(waits) - 1, int(p * len(waits)))] if waits else 0.0
+
+        return {
+            "channels": len(self._channels),
+            "depth": sum(len(queue.heap) for queue in self._channels.values()),
+            "max_channel_depth": max((len(queue.heap) for queue in self._channels.values()), default=0),
+            "wait_p50": percentile(0.50),
+            "wait_p95": percentile(0.95),
+            "wait_max": waits[-1] if waits else 0.0,
+            "sent": self.sent,
+            "merged": self.merged,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,7 @@
+from .registry import Registry, Counter, Histogram, Gauge, REGISTRY
+from .instrument import (
+    COMMAND_SECONDS, COMMAND_ERRORS, DB_SECONDS, DB_ERRORS, HTTP_SECONDS, HTTP_ERRORS,
+    instrument_methods, http_trace_config, install_command_hooks,
+)
+from .server import MetricsServer
+from .watchdog import LoopWatchdog, Stall
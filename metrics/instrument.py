@@ -0,0 +1,93 @@
+import asyncio
+import functools
+import inspect
+import re
+import time
+
+import aiohttp
+
+from .registry import REGISTRY
+
+COMMAND_SECONDS = REGISTRY.histogram("tcgbot_command_seconds", "Command latency by command.", ("command",))
+COMMAND_ERRORS = REGISTRY.counter("tcgbot_command_errors_total", "Commands that raised, by command.", ("command",))
+DB_SECONDS = REGISTRY.histogram("tcgbot_db_seconds", "Database method latency by method.", ("method",))
+DB_ERRORS = REGISTRY.counter("tcgbot_db_errors_total", "Database methods that raised, by method.", ("method",))
+HTTP_SECONDS = REGISTRY.histogram("tcgbot_http_seconds", "Outbound HTTP latency (to response headers) by endpoint.",
+                                  ("service", "endpoint"))
+HTTP_ERRORS = REGISTRY.counter("tcgbot_http_errors_total", "Outbound HTTP failures, 429s and 5xx by endpoint.",
+                               ("service", "endpoint"))
+
+_VERSION_SEGMENT = re.compile(r"^(api|v\d+)$")
+
+ACTIVE_COMMANDS = {}  # task -> name of the command it is running (read by the stall watchdog)
+
+
+def instrument_methods(cls, histogram=DB_SECONDS, errors=DB_ERRORS, exclude=()):
+    """Wraps every public coroutine method of `cls` (except `exclude`) so its latency and failures are recorded."""
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("_") and name not in exclude and inspect.iscoroutinefunction(method):
+            setattr(cls, name, _timed(method, name, histogram, errors))
+    return cls
+
+
+def _timed(method, label, histogram, errors):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        except Exception:
+            errors.inc(label)
+            raise
+        finally:
+            histogram.observe(time.perf_counter() - started, label)
+    return wrapper
+
+
+def _endpoint(url, depth: int):
+    """Collapses a URL to a low-cardinality label, e.g. /v2/cards/base1-4 -> /cards."""
+    segments = [segment for segment in url.path.split("/") if segment and not _VERSION_SEGMENT.match(segment)]
+    return "/" + "/".join(segments[:depth])
+
+
+def http_trace_config(service: str, depth: int = 1):
+    """An aiohttp TraceConfig that times every request a session makes."""
+    trace = aiohttp.TraceConfig()
+
+    async def on_request_start(session, context, params):
+        context.started = time.perf_counter()
+
+    async def on_request_end(session, context, params):
+        endpoint = _endpoint(params.url, depth)
+        HTTP_SECONDS.observe(time.perf_counter() - context.started, service, endpoint)
+        if params.response.status == 429 or params.response.status >= 500:
+            HTTP_ERRORS.inc(service, endpoint)
+
+    async def on_request_exception(session, context, params):
+        endpoint = _endpoint(params.url, depth)
+        HTTP_SECONDS.observe(time.perf_counter() - context.started, service, endpoint)
+        HTTP_ERRORS.inc(service, endpoint)
+
+    trace.on_request_start.append(on_request_start)
+    trace.on_request_end.append(on_request_end)
+    trace.on_request_exception.append(on_request_exception)
+    return trace
+
+
+def install_command_hooks(bot):
+    """Times every command with the bot's global before/after invoke hooks."""
+    @bot.before_invoke
+    async def start_command_timer(ctx):
+        ctx.metrics_started = time.perf_counter()
+        ACTIVE_COMMANDS[asyncio.current_task()] = ctx.command.qualified_name
+
+    @bot.after_invoke
+    async def record_command_time(ctx):
+        ACTIVE_COMMANDS.pop(asyncio.current_task(), None)
+        started = getattr(ctx, "metrics_started", None)
+        if started is None:
+            return
+        name = ctx.command.qualified_name
+        COMMAND_SECONDS.observe(time.perf_counter() - started, name)
+        if ctx.command_failed:
+            COMMAND_ERRORS.inc(name)
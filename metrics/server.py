@@ -0,0 +1,31 @@
+from aiohttp import web
+
+from .registry import REGISTRY
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsServer:
+    """Serves the registry at /metrics in the Prometheus text format."""
+
+    def __init__(self, registry=REGISTRY, host: str = "127.0.0.1", port: int = 9100):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._runner = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/metrics", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        print(f"✅ Metrics served on http://{self.host}:{self.port}/metrics")
+
+    async def handle(self, request):
+        return web.Response(body=self.registry.render().encode(), headers={"Content-Type": CONTENT_TYPE})
+
+    async def close(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
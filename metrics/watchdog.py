@@ -0,0 +1,109 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+from .instrument import ACTIVE_COMMANDS
+from .registry import REGISTRY
+
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "tcgbot_loop_lag_seconds", "How late the event loop ran the watchdog heartbeat.",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+LOOP_STALLS = REGISTRY.counter("tcgbot_loop_stalls_total", "Event loop stalls longer than the threshold.")
+
+
+class Stall:
+    """One event loop stall: what was running when the watchdog noticed it."""
+
+    __slots__ = ("at", "lag", "duration", "command", "task", "stack")
+
+    def __init__(self, at, lag, command, task, stack):
+        self.at = at  # Wall-clock time the stall was detected
+        self.lag = lag  # How long the loop had been blocked at detection
+        self.duration = None  # Total blocked time, filled in once the loop recovers
+        self.command = command
+        self.task = task
+        self.stack = stack
+
+
+class LoopWatchdog:
+    """Detects event loop stalls from a separate thread and records the blocking stack.
+
+    A heartbeat coroutine stamps the time every `interval` seconds. The
+    watchdog thread checks the stamp; once it is more than `threshold`
+    seconds old the loop is stuck in synchronous code, so the thread grabs
+    the loop thread's current Python stack and the command being run and
+    keeps it in a bounded ring buffer.
+    """
+
+    def __init__(self, threshold: float = 0.25, interval: float = 0.05, capacity: int = 50):
+        self.threshold = threshold
+        self.interval = interval
+        self.stalls = deque(maxlen=capacity)
+        self._loop = None
+        self._loop_thread_id = None
+        self._last_beat = 0.0
+        self._open_stall = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._heartbeat_task = None
+
+    def start(self):
+        """Starts watching the running loop (call from inside it)."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            LOOP_LAG_SECONDS.observe(max(0.0, now - self._last_beat - self.interval))
+            stall = self._open_stall
+            if stall is not None:
+                stall.duration = now - self._last_beat - self.interval
+                self._open_stall = None
+            self._last_beat = now
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            lag = time.monotonic() - self._last_beat - self.interval
+            if lag > self.threshold and self._open_stall is None:
+                self._capture(lag)
+
+    def _capture(self, lag):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        task = asyncio.current_task(self._loop)  # ✅ Only a dict read, safe from this thread
+        stall = Stall(
+            at=time.time(),
+            lag=lag,
+            command=ACTIVE_COMMANDS.get(task),
+            task=task.get_name() if task else None,
+            stack="".join(traceback.format_stack(frame)) if frame else "",
+        )
+        self._open_stall = stall
+        self.stalls.append(stall)
+        LOOP_STALLS.inc()
+
+    def recent(self, limit: int = None):
+        """The most recent stalls, newest first."""
+        stalls = list(self.stalls)[::-1]
+        return stalls[:limit] if limit else stalls
+
+    def stop(self):
+        self._stop.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
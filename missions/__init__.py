@@ -0,0 +1,2 @@
+from .definitions import MissionDefinition, MISSIONS
+from .engine import MissionEngine, MissionStatus
@@ -0,0 +1,25 @@
+from events import PACK_OPENED, CARD_OBTAINED, BATTLE_WON, TRADE_COMPLETED
+
+
+class MissionDefinition:
+    """A mission: reach `goal` occurrences of `event_type` to earn `reward_card`."""
+
+    __slots__ = ("id", "name", "description", "event_type", "goal", "reward_card")
+
+    def __init__(self, id, name, description, event_type, goal, reward_card):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.event_type = event_type
+        self.goal = goal
+        self.reward_card = reward_card
+
+
+# ✅ Mission ids are what players type in `!claim`, never renumber them
+MISSIONS = [
+    MissionDefinition(1, "Pack Rookie", "Open 5 packs.", PACK_OPENED, 5, "base1-58"),
+    MissionDefinition(2, "Collector", "Obtain 50 cards.", CARD_OBTAINED, 50, "base1-15"),
+    MissionDefinition(3, "First Victory", "Win a battle.", BATTLE_WON, 1, "base1-2"),
+    MissionDefinition(4, "Battle Veteran", "Win 25 battles.", BATTLE_WON, 25, "base1-4"),
+    MissionDefinition(5, "Trader", "Complete 3 trades.", TRADE_COMPLETED, 3, "base1-10"),
+]
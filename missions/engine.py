@@ -0,0 +1,138 @@
+import asyncio
+import contextlib
+
+import config
+from .definitions import MISSIONS
+
+
+class MissionStatus:
+    """A user's progress on one mission."""
+
+    __slots__ = ("mission", "progress", "claimed")
+
+    def __init__(self, mission, progress, claimed):
+        self.mission = mission
+        self.progress = min(progress, mission.goal)
+        self.claimed = claimed
+
+    @property
+    def completed(self):
+        return self.progress >= self.mission.goal
+
+
+class MissionEngine:
+    """Advances mission progress from gameplay events with batched write-behind.
+
+    Events are matched to missions through an index by event type and the
+    increments are accumulated in memory. They are flushed to
+    `mission_progress` in one statement every `flush_interval` seconds (or
+    sooner once `flush_threshold` rows are pending), and on shutdown.
+    """
+
+    def __init__(self, db, missions=MISSIONS, flush_interval: float = config.MISSION_FLUSH_INTERVAL,
+                 flush_threshold: int = config.MISSION_FLUSH_THRESHOLD):
+        self.db = db
+        self.missions = {mission.id: mission for mission in missions}
+        self.by_event = {}
+        for mission in missions:
+            self.by_event.setdefault(mission.event_type, []).append(mission)
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.pending = {}  # (user_id, mission_id) -> progress not yet written
+        self._inflight = {}  # The batch being written right now (still counted by statuses())
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = None
+
+    def subscribe(self, bus):
+        """Listens for every event type a mission depends on."""
+        for event_type in self.by_event:
+            bus.subscribe(event_type, self.on_event)
+
+    def on_event(self, event):
+        for mission in self.by_event.get(event.type, ()):
+            key = (event.user_id, mission.id)
+            self.pending[key] = self.pending.get(key, 0) + event.count
+        if len(self.pending) >= self.flush_threshold:
+            return self.flush()  # ✅ The bus runs this as a background task
+
+    def start(self):
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"⚠️ Mission progress flush failed, will retry: {e}")
+
+    async def flush(self, user_id: int = None):
+        """Writes pending progress (for everyone, or one user) in a single statement."""
+        async with self._flush_lock:
+            if user_id is None:
+                batch, self.pending = self.pending, {}
+            else:
+                batch = {key: self.pending.pop(key) for key in list(self.pending) if key[0] == user_id}
+            if not batch:
+                return
+
+            keys = list(batch)
+            self._inflight = batch
+            try:
+                await self.db.increment_mission_progress(
+                    [user for user, _ in keys],
+                    [mission_id for _, mission_id in keys],
+                    [batch[key] for key in keys],
+                )
+            except BaseException:
+                # ✅ Put the increments back so nothing is lost if the write fails or is cancelled
+                for key, delta in batch.items():
+                    self.pending[key] = self.pending.get(key, 0) + delta
+                raise
+            finally:
+                self._inflight = {}
+
+    async def statuses(self, user_id: int):
+        """Returns a MissionStatus for every mission, including unflushed progress.
+
+        Best effort, without taking the flush lock: a batch whose write commits after the query
+        read the table but before we look at memory is briefly missing from both, so progress
+        can under-report until the next call. It never over-reports, which would show missions
+        as complete that `claim` then refuses.
+        """
+        stored = await self.db.get_mission_progress(user_id)
+        # ✅ Memory is read after the query, so a batch still being written is counted once
+        pending = {}
+        for source in (self.pending, self._inflight):
+            for (user, mission_id), delta in source.items():
+                if user == user_id:
+                    pending[mission_id] = pending.get(mission_id, 0) + delta
+        return [
+            MissionStatus(
+                mission,
+                stored.get(mission.id, (0, False))[0] + pending.get(mission.id, 0),
+                stored.get(mission.id, (0, False))[1],
+            )
+            for mission in self.missions.values()
+        ]
+
+    async def claim(self, user_id: int, mission_id: int):
+        """Atomically grants a completed mission's reward card once.
+
+        Returns the reward card id, or None if the mission isn't complete or was already claimed.
+        """
+        mission = self.missions[mission_id]
+        await self.flush(user_id)
+        granted = await self.db.claim_mission_reward(user_id, mission_id, mission.goal, mission.reward_card)
+        return mission.reward_card if granted else None
+
+    async def close(self):
+        """Stops the flush loop and writes everything still pending."""
+        if self._flush_task:
+            async with self._flush_lock:  # ✅ Never cancel a flush half-way through its write
+                self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
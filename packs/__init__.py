@@ -0,0 +1,4 @@
+from .generator import AliasSampler, PackGenerator
+from .pipeline import OpenedPack, PackOpener, MAX_PACKS_PER_OPEN
+from .recent import RecentPacks
+from .templates import PackTemplate, PACK_TEMPLATES, rarity_tier
@@ -0,0 +1,148 @@
+import numpy as np
+
+from .templates import PACK_TEMPLATES, DEFAULT_TEMPLATE, SET_TEMPLATES, TIERS, rarity_tier
+
+
+class AliasSampler:
+    """O(1) weighted sampler built with Vose's alias method."""
+
+    __slots__ = ("prob", "alias", "values")
+
+    def __init__(self, weights, values):
+        weights = np.asarray(weights, dtype=np.float64)
+        n = len(weights)
+        scaled = weights * (n / weights.sum())
+        prob = np.zeros(n, dtype=np.float64)
+        alias = np.zeros(n, dtype=np.int64)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        for i in small + large:  # ✅ Leftovers are 1.0 up to float rounding
+            prob[i] = 1.0
+
+        self.prob = prob
+        self.alias = alias
+        self.values = np.asarray(values, dtype=np.int64)
+
+    def sample(self, rng: np.random.Generator, size: int):
+        """Draws `size` values at once."""
+        column = rng.integers(0, len(self.prob), size=size)
+        accept = rng.random(size) < self.prob[column]
+        return self.values[np.where(accept, column, self.alias[column])]
+
+
+class PackGenerator:
+    """Generates booster packs from the card catalog using per-set alias tables.
+
+    Samplers for every (set, slot) pair are precomputed whenever the catalog
+    (re)loads, so a single pack is a handful of O(1) draws and `generate_bulk`
+    produces thousands of packs in one vectorized call. Pass a `seed` to get a
+    reproducible stream of packs.
+    """
+
+    def __init__(self, catalog, seed=None):
+        self.catalog = catalog
+        self.rng = np.random.default_rng(seed)
+        self.cards = ()
+        self.tier_codes = np.zeros(0, dtype=np.int8)
+        self.samplers = {}  # set_id -> [AliasSampler per slot]
+        self.set_ids = []
+        self._catalog_version = None
+
+    def template_for(self, set_id: str):
+        return PACK_TEMPLATES[SET_TEMPLATES.get(set_id, DEFAULT_TEMPLATE)]
+
+    def rebuild(self):
+        """Precomputes alias tables for every set that can fill its pack template."""
+        self.cards = tuple(self.catalog.where())
+        tiers = [rarity_tier(card.rarity) for card in self.cards]
+        self.tier_codes = np.array([TIERS.index(t) if t else -1 for t in tiers], dtype=np.int8)
+
+        by_set_tier = {}
+        for index, (card, tier) in enumerate(zip(self.cards, tiers)):
+            if tier:
+                by_set_tier.setdefault(card.set_id, {}).setdefault(tier, []).append(index)
+
+        self.samplers = {}
+        for set_id, tier_cards in by_set_tier.items():
+            slot_samplers = []
+            for slot in self.template_for(set_id).slots:
+                values, weights = [], []
+                for tier, tier_weight in slot.items():
+                    members = tier_cards.get(tier, ())
+                    # ✅ Split the tier's odds evenly across its cards so tier odds match the template
+                    values.extend(members)
+                    weights.extend([tier_weight / len(members)] * len(members) if members else [])
+                if not values:
+                    break  # This set can't fill the slot (e.g. no rares), so it doesn't get packs
+                slot_samplers.append(AliasSampler(weights, values))
+            else:
+                self.samplers[set_id] = slot_samplers
+
+        self.set_ids = sorted(self.samplers)
+        self._catalog_version = self.catalog.version
+
+    def ensure_current(self):
+        """Rebuilds the samplers if the catalog changed since the last build."""
+        if self._catalog_version != self.catalog.version:
+            self.rebuild()
+
+    def generate(self, set_id: str = None):
+        """Generates one pack (a list of CatalogCards) from a set, or a random set."""
+        self.ensure_current()
+        if not self.set_ids:
+            return []
+        if set_id is None:
+            set_id = self.set_ids[self.rng.integers(len(self.set_ids))]
+        samplers = self.samplers.get(set_id)
+        if not samplers:
+            return []
+        return [self.cards[sampler.sample(self.rng, 1)[0]] for sampler in samplers]
+
+    def generate_bulk(self, count: int, set_id: str = None):
+        """Generates `count` packs at once as a (count, cards_per_pack) array of card indices.
+
+        Without a `set_id` each pack comes from a uniformly chosen set. Indices
+        refer to `self.cards`; use `cards_for()` to turn a row back into cards.
+        """
+        self.ensure_current()
+        if set_id is not None:
+            if set_id not in self.samplers:
+                raise ValueError(f"Set {set_id} can't fill its pack template.")
+            return np.column_stack([s.sample(self.rng, count) for s in self.samplers[set_id]])
+        if not self.set_ids:
+            return np.zeros((0, 0), dtype=np.int64)
+
+        pack_sets = self.rng.integers(len(self.set_ids), size=count)
+        width = max(len(samplers) for samplers in self.samplers.values())
+        packs = np.full((count, width), -1, dtype=np.int64)
+        for set_index in np.unique(pack_sets):
+            rows = np.flatnonzero(pack_sets == set_index)
+            for slot, sampler in enumerate(self.samplers[self.set_ids[set_index]]):
+                packs[rows, slot] = sampler.sample(self.rng, len(rows))
+        return packs
+
+    def cards_for(self, row):
+        """Converts one row of `generate_bulk` output into CatalogCards."""
+        return [self.cards[index] for index in row if index >= 0]
+
+    def tier_frequencies(self, packs):
+        """Observed tier frequency per slot for `generate_bulk` output.
+
+        Returns one {tier: share} dict per slot, ready to compare against the
+        configured template odds in drop-rate checks.
+        """
+        frequencies = []
+        for slot in range(packs.shape[1]):
+            column = packs[:, slot]
+            codes = self.tier_codes[column[column >= 0]]
+            counts = np.bincount(codes, minlength=len(TIERS))
+            total = counts.sum()
+            frequencies.append({tier: float(counts[i] / total) for i, tier in enumerate(TIERS) if counts[i]})
+        return frequencies
@@ -0,0 +1,50 @@
+MAX_PACKS_PER_OPEN = 10
+
+
+class OpenedPack:
+    """A generated pack and the `opened_packs` row it was logged as."""
+
+    __slots__ = ("id", "user_id", "cards")
+
+    def __init__(self, id, user_id, cards):
+        self.id = id
+        self.user_id = user_id
+        self.cards = cards  # [CatalogCard, ...]
+
+    @property
+    def card_ids(self):
+        return [card.id for card in self.cards]
+
+
+class PackOpener:
+    """Generates packs and persists them in a single database round trip.
+
+    All cards of all packs and every `opened_packs` row are written by one
+    statement, so opening ten packs costs the same number of round trips as one.
+    """
+
+    def __init__(self, generator, db, recent=None):
+        self.generator = generator
+        self.db = db
+        self.recent = recent  # ✅ RecentPacks ring fed for global WonderPick
+
+    def generate(self, count: int):
+        """Generates the cards for `count` packs."""
+        if count == 1:
+            return [self.generator.generate()]
+        return [self.generator.cards_for(row) for row in self.generator.generate_bulk(count)]
+
+    async def open(self, user_id, count: int = 1):
+        """Opens `count` packs for a user, returning the OpenedPacks (empty if the catalog isn't ready)."""
+        if not 1 <= count <= MAX_PACKS_PER_OPEN:
+            raise ValueError(f"You can open between 1 and {MAX_PACKS_PER_OPEN} packs at once.")
+
+        generated = self.generate(count)
+        if len(generated) != count or not all(generated):
+            return []
+
+        pack_ids = await self.db.open_packs(user_id, [[card.id for card in cards] for cards in generated])
+        if self.recent is not None:
+            for pack_id in pack_ids:
+                self.recent.add(pack_id, user_id)
+        return [OpenedPack(pack_id, user_id, cards) for pack_id, cards in zip(pack_ids, generated)]
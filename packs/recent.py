@@ -0,0 +1,32 @@
+import random
+from collections import deque
+
+
+class RecentPacks:
+    """Bounded ring of recently opened packs for global WonderPick.
+
+    Only (pack_id, opener_id) pairs are kept; the cards themselves stay in
+    `opened_packs` and are claimed atomically from there.
+    """
+
+    def __init__(self, maxlen: int = 500):
+        self._ring = deque(maxlen=maxlen)
+
+    def __len__(self):
+        return len(self._ring)
+
+    def add(self, pack_id, opener_id):
+        self._ring.append((pack_id, int(opener_id)))
+
+    def discard(self, pack_id):
+        """Forgets a pack once it has no cards left to claim."""
+        try:
+            self._ring.remove(next(entry for entry in self._ring if entry[0] == pack_id))
+        except StopIteration:
+            pass
+
+    def candidates(self, exclude_user, limit: int = 3):
+        """Returns up to `limit` random recent packs that weren't opened by `exclude_user`."""
+        exclude_user = int(exclude_user)
+        packs = [entry for entry in self._ring if entry[1] != exclude_user]
+        return random.sample(packs, min(limit, len(packs)))
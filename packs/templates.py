@@ -0,0 +1,65 @@
+# Rarity tiers used by pack templates. Every catalog rarity maps onto one tier.
+COMMON = "common"
+UNCOMMON = "uncommon"
+RARE = "rare"
+HOLO = "holo"
+ULTRA = "ultra"
+
+TIERS = (COMMON, UNCOMMON, RARE, HOLO, ULTRA)
+
+# Rarities that are never pulled from booster packs
+EXCLUDED_RARITIES = {"Promo"}
+
+
+def rarity_tier(rarity):
+    """Maps a Pokémon TCG API rarity string onto a pack tier (None if not in packs)."""
+    if rarity in EXCLUDED_RARITIES:
+        return None
+    if rarity in (None, "Common"):
+        return COMMON
+    if rarity == "Uncommon":
+        return UNCOMMON
+    if rarity == "Rare":
+        return RARE
+    if rarity == "Rare Holo":
+        return HOLO
+    return ULTRA  # ✅ EX/GX/V/VMAX, secret, illustration and every other special rare
+
+
+class PackTemplate:
+    """Describes a booster pack as a list of slots, each with tier odds."""
+
+    def __init__(self, name: str, slots: list):
+        self.name = name
+        self.slots = slots  # [{tier: weight, ...}, ...] one entry per card in the pack
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __repr__(self):
+        return f"<PackTemplate {self.name} ({len(self.slots)} cards)>"
+
+
+# ✅ 4 commons/uncommons + 1 rare slot with holo and ultra-rare upgrade odds
+STANDARD_PACK = PackTemplate("standard", [
+    {COMMON: 3, UNCOMMON: 1},
+    {COMMON: 3, UNCOMMON: 1},
+    {COMMON: 3, UNCOMMON: 1},
+    {COMMON: 3, UNCOMMON: 1},
+    {RARE: 75, HOLO: 20, ULTRA: 5},
+])
+
+# ✅ Event drop: better odds in the rare slot
+PREMIUM_PACK = PackTemplate("premium", [
+    {COMMON: 1, UNCOMMON: 1},
+    {COMMON: 1, UNCOMMON: 1},
+    {COMMON: 1, UNCOMMON: 1},
+    {UNCOMMON: 1},
+    {RARE: 40, HOLO: 40, ULTRA: 20},
+])
+
+PACK_TEMPLATES = {template.name: template for template in (STANDARD_PACK, PREMIUM_PACK)}
+DEFAULT_TEMPLATE = STANDARD_PACK.name
+
+# Per-set overrides: set_id -> template name
+SET_TEMPLATES = {}
@@ -0,0 +1,2 @@
+from .service import RankingService, Standing, GLOBAL_SCOPE
+from .tree import OrderStatisticTree
@@ -0,0 +1,112 @@
+from events import BATTLE_WON, CARD_OBTAINED
+from .tree import OrderStatisticTree
+
+GLOBAL_SCOPE = "global"
+
+
+class Standing:
+    """A trainer's position on one leaderboard."""
+
+    __slots__ = ("rank", "user_id", "battles_won", "cards_collected")
+
+    def __init__(self, rank, user_id, battles_won, cards_collected):
+        self.rank = rank
+        self.user_id = user_id
+        self.battles_won = battles_won
+        self.cards_collected = cards_collected
+
+
+class RankingService:
+    """Keeps per-guild and global standings current as battles and pulls happen.
+
+    Standings are loaded once from the `leaderboard_stats` summary table and
+    then maintained in memory in one order-statistic tree per scope, so pages
+    and "my rank" are O(log n) reads. Every change is also upserted into the
+    summary table so a restart picks up where we left off.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.trees = {}  # scope -> OrderStatisticTree of sort keys
+        self.stats = {}  # (scope, user_id) -> (battles_won, cards_collected)
+        self.feed = None
+
+    @staticmethod
+    def _key(user_id, battles_won, cards_collected):
+        # ✅ Most battles won first, then most cards collected, then a stable tie-break
+        return (-battles_won, -cards_collected, user_id)
+
+    def _apply(self, scope, user_id, battles_won=0, cards_collected=0):
+        tree = self.trees.setdefault(scope, OrderStatisticTree())
+        old = self.stats.get((scope, user_id))
+        if old:
+            tree.remove(self._key(user_id, *old))
+            battles_won += old[0]
+            cards_collected += old[1]
+        self.stats[(scope, user_id)] = (battles_won, cards_collected)
+        tree.insert(self._key(user_id, battles_won, cards_collected))
+
+    async def load(self):
+        """Builds the in-memory standings from the summary table."""
+        rows = await self.db.get_leaderboard_stats()
+        keys = {}
+        self.stats = {}
+        for row in rows:
+            scope, user_id = row["scope"], row["user_id"]
+            self.stats[(scope, user_id)] = (row["battles_won"], row["cards_collected"])
+            keys.setdefault(scope, []).append(self._key(user_id, row["battles_won"], row["cards_collected"]))
+        self.trees = {scope: OrderStatisticTree(scope_keys) for scope, scope_keys in keys.items()}
+        print(f"✅ Leaderboards loaded: {len(self.trees)} scope(s), {len(rows)} standing(s).")
+
+    def _record(self, guild_id, user_id, battles_won=0, cards_collected=0):
+        """Updates the in-memory standings now and returns the coroutine that persists them."""
+        scopes = [GLOBAL_SCOPE] + ([str(guild_id)] if guild_id else [])
+        for scope in scopes:
+            self._apply(scope, user_id, battles_won, cards_collected)
+        if self.feed:
+            self.feed.publish("ranking", scopes=scopes, user_id=user_id,
+                              battles_won=battles_won, cards_collected=cards_collected)
+        return self.db.increment_leaderboard_stats(scopes, user_id, battles_won, cards_collected)
+
+    async def record(self, guild_id, user_id, battles_won: int = 0, cards_collected: int = 0):
+        """Adds wins and/or cards to a user's guild and global standings."""
+        await self._record(guild_id, user_id, battles_won, cards_collected)
+
+    def connect_feed(self, feed):
+        """Shares standings deltas with other worker processes (each applies them in memory only)."""
+        self.feed = feed
+        feed.subscribe("ranking", self._on_remote_delta)
+        feed.subscribe("resync", lambda message: self.load())
+
+    def _on_remote_delta(self, message):
+        for scope in message["scopes"]:
+            self._apply(scope, message["user_id"], message["battles_won"], message["cards_collected"])
+
+    def subscribe(self, bus):
+        """Keeps standings current from battle and collection events."""
+        bus.subscribe(BATTLE_WON, lambda event: self._record(event.guild_id, event.user_id, battles_won=event.count))
+        bus.subscribe(CARD_OBTAINED, lambda event: self._record(event.guild_id, event.user_id, cards_collected=event.count))
+
+    def page(self, scope, page: int, per_page: int = 10):
+        """Returns the Standings on a 1-based page of a leaderboard."""
+        tree = self.trees.get(str(scope))
+        if not tree:
+            return []
+        start = (page - 1) * per_page
+        return [
+            Standing(start + offset + 1, key[2], -key[0], -key[1])
+            for offset, key in enumerate(tree.slice(start, start + per_page))
+        ]
+
+    def standing(self, scope, user_id):
+        """Returns a user's Standing on a leaderboard, or None if they aren't on it."""
+        scope, user_id = str(scope), int(user_id)
+        stats = self.stats.get((scope, user_id))
+        if not stats:
+            return None
+        rank = self.trees[scope].rank(self._key(user_id, *stats)) + 1
+        return Standing(rank, user_id, *stats)
+
+    def size(self, scope):
+        tree = self.trees.get(str(scope))
+        return len(tree) if tree else 0
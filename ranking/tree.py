@@ -0,0 +1,117 @@
+import random
+
+
+class _Node:
+    __slots__ = ("key", "priority", "size", "left", "right")
+
+    def __init__(self, key):
+        self.key = key
+        self.priority = random.random()
+        self.size = 1
+        self.left = None
+        self.right = None
+
+
+def _size(node):
+    return node.size if node else 0
+
+
+def _update(node):
+    node.size = 1 + _size(node.left) + _size(node.right)
+    return node
+
+
+def _split(node, key):
+    """Splits a treap into (< key, >= key)."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        return _update(node), right
+    left, node.left = _split(node.left, key)
+    return left, _update(node)
+
+
+def _merge(left, right):
+    if left is None or right is None:
+        return left or right
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return _update(left)
+    right.left = _merge(left, right.left)
+    return _update(right)
+
+
+class OrderStatisticTree:
+    """Sorted set of unique keys with O(log n) insert, remove, rank and select.
+
+    Implemented as a treap whose nodes track their subtree size.
+    """
+
+    def __init__(self, keys=()):
+        self._root = None
+        for key in sorted(keys):
+            self._root = _merge(self._root, _Node(key))
+
+    def __len__(self):
+        return _size(self._root)
+
+    def insert(self, key):
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key)), right)
+
+    def remove(self, key):
+        """Removes `key` if present."""
+        left, right = _split(self._root, key)
+        # ✅ The smallest key of `right` is `key` itself when it's in the tree
+        node, parent = right, None
+        while node and node.left:
+            parent, node = node, node.left
+        if node is not None and node.key == key:
+            if parent is None:
+                right = node.right
+            else:
+                parent.left = node.right
+                # Fix subtree sizes along the left spine
+                right = self._resize_left_spine(right)
+        self._root = _merge(left, right)
+
+    @staticmethod
+    def _resize_left_spine(root):
+        spine, node = [], root
+        while node:
+            spine.append(node)
+            node = node.left
+        for node in reversed(spine):
+            _update(node)
+        return root
+
+    def rank(self, key):
+        """Number of keys strictly smaller than `key` (0-based position of `key`)."""
+        node, rank = self._root, 0
+        while node:
+            if node.key < key:
+                rank += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def select(self, index):
+        """Returns the key at 0-based position `index`."""
+        if not 0 <= index < len(self):
+            raise IndexError("OrderStatisticTree index out of range")
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.key
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def slice(self, start, stop):
+        """Returns the keys at positions [start, stop) in order."""
+        return [self.select(i) for i in range(max(start, 0), min(stop, len(self)))]
@@ -0,0 +1,2 @@
+from .image_cache import ImageCache
+from .pack_image import PackRenderer, compose_grid
@@ -0,0 +1,182 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import aiohttp
+
+import config
+from metrics import http_trace_config
+from utils import SingleFlight
+
+INDEX_SAVE_DELAY = 2.0  # Seconds of downloads batched into one URL index write
+
+
+class ImageCache:
+    """Content-addressed, size-bounded on-disk cache of downloaded card images.
+
+    Image bytes are stored under the SHA-256 of their content, so identical
+    images are kept once however many URLs point at them. A small URL index
+    maps URLs to digests, and the least recently used objects are evicted once
+    the cache grows past `max_bytes`.
+    """
+
+    def __init__(self, directory: str = config.IMAGE_CACHE_DIR,
+                 max_bytes: int = config.IMAGE_CACHE_MAX_BYTES, max_concurrency: int = 8):
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, "objects")
+        self.index_path = os.path.join(directory, "index.json")
+        self.max_bytes = max_bytes
+        self.urls = {}  # url -> digest
+        self.objects = OrderedDict()  # digest -> size, least recently used first
+        self.total_bytes = 0
+        self._session = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._downloads = SingleFlight()
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._dirty = False
+        self._save_task = None
+        self._save_lock = asyncio.Lock()  # ✅ One index writer at a time
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest)
+
+    def _load(self):
+        """Reads the objects and URL index from disk (runs in a thread; the caller assigns the result)."""
+        os.makedirs(self.objects_dir, exist_ok=True)
+        entries = []
+        for digest in os.listdir(self.objects_dir):
+            stat = os.stat(self._object_path(digest))
+            entries.append((stat.st_mtime, digest, stat.st_size))
+        objects = OrderedDict((digest, size) for _, digest, size in sorted(entries))
+
+        urls = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as handle:
+                urls = {url: digest for url, digest in json.load(handle).items() if digest in objects}
+        return objects, sum(objects.values()), urls
+
+    async def _ensure_loaded(self):
+        async with self._load_lock:  # ✅ Concurrent first calls wait for one load instead of each running it
+            if not self._loaded:
+                self.objects, self.total_bytes, self.urls = await asyncio.to_thread(self._load)
+                self._loaded = True
+
+    def _write_object(self, digest, data):
+        with open(self._object_path(digest), "wb") as handle:
+            handle.write(data)
+
+    def _remove_objects(self, evicted):
+        for digest in evicted:
+            try:
+                os.remove(self._object_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def _write_index(self, urls):
+        # ✅ Unique tmp file, so a rename can never race another writer's
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.directory,
+                                         prefix="index.", suffix=".tmp", delete=False) as handle:
+            json.dump(urls, handle)
+        try:
+            os.replace(handle.name, self.index_path)
+        except OSError:
+            os.remove(handle.name)
+            raise
+
+    async def save(self):
+        """Rewrites the URL index if anything changed since the last save."""
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                await asyncio.to_thread(self._write_index, dict(self.urls))
+            except (OSError, asyncio.CancelledError) as e:
+                self._dirty = True  # ✅ Retried with the next batch (or by close())
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+
+    def _schedule_save(self):
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self):
+        await asyncio.sleep(INDEX_SAVE_DELAY)
+        await self.save()
+
+    def _evict(self):
+        """Drops least recently used objects until the cache fits, returning their digests."""
+        evicted = []
+        while self.total_bytes > self.max_bytes and len(self.objects) > 1:
+            digest, size = self.objects.popitem(last=False)
+            self.total_bytes -= size
+            evicted.append(digest)
+        if evicted:
+            gone = set(evicted)
+            self.urls = {url: digest for url, digest in self.urls.items() if digest not in gone}
+        return evicted
+
+    def _read(self, digest):
+        path = self._object_path(digest)
+        with open(path, "rb") as handle:
+            data = handle.read()
+        os.utime(path)  # ✅ mtime doubles as the LRU order after a restart
+        return data
+
+    async def get(self, url: str):
+        """Returns the image bytes for a URL, downloading it only on a cache miss."""
+        if not self._loaded:
+            await self._ensure_loaded()
+
+        digest = self.urls.get(url)
+        if digest in self.objects:
+            self.objects.move_to_end(digest)
+            try:
+                return await asyncio.to_thread(self._read, digest)
+            except FileNotFoundError:
+                # ✅ Deleted behind our back: forget it so the accounting stays right, then re-download
+                self.total_bytes -= self.objects.pop(digest, 0)
+                self.urls.pop(url, None)
+
+        return await self._downloads.do(url, lambda: self._download(url))
+
+    async def _download(self, url):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=30), trace_configs=[http_trace_config("images", depth=0)]
+            )
+        async with self._semaphore:
+            async with self._session.get(url) as response:
+                response.raise_for_status()
+                data = await response.read()
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest not in self.objects:
+            await asyncio.to_thread(self._write_object, digest, data)
+            self.objects[digest] = len(data)
+            self.total_bytes += len(data)
+        self.urls[url] = digest
+        evicted = self._evict()
+        if evicted:
+            await asyncio.to_thread(self._remove_objects, evicted)
+        self._schedule_save()  # ✅ The index on disk is a hint; objects missing from disk are dropped on load
+        return data
+
+    async def close(self):
+        """Writes the pending URL index and closes the HTTP session."""
+        if self._save_task:
+            self._save_task.cancel()
+            try:
+                await self._save_task
+            except asyncio.CancelledError:
+                pass
+            self._save_task = None
+        await self.save()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
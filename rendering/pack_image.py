@@ -0,0 +1,75 @@
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+import config
+from .image_cache import ImageCache
+
+CARD_WIDTH = 245
+CARD_HEIGHT = 342
+PADDING = 8
+MAX_COLUMNS = 5
+
+
+def compose_grid(images: list, columns: int = MAX_COLUMNS) -> bytes:
+    """Lays card images out in a grid and returns it as PNG bytes.
+
+    Runs in a worker process, so it only takes and returns plain bytes.
+    """
+    from PIL import Image  # ✅ Imported in the worker, keeps Pillow off the bot's startup path
+
+    columns = max(1, min(columns, len(images)))
+    rows = -(-len(images) // columns)
+    canvas = Image.new(
+        "RGBA",
+        (columns * (CARD_WIDTH + PADDING) + PADDING, rows * (CARD_HEIGHT + PADDING) + PADDING),
+        (0, 0, 0, 0),
+    )
+    for position, data in enumerate(images):
+        if data is None:
+            continue
+        with Image.open(io.BytesIO(data)) as card:
+            card = card.convert("RGBA").resize((CARD_WIDTH, CARD_HEIGHT))
+            x = PADDING + (position % columns) * (CARD_WIDTH + PADDING)
+            y = PADDING + (position // columns) * (CARD_HEIGHT + PADDING)
+            canvas.paste(card, (x, y), card)
+
+    output = io.BytesIO()
+    canvas.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+class PackRenderer:
+    """Renders a pack's cards into one composite image off the event loop."""
+
+    def __init__(self, cache: ImageCache = None, workers: int = config.RENDER_WORKERS):
+        self.cache = cache or ImageCache()
+        self.workers = workers
+        self._executor = None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def _fetch(self, url):
+        try:
+            return await self.cache.get(url)
+        except Exception:
+            return None  # ✅ A missing image leaves a gap instead of failing the pack
+
+    async def render(self, cards, columns: int = MAX_COLUMNS):
+        """Returns PNG bytes for a grid of the cards' images, or None if none could be fetched."""
+        urls = [card.image_small for card in cards if card.image_small]
+        images = await asyncio.gather(*(self._fetch(url) for url in urls))
+        if not any(images):
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, compose_grid, images, columns)
+
+    async def close(self):
+        await self.cache.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
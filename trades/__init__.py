@@ -0,0 +1 @@
+from .engine import TradeEngine, PendingTrade, ACCEPTED, UNAVAILABLE
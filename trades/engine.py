@@ -0,0 +1,136 @@
+from datetime import datetime, timezone
+
+import config
+from events import TRADE_COMPLETED
+
+# Results of TradeEngine.accept()
+ACCEPTED = "accepted"
+UNAVAILABLE = "unavailable"  # The target no longer owns the requested cards
+
+EXPIRY_RETRY_DELAY = 30  # Seconds before retrying an expiry the database rejected
+
+
+class PendingTrade:
+    """An open trade offer, mirrored from the `pending_trades` table."""
+
+    __slots__ = ("id", "proposer_id", "target_id", "offered", "requested",
+                 "guild_id", "channel_id", "message_id", "expires_at", "timer")
+
+    def __init__(self, id, proposer_id, target_id, offered, requested, guild_id, channel_id, message_id, expires_at):
+        self.id = id
+        self.proposer_id = proposer_id
+        self.target_id = target_id
+        self.offered = offered
+        self.requested = requested
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.expires_at = expires_at
+        self.timer = None
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            row["id"], row["proposer_id"], row["target_id"], list(row["offered"]), list(row["requested"]),
+            row["guild_id"], row["channel_id"], row["message_id"], row["expires_at"],
+        )
+
+
+class TradeEngine:
+    """Escrowed card trades with O(1) reaction dispatch and wheel-based expiry.
+
+    Proposing a trade moves the offered cards into escrow in the database.
+    Open trades are indexed by their Discord message id, so a reaction is
+    matched to its trade with one dict lookup, and every expiry is a timer on
+    the shared TimerWheel instead of a parked `wait_for` per trade. Open
+    trades are reloaded from `pending_trades` at startup.
+    """
+
+    def __init__(self, db, events, timers, ttl: float = config.TRADE_TIMEOUT):
+        self.db = db
+        self.events = events
+        self.timers = timers
+        self.ttl = ttl
+        self.by_id = {}
+        self.by_message = {}  # message_id -> PendingTrade
+        self.on_expired = None  # Optional coroutine function called with each expired trade
+
+    def __len__(self):
+        return len(self.by_id)
+
+    async def load(self, owns_guild=None):
+        """Restores open trades (and their expiry timers) after a restart.
+
+        With several worker processes, `owns_guild(guild_id)` limits this to
+        trades from guilds on this process's shards.
+        """
+        restored = 0
+        for row in await self.db.get_pending_trades():
+            if owns_guild is None or owns_guild(row["guild_id"]):
+                self._track(PendingTrade.from_row(row))
+                restored += 1
+        print(f"✅ Restored {restored} pending trade(s).")
+
+    def _track(self, trade):
+        self.by_id[trade.id] = trade
+        if trade.message_id is not None:
+            self.by_message[trade.message_id] = trade
+        delay = (trade.expires_at - datetime.now(timezone.utc)).total_seconds()
+        trade.timer = self.timers.schedule(delay, self._expire, trade.id)
+
+    def _untrack(self, trade):
+        self.by_id.pop(trade.id, None)
+        if trade.message_id is not None:
+            self.by_message.pop(trade.message_id, None)
+        self.timers.cancel(trade.timer)
+
+    def for_message(self, message_id: int):
+        """The open trade whose offer is `message_id`, if any."""
+        return self.by_message.get(message_id)
+
+    async def propose(self, proposer_id: int, target_id: int, offered: list, requested: list,
+                      guild_id: int = None, channel_id: int = None):
+        """Opens a trade, escrowing the offered cards. Returns None if the proposer lacks any of them."""
+        row = await self.db.create_trade(proposer_id, target_id, offered, requested, self.ttl, guild_id, channel_id)
+        if row is None:
+            return None
+        trade = PendingTrade.from_row(row)
+        self._track(trade)
+        return trade
+
+    async def attach(self, trade, message_id: int):
+        """Links a trade to the message players react on."""
+        trade.message_id = message_id
+        if trade.id in self.by_id:
+            self.by_message[message_id] = trade
+        await self.db.set_trade_message(trade.id, message_id)
+
+    async def accept(self, trade):
+        """Completes a trade. Returns ACCEPTED, UNAVAILABLE, or None if it was already closed."""
+        result = await self.db.accept_trade(trade.id)
+        if result != UNAVAILABLE:
+            self._untrack(trade)
+        if result == ACCEPTED:
+            self.events.emit(TRADE_COMPLETED, trade.proposer_id, trade.guild_id)
+            self.events.emit(TRADE_COMPLETED, trade.target_id, trade.guild_id)
+        return result
+
+    async def decline(self, trade):
+        """Closes a trade and refunds the proposer. Returns False if it was already closed."""
+        declined = await self.db.cancel_trade(trade.id, "declined")
+        self._untrack(trade)  # ✅ Only once the refund is written; on failure the expiry timer still covers it
+        return declined
+
+    async def _expire(self, trade_id: int):
+        trade = self.by_id.get(trade_id)
+        if trade is None:
+            return
+        try:
+            expired = await self.db.cancel_trade(trade.id, "expired")
+        except Exception as e:
+            print(f"⚠️ Failed to expire trade {trade.id}, will retry: {e}")
+            trade.timer = self.timers.schedule(EXPIRY_RETRY_DELAY, self._expire, trade.id)
+            return
+        self._untrack(trade)
+        if expired and self.on_expired:
+            await self.on_expired(trade)
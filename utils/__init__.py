@@ -0,0 +1,3 @@
+from .singleflight import SingleFlight
+from .ttl_cache import TTLCache
+from .timer_wheel import TimerWheel
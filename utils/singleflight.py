@@ -0,0 +1,29 @@
+import asyncio
+
+
+class SingleFlight:
+    """Merges concurrent calls for the same key into a single in-flight task.
+
+    The first caller for a key starts the work; everyone else who asks for the
+    same key while it is running awaits the same result instead of repeating it.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+
+    def __len__(self):
+        return len(self._inflight)
+
+    def _forget(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def do(self, key, factory):
+        """Runs `factory()` for `key` unless a call for `key` is already running."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # ✅ shield() so one cancelled waiter doesn't cancel the shared request
+        return await asyncio.shield(task)
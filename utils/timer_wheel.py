@@ -0,0 +1,89 @@
+import asyncio
+import inspect
+import itertools
+import math
+
+
+class TimerWheel:
+    """Hashed timing wheel: one background task fires every scheduled timeout.
+
+    Timers are bucketed by the tick they expire on, so scheduling and
+    cancelling are O(1) and each tick only looks at its own bucket, no matter
+    how many timers are pending. Expiry is accurate to one `tick`.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 512):
+        self.tick = tick
+        self._slots = [{} for _ in range(slots)]  # handle -> [rounds, callback, args]
+        self._where = {}  # handle -> slot index
+        self._cursor = 0
+        self._handles = itertools.count(1)
+        self._task = None
+        self._tasks = set()
+
+    def __len__(self):
+        return len(self._where)
+
+    def schedule(self, delay: float, callback, *args):
+        """Calls `callback(*args)` after roughly `delay` seconds; returns a handle for `cancel()`."""
+        ticks = max(1, math.ceil(delay / self.tick))
+        slot = (self._cursor + ticks) % len(self._slots)
+        handle = next(self._handles)
+        self._slots[slot][handle] = [(ticks - 1) // len(self._slots), callback, args]
+        self._where[handle] = slot
+        return handle
+
+    def cancel(self, handle) -> bool:
+        slot = self._where.pop(handle, None)
+        if slot is None:
+            return False
+        del self._slots[slot][handle]
+        return True
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += self.tick
+            await asyncio.sleep(max(0.0, deadline - loop.time()))  # ✅ Deadline-based, so ticks don't drift
+            self._advance()
+
+    def _advance(self):
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        bucket = self._slots[self._cursor]
+        due = []
+        for handle, timer in bucket.items():
+            if timer[0]:
+                timer[0] -= 1
+            else:
+                due.append(handle)
+        for handle in due:
+            _, callback, args = bucket.pop(handle)
+            del self._where[handle]
+            try:
+                result = callback(*args)
+            except Exception as e:
+                print(f"❌ Timer callback {callback.__qualname__} failed: {e}")
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._task_done)
+
+    def _task_done(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"❌ Timer callback failed: {task.exception()}")
+
+    async def close(self):
+        """Stops ticking; pending timers are dropped."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for bucket in self._slots:
+            bucket.clear()
+        self._where.clear()